@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Offline geocoder built from Athens-Clarke County address points
+Answers most geocoding requests locally: exact address points first, then
+interpolation between neighboring house numbers on the same street side.
+Nominatim is only needed when the local index misses.
+
+Usage:
+    python address_points.py <source>    # Build index from CSV, GeoJSON or an ArcGIS layer URL
+    python address_points.py --stats     # Show what is in the local index
+
+The source can be a county address point export (CSV with number/street/
+lat/lon columns, or GeoJSON points) or the query URL of an ArcGIS address
+point layer (paged automatically).
+"""
+
+import os
+import sys
+import csv
+import json
+import pickle
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from atomic_file import atomic_write
+from street_index_lookup import normalize_street_name, extract_address_parts
+
+
+# Location of the built index (relative to the project root, like data/street_index.json)
+ADDRESS_POINTS_FILE = "data/address_points.pkl"
+
+# Only interpolate between house numbers at most this far apart
+MAX_INTERPOLATION_GAP = 200
+
+# Column names tried (case-insensitive) when reading county exports
+NUMBER_FIELDS = ['ADDRNUM', 'ADD_NUMBER', 'ADDRESS_NUMBER', 'HOUSE_NUM', 'HOUSENUM', 'ST_NUM', 'STNUM']
+STREET_FIELDS = ['FULLNAME', 'FULL_STREET', 'STREET_NAME', 'STREETNAME', 'ST_NAME', 'STREET']
+FULL_ADDRESS_FIELDS = ['FULLADDR', 'FULL_ADDRESS', 'SITE_ADDRESS', 'SITEADDR', 'ADDRESS']
+LAT_FIELDS = ['LAT', 'LATITUDE', 'POINT_Y', 'Y']
+LON_FIELDS = ['LON', 'LONG', 'LONGITUDE', 'POINT_X', 'X']
+
+# Records per page when downloading from an ArcGIS layer
+ARCGIS_PAGE_SIZE = 2000
+
+
+def _pick(record: Dict, candidates: List[str]):
+    """First non-empty value among candidate field names (case-insensitive)"""
+    upper = {key.upper(): value for key, value in record.items()}
+    for name in candidates:
+        value = upper.get(name)
+        if value not in (None, ''):
+            return value
+    return None
+
+
+def _parse_point(record: Dict, lat=None, lon=None) -> Optional[Tuple[int, str, float, float]]:
+    """
+    Turn one source record into (house number, street key, lat, lon)
+
+    Returns:
+        Tuple, or None if the record lacks a usable number, street or location
+    """
+    number = _pick(record, NUMBER_FIELDS)
+    street = _pick(record, STREET_FIELDS)
+
+    if number is None or street is None:
+        full_address = _pick(record, FULL_ADDRESS_FIELDS)
+        if full_address is None:
+            return None
+        number, street = extract_address_parts(str(full_address))
+
+    lat = lat if lat is not None else _pick(record, LAT_FIELDS)
+    lon = lon if lon is not None else _pick(record, LON_FIELDS)
+
+    try:
+        number = int(str(number).strip())
+        lat, lon = float(lat), float(lon)
+    except (TypeError, ValueError):
+        return None
+
+    street_key = normalize_street_name(str(street))
+    if not street_key:
+        return None
+
+    return (number, street_key, lat, lon)
+
+
+def _read_csv(path: str) -> List[Tuple]:
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        return [point for point in map(_parse_point, csv.DictReader(f)) if point]
+
+
+def _read_geojson(path: str) -> List[Tuple]:
+    with open(path, 'r') as f:
+        data = json.load(f)
+
+    points = []
+    for feature in data.get('features', []):
+        geometry = feature.get('geometry') or {}
+        lon, lat = (geometry.get('coordinates') or [None, None])[:2]
+        point = _parse_point(feature.get('properties') or {}, lat=lat, lon=lon)
+        if point:
+            points.append(point)
+    return points
+
+
+def _read_arcgis(url: str) -> List[Tuple]:
+    """Page through an ArcGIS address point layer"""
+    from http_client import query_all_pages
+
+    if not url.rstrip('/').endswith('/query'):
+        url = url.rstrip('/') + '/query'
+
+    params = {
+        'where': '1=1',
+        'outFields': '*',
+        'returnGeometry': 'true',
+        'outSR': '4326',
+        'f': 'json'
+    }
+    features = query_all_pages(url, params, page_size=ARCGIS_PAGE_SIZE, timeout=60, progress="address points")
+
+    points = []
+    for feature in features:
+        geometry = feature.get('geometry') or {}
+        point = _parse_point(feature.get('attributes') or {}, lat=geometry.get('y'), lon=geometry.get('x'))
+        if point:
+            points.append(point)
+    return points
+
+
+class AddressPointIndex:
+    """
+    House-number index over address points, grouped by street
+
+    Each street holds parallel arrays sorted by house number, so a lookup
+    is a dictionary hit plus a binary search.
+    """
+
+    def __init__(self, streets: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]]):
+        self.streets = streets
+
+    def __len__(self) -> int:
+        return sum(len(numbers) for numbers, _, _ in self.streets.values())
+
+    @classmethod
+    def from_points(cls, points: List[Tuple[int, str, float, float]]) -> 'AddressPointIndex':
+        """
+        Build the index from (house number, street key, lat, lon) tuples
+
+        Duplicate addresses (e.g. several units at one number) are averaged.
+        """
+        grouped = {}
+        for number, street_key, lat, lon in points:
+            grouped.setdefault(street_key, {}).setdefault(number, []).append((lat, lon))
+
+        streets = {}
+        for street_key, by_number in grouped.items():
+            numbers = sorted(by_number)
+            coords = np.array([np.mean(by_number[n], axis=0) for n in numbers])
+            streets[street_key] = (np.array(numbers, dtype=np.int32), coords[:, 0], coords[:, 1])
+
+        return cls(streets)
+
+    def lookup(self, address: str) -> Optional[Tuple[float, float]]:
+        """
+        Locate an address from the index
+
+        Args:
+            address: Street address (city/state after the first comma is ignored)
+
+        Returns:
+            Tuple of (latitude, longitude), or None if the street is unknown or
+            the house number is too far from any indexed neighbor
+        """
+        number, street = extract_address_parts(address)
+        if number is None:
+            return None
+
+        entry = self.streets.get(normalize_street_name(street))
+        if entry is None:
+            return None
+        numbers, lats, lons = entry
+
+        pos = int(np.searchsorted(numbers, number))
+        if pos < len(numbers) and numbers[pos] == number:
+            return (float(lats[pos]), float(lons[pos]))
+
+        # Interpolate between the closest neighbors on the same side of the street
+        same_side = (numbers % 2) == (number % 2)
+        below = np.nonzero(same_side[:pos])[0]
+        above = np.nonzero(same_side[pos:])[0]
+        if not len(below) or not len(above):
+            return None
+
+        lo, hi = int(below[-1]), pos + int(above[0])
+        if numbers[hi] - numbers[lo] > MAX_INTERPOLATION_GAP:
+            return None
+
+        t = (number - numbers[lo]) / (numbers[hi] - numbers[lo])
+        return (float(lats[lo] + t * (lats[hi] - lats[lo])),
+                float(lons[lo] + t * (lons[hi] - lons[lo])))
+
+    def save(self, path: str = ADDRESS_POINTS_FILE):
+        """Write the index to disk atomically"""
+        with atomic_write(path, 'wb') as f:
+            pickle.dump(self.streets, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str = ADDRESS_POINTS_FILE) -> Optional['AddressPointIndex']:
+        """
+        Load the index from disk
+
+        Returns:
+            AddressPointIndex or None if the file is missing or unreadable
+        """
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, 'rb') as f:
+                return cls(pickle.load(f))
+        except Exception as e:
+            print(f"⚠️  Could not load address point index: {e}")
+            return None
+
+
+# Process-wide index, loaded on first use
+_index = None
+_index_loaded = False
+_index_lock = threading.Lock()
+
+
+def get_address_index(path: str = ADDRESS_POINTS_FILE) -> Optional[AddressPointIndex]:
+    """
+    Get the local address point index
+
+    Returns:
+        AddressPointIndex, or None if it has not been built
+    """
+    global _index, _index_loaded
+
+    if not _index_loaded:
+        with _index_lock:
+            if not _index_loaded:
+                _index = AddressPointIndex.load(path)
+                _index_loaded = True
+    return _index
+
+
+def lookup_address(address: str) -> Optional[Tuple[float, float]]:
+    """
+    Geocode an address offline
+
+    Returns:
+        Tuple of (latitude, longitude), or None if there is no index or no match
+    """
+    index = get_address_index()
+    return index.lookup(address) if index is not None else None
+
+
+def build_address_index(source: str, path: str = ADDRESS_POINTS_FILE) -> AddressPointIndex:
+    """
+    Build and save the index from a county address point source
+
+    Args:
+        source: CSV file, GeoJSON file, or ArcGIS layer URL
+        path: Output index location
+
+    Returns:
+        The built AddressPointIndex
+    """
+    print(f"🔄 Reading address points from {source}...")
+    if source.startswith(('http://', 'https://')):
+        points = _read_arcgis(source)
+    elif source.lower().endswith('.csv'):
+        points = _read_csv(source)
+    else:
+        points = _read_geojson(source)
+
+    index = AddressPointIndex.from_points(points)
+    index.save(path)
+
+    print(f"✓ Address index saved to {path} ({len(index):,} addresses on {len(index.streets):,} streets)")
+    return index
+
+
+def main():
+    """Build the index or show stats"""
+    if '--stats' in sys.argv:
+        index = AddressPointIndex.load()
+        if index is None:
+            print(f"❌ No address index at {ADDRESS_POINTS_FILE}")
+            return
+        print(f"Addresses: {len(index):,}")
+        print(f"Streets: {len(index.streets):,}")
+        return
+
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+
+    try:
+        build_address_index(sys.argv[1])
+    except Exception as e:
+        print(f"❌ Build failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -137,13 +137,15 @@ class SchoolAIAssistant:
 
         return "\n".join(lines)
 
-    def ask_claude_about_schools(self, address: str, question: str) -> str:
+    def ask_claude_about_schools(self, address: str, question: str,
+                                 info: Optional[CompleteSchoolInfo] = None) -> str:
         """
         Ask Claude a natural language question about schools at an address
 
         Args:
             address: Full address (e.g., "150 Hancock Avenue, Athens, GA 30601")
             question: Natural language question (e.g., "How good are the schools?")
+            info: Already-computed school info for the address (looked up if not given)
 
         Returns:
             Claude's natural language response
@@ -151,9 +153,10 @@ class SchoolAIAssistant:
         Raises:
             ValueError: If address not found or API error
         """
-        # Get school information
-        print(f"🔍 Looking up school data for: {address}")
-        info = get_school_info(address)
+        # Get school information (unless the caller already has it)
+        if info is None:
+            print(f"🔍 Looking up school data for: {address}")
+            info = get_school_info(address)
 
         if not info:
             return f"I couldn't find school information for the address '{address}'. This address may not be in Athens-Clarke County, GA, or the street name may not be recognized. Please verify the address and try again."
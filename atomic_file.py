@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Atomic file writes for local data artifacts
+The file is written to a uniquely named temporary file next to its target
+and renamed into place, so readers never see a half-written file.
+"""
+
+import os
+import tempfile
+from contextlib import contextmanager
+
+
+@contextmanager
+def atomic_write(path: str, mode: str = 'w'):
+    """
+    Open a temporary file that replaces path when the block exits cleanly
+
+    Missing parent directories are created. If the block raises, the
+    temporary file is removed and path is left untouched.
+
+    Args:
+        path: Destination file
+        mode: 'w' for text or 'wb' for binary
+
+    Usage:
+        >>> with atomic_write('data/index.pkl', 'wb') as f:
+        ...     pickle.dump(index, f)
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    # A unique name per writer, so concurrent writes of one path don't share a file
+    fd, tmp_path = tempfile.mkstemp(dir=directory or '.', prefix=f".{os.path.basename(path)}.",
+                                    suffix='.tmp')
+    try:
+        with os.fdopen(fd, mode) as f:
+            yield f
+        # mkstemp creates owner-only files; keep the usual data file permissions
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -145,7 +145,8 @@ class CrimeAIAssistant:
 
     def answer_crime_question(self, address: str, question: str,
                              radius_miles: float = 0.5,
-                             months_back: int = 12) -> str:
+                             months_back: int = 12,
+                             analysis: Optional[CrimeAnalysis] = None) -> str:
         """
         Answer a natural language question about crime near an address
 
@@ -154,6 +155,8 @@ class CrimeAIAssistant:
             question: User's question about crime/safety
             radius_miles: Search radius in miles (default: 0.5)
             months_back: How many months of history (default: 12)
+            analysis: Already-computed crime analysis for the address
+                (analyzed here if not given; radius/months are then ignored)
 
         Returns:
             Claude's natural language response
@@ -162,9 +165,10 @@ class CrimeAIAssistant:
             ValueError: If address is invalid or API key is missing
             RuntimeError: If crime data cannot be retrieved
         """
-        # Get crime analysis
-        print(f"📊 Analyzing crime data for {address}...")
-        analysis = analyze_crime_near_address(address, radius_miles, months_back)
+        # Get crime analysis (unless the caller already has it)
+        if analysis is None:
+            print(f"📊 Analyzing crime data for {address}...")
+            analysis = analyze_crime_near_address(address, radius_miles, months_back)
 
         if not analysis:
             raise RuntimeError(
@@ -6,20 +6,35 @@ Query crimes near a specific address with distance calculations
 
 import requests
 from typing import List, Dict, Optional, Tuple
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass
 import math
 import os
 import json
 import hashlib
-from geopy.geocoders import Nominatim
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 from geopy.exc import GeocoderTimedOut, GeocoderServiceError
-from address_normalization import standardize_address_format
+from geo_distance import haversine_many
+from geocoding import geocode
+from http_client import query_all_pages
 
 
 # ArcGIS REST API endpoint for Athens-Clarke County crime data
 CRIME_API_URL = "https://services2.arcgis.com/xSEULKvB31odt3XQ/arcgis/rest/services/Crime_Web_Layer_CAU_view/FeatureServer/0/query"
 
+# Records per page (the layer's maxRecordCount)
+API_PAGE_SIZE = 2000
+
+# Maximum time chunks fetched at once (keeps load on the county server polite)
+MAX_CONCURRENT_CHUNKS = 4
+
+# Attribute fields needed to build a CrimeIncident
+CRIME_FIELDS = [
+    'Date', 'Lat', 'Lon', 'Crime_Description', 'Address_Line_1',
+    'Case_Number', 'District', 'Beat', 'Total_Offense_Counts'
+]
+
 # Athens-Clarke County approximate boundaries for validation
 ATHENS_BOUNDS = {
     'lat_min': 33.85,
@@ -89,21 +104,13 @@ def geocode_address(address: str) -> Optional[Tuple[float, float]]:
         Tuple of (latitude, longitude) or None if geocoding fails
     """
     try:
-        geolocator = Nominatim(user_agent="athens_home_buyer_research")
-
-        # Normalize address format (suffix to prefix directionals)
-        address = standardize_address_format(address)
+        # Shared, cached geocoder (normalizes the address and adds Athens, GA)
+        coords = geocode(address)
 
-        # Add Athens, GA if not present
-        if 'athens' not in address.lower():
-            address = f"{address}, Athens, GA"
-
-        location = geolocator.geocode(address, timeout=10)
-
-        if not location:
+        if not coords:
             return None
 
-        lat, lon = location.latitude, location.longitude
+        lat, lon = coords
 
         # Validate it's in Athens-Clarke County
         if not (ATHENS_BOUNDS['lat_min'] <= lat <= ATHENS_BOUNDS['lat_max'] and
@@ -216,13 +223,79 @@ def _save_cached_query(cache_key: str, crimes: List[Dict], coords: Optional[Tupl
         pass
 
 
+def _date_where_clause(start: Optional[datetime] = None, end: Optional[datetime] = None) -> str:
+    """
+    Build an ArcGIS SQL where clause restricting the Date field
+
+    Args:
+        start: Earliest date (inclusive), or None for no lower bound
+        end: Latest date (inclusive), or None for no upper bound
+
+    Returns:
+        Where clause string (the layer stores dates in UTC)
+    """
+    conditions = []
+    if start is not None:
+        utc_start = datetime.fromtimestamp(start.timestamp(), tz=timezone.utc)
+        conditions.append(f"Date >= TIMESTAMP '{utc_start.strftime('%Y-%m-%d %H:%M:%S')}'")
+    if end is not None:
+        utc_end = datetime.fromtimestamp(end.timestamp(), tz=timezone.utc)
+        conditions.append(f"Date <= TIMESTAMP '{utc_end.strftime('%Y-%m-%d %H:%M:%S')}'")
+
+    return ' AND '.join(conditions) if conditions else '1=1'
+
+
+def fetch_crime_records(params: Dict, timeout: int = 15) -> List[Dict]:
+    """
+    Run a crime layer query across every result page
+
+    Args:
+        params: ArcGIS query parameters
+        timeout: Per-request timeout in seconds
+
+    Returns:
+        List of feature attribute dicts
+
+    Raises:
+        requests.exceptions.RequestException: If any page fails
+    """
+    features = query_all_pages(CRIME_API_URL, params, page_size=API_PAGE_SIZE, timeout=timeout)
+    return [feature['attributes'] for feature in features]
+
+
+def _fetch_chunk(base_params: Dict, chunk_start: datetime, chunk_end: datetime) -> List[Dict]:
+    """
+    Fetch every crime in one time chunk
+
+    Args:
+        base_params: Spatial query parameters shared by all chunks
+        chunk_start: Start of the chunk's date window
+        chunk_end: End of the chunk's date window
+
+    Returns:
+        List of crime dictionaries dated inside the window
+    """
+    params = dict(base_params, where=_date_where_clause(chunk_start, chunk_end))
+    chunk_crimes = fetch_crime_records(params, timeout=15)
+
+    # Server already filtered by date; re-check the bounds as a safety net
+    chunk_start_ms = int(chunk_start.timestamp() * 1000)
+    chunk_end_ms = int(chunk_end.timestamp() * 1000)
+    return [
+        crime for crime in chunk_crimes
+        if crime.get('Date') and chunk_start_ms <= crime['Date'] <= chunk_end_ms
+    ]
+
+
 def query_crimes_in_radius(center_lat: float, center_lon: float,
                            radius_miles: float, months_back: int) -> Optional[List[Dict]]:
     """
-    Query crimes within a radius of a point with automatic chunking to avoid API limits
+    Query crimes within a radius of a point, fetching time chunks in parallel
 
-    The API has a 2,000 record limit. This function automatically chunks large queries
-    into smaller time periods and combines results.
+    Each chunk pushes its date range into the API's where clause and follows
+    resultOffset pagination past the 2,000 record page limit. Up to
+    MAX_CONCURRENT_CHUNKS chunks run at once over the shared HTTP session, so
+    a long lookup takes roughly as long as its slowest chunk.
 
     Args:
         center_lat: Center latitude
@@ -234,7 +307,7 @@ def query_crimes_in_radius(center_lat: float, center_lon: float,
         List of crime dictionaries or None if error
     """
     # Determine chunk size based on total months
-    # For longer periods, use smaller chunks to avoid hitting limit
+    # Smaller chunks keep each paginated query short
     if months_back <= 12:
         chunk_months = months_back  # No chunking needed for 1 year
     elif months_back <= 24:
@@ -242,70 +315,56 @@ def query_crimes_in_radius(center_lat: float, center_lon: float,
     else:
         chunk_months = 6  # Query 6 months at a time for longer periods
 
-    all_crimes = []
-    hit_limit = False
-    chunks_queried = 0
-
-    # Query in chunks from most recent to oldest
+    # Build chunk windows from most recent to oldest
+    now = datetime.now()
+    chunks = []
     current_offset = 0
-
     while current_offset < months_back:
         chunk_size = min(chunk_months, months_back - current_offset)
+        chunk_start = now - timedelta(days=(current_offset + chunk_size) * 30)
+        chunk_end = now - timedelta(days=current_offset * 30)
+        chunks.append((chunk_start, chunk_end))
+        current_offset += chunk_size
 
-        # Calculate date range for this chunk
-        chunk_start = datetime.now() - timedelta(days=(current_offset + chunk_size) * 30)
-        chunk_end = datetime.now() - timedelta(days=current_offset * 30)
+    # Convert miles to meters for API (ArcGIS uses meters)
+    radius_meters = radius_miles * 1609.34
+
+    # Query parameters shared by every chunk (each adds its own date filter)
+    base_params = {
+        'geometry': f'{center_lon},{center_lat}',
+        'geometryType': 'esriGeometryPoint',
+        'inSR': '4326',  # WGS84 coordinate system
+        'spatialRel': 'esriSpatialRelIntersects',
+        'distance': radius_meters,
+        'units': 'esriSRUnit_Meter',
+        'outFields': ','.join(CRIME_FIELDS),
+        'returnGeometry': 'false',  # Lat/Lon are attributes
+        'f': 'json'
+    }
 
-        chunk_start_ms = int(chunk_start.timestamp() * 1000)
-        chunk_end_ms = int(chunk_end.timestamp() * 1000)
+    all_crimes = []
+    seen_case_numbers = set()  # Case numbers from earlier chunks, for O(1) duplicate checks
+
+    workers = min(MAX_CONCURRENT_CHUNKS, len(chunks)) or 1
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_fetch_chunk, base_params, start, end) for start, end in chunks]
 
         try:
-            # Convert miles to meters for API (ArcGIS uses meters)
-            radius_meters = radius_miles * 1609.34
-
-            # Build query parameters
-            params = {
-                'geometry': f'{center_lon},{center_lat}',
-                'geometryType': 'esriGeometryPoint',
-                'inSR': '4326',  # WGS84 coordinate system
-                'spatialRel': 'esriSpatialRelIntersects',
-                'distance': radius_meters,
-                'units': 'esriSRUnit_Meter',
-                'where': '1=1',  # Get all records
-                'outFields': '*',
-                'returnGeometry': 'true',
-                'f': 'json'
-            }
-
-            response = requests.get(CRIME_API_URL, params=params, timeout=15)
-            response.raise_for_status()
-
-            data = response.json()
-
-            if 'features' in data:
-                chunk_crimes = [feature['attributes'] for feature in data['features']]
-
-                # Filter by date for this chunk
-                filtered_chunk = []
-                for crime in chunk_crimes:
-                    crime_date_ms = crime.get('Date')
-                    if crime_date_ms and chunk_start_ms <= crime_date_ms <= chunk_end_ms:
-                        # Check for duplicates (in case of overlap)
-                        crime_id = crime.get('Case_Number')
-                        if not any(c.get('Case_Number') == crime_id for c in all_crimes):
-                            filtered_chunk.append(crime)
-
-                all_crimes.extend(filtered_chunk)
-                chunks_queried += 1
-
-                # Check if we hit the API limit for this chunk
-                if len(chunk_crimes) >= 2000:
-                    hit_limit = True
-                    print(f"⚠️  Warning: Hit API limit (2,000 records) for chunk {chunks_queried}")
-
-            else:
-                # Empty response for this chunk
-                pass
+            # Merge in chunk order so results don't depend on completion order
+            for future in futures:
+                chunk_case_numbers = set()
+                for crime in future.result():
+                    # Skip duplicates from earlier chunks (in case of overlap);
+                    # incidents without a case number can't be matched, so keep them
+                    crime_id = crime.get('Case_Number')
+                    if crime_id:
+                        if crime_id in seen_case_numbers:
+                            continue
+                        chunk_case_numbers.add(crime_id)
+
+                    all_crimes.append(crime)
+
+                seen_case_numbers |= chunk_case_numbers
 
         except requests.exceptions.Timeout:
             print("⚠️  API request timed out")
@@ -319,20 +378,86 @@ def query_crimes_in_radius(center_lat: float, center_lon: float,
         except Exception as e:
             print(f"⚠️  Unexpected error querying crimes: {e}")
             return None
-
-        current_offset += chunk_size
+        finally:
+            for future in futures:
+                future.cancel()
 
     # Display summary of chunking
-    if chunks_queried > 1:
-        print(f"✓ Retrieved data in {chunks_queried} chunks to ensure completeness")
-
-    if hit_limit:
-        print(f"⚠️  WARNING: API limit reached - data may be incomplete for this high-crime area")
-        print(f"   Consider using a smaller radius or shorter time period for complete results")
+    if len(chunks) > 1:
+        print(f"✓ Retrieved data in {len(chunks)} chunks")
 
     return all_crimes
 
 
+def _geocode_or_raise(address: str) -> Tuple[float, float]:
+    """
+    Geocode an address, raising a helpful error if it cannot be found
+
+    Raises:
+        ValueError: If address cannot be geocoded within Athens-Clarke County
+    """
+    print(f"🔍 Geocoding address: {address}")
+    coords = geocode_address(address)
+
+    if not coords:
+        raise ValueError(
+            f"Could not geocode address: {address}\n"
+            "Please check:\n"
+            "  - Address is in Athens-Clarke County, GA\n"
+            "  - Street name is spelled correctly\n"
+            "  - Street number is valid"
+        )
+
+    print(f"✓ Geocoded to: {coords[0]:.6f}, {coords[1]:.6f}")
+    return coords
+
+
+def _query_api_with_cache(address: str, radius_miles: float,
+                          months_back: int) -> Tuple[List[Dict], Tuple[float, float]]:
+    """
+    Get raw crime records from the per-address cache or the live API
+
+    Returns:
+        Tuple of (crime records, (latitude, longitude))
+
+    Raises:
+        ValueError: If address cannot be geocoded
+        RuntimeError: If the crime API query fails
+    """
+    # Generate cache key for this query
+    cache_key = _generate_cache_key(address, radius_miles, months_back)
+
+    # Try to load from cache first
+    cached_result = _load_cached_query(cache_key)
+
+    if cached_result is not None:
+        # Cache hit - use cached data
+        crime_data, cached_coords = cached_result
+
+        if cached_coords:
+            # We have cached coordinates - no need to geocode again
+            return crime_data, cached_coords
+
+        # Old cache without coords - geocode now
+        return crime_data, _geocode_or_raise(address)
+
+    # Cache miss - do full query
+    center_lat, center_lon = _geocode_or_raise(address)
+
+    # Query crimes in radius
+    print(f"🔍 Searching for crimes within {radius_miles} miles (last {months_back} months)...")
+    crime_data = query_crimes_in_radius(center_lat, center_lon, radius_miles, months_back)
+
+    if crime_data is None:
+        raise RuntimeError("Failed to query crime data - API error")
+
+    # Save to cache for future queries (including coords for faster subsequent lookups)
+    if crime_data:
+        _save_cached_query(cache_key, crime_data, coords=(center_lat, center_lon))
+
+    return crime_data, (center_lat, center_lon)
+
+
 def get_crimes_near_address(address: str, radius_miles: float = 0.5,
                             months_back: int = 12) -> Optional[List[CrimeIncident]]:
     """
@@ -361,100 +486,54 @@ def get_crimes_near_address(address: str, radius_miles: float = 0.5,
     if months_back <= 0 or months_back > 120:
         raise ValueError("months_back must be between 1 and 120 months")
 
-    # Generate cache key for this query
-    cache_key = _generate_cache_key(address, radius_miles, months_back)
+    # Answer from the local incident store when a fresh sync is available
+    from crime_store import get_crime_store
+    store = get_crime_store()
 
-    # Try to load from cache first
-    cached_result = _load_cached_query(cache_key)
+    if store is not None:
+        center_lat, center_lon = _geocode_or_raise(address)
 
-    if cached_result is not None:
-        # Cache hit - use cached data
-        crime_data, cached_coords = cached_result
-
-        if cached_coords:
-            # We have cached coordinates - no need to geocode again
-            center_lat, center_lon = cached_coords
-        else:
-            # Old cache without coords - geocode now
-            print(f"🔍 Geocoding address: {address}")
-            coords = geocode_address(address)
-            if not coords:
-                raise ValueError(
-                    f"Could not geocode address: {address}\n"
-                    "Please check:\n"
-                    "  - Address is in Athens-Clarke County, GA\n"
-                    "  - Street name is spelled correctly\n"
-                    "  - Street number is valid"
-                )
-            center_lat, center_lon = coords
-            print(f"✓ Geocoded to: {center_lat:.6f}, {center_lon:.6f}")
+        window_end = datetime.now()
+        window_start = window_end - timedelta(days=months_back * 30)
+        crime_data = store.query_radius(center_lat, center_lon, radius_miles,
+                                        start=window_start, end=window_end)
+        print(f"✓ Found {len(crime_data)} incidents in local crime store")
     else:
-        # Cache miss - do full query
-        # Geocode the address
-        print(f"🔍 Geocoding address: {address}")
-        coords = geocode_address(address)
-
-        if not coords:
-            raise ValueError(
-                f"Could not geocode address: {address}\n"
-                "Please check:\n"
-                "  - Address is in Athens-Clarke County, GA\n"
-                "  - Street name is spelled correctly\n"
-                "  - Street number is valid"
-            )
-
-        center_lat, center_lon = coords
-        print(f"✓ Geocoded to: {center_lat:.6f}, {center_lon:.6f}")
-
-        # Query crimes in radius
-        print(f"🔍 Searching for crimes within {radius_miles} miles (last {months_back} months)...")
-        crime_data = query_crimes_in_radius(center_lat, center_lon, radius_miles, months_back)
-
-        if crime_data is None:
-            raise RuntimeError("Failed to query crime data - API error")
-
-        # Save to cache for future queries (including coords for faster subsequent lookups)
-        if crime_data:
-            _save_cached_query(cache_key, crime_data, coords=(center_lat, center_lon))
+        crime_data, (center_lat, center_lon) = _query_api_with_cache(address, radius_miles, months_back)
 
     if not crime_data:
         # No crimes found - return empty list (not an error)
         return []
 
-    # Convert to CrimeIncident objects with distance calculations
+    # Skip records without a date or coordinates
+    located = [crime for crime in crime_data
+               if crime.get('Date') and crime.get('Lat') and crime.get('Lon')]
+
+    # Calculate every distance in one array operation
+    distances = haversine_many(
+        (center_lat, center_lon),
+        [crime['Lat'] for crime in located],
+        [crime['Lon'] for crime in located]
+    )
+
+    # Only include crimes within the specified radius, closest first
+    # (API might return slightly more due to bounding box)
+    order = np.argsort(distances, kind='stable')
+    order = order[distances[order] <= radius_miles]
+
+    # Convert to CrimeIncident objects
     incidents = []
-    for crime in crime_data:
+    for i in order:
+        crime = located[i]
         try:
-            # Parse date (Unix timestamp in milliseconds)
-            date_ms = crime.get('Date')
-            if date_ms:
-                date = datetime.fromtimestamp(date_ms / 1000)
-            else:
-                continue  # Skip if no date
-
-            # Get location
-            crime_lat = crime.get('Lat')
-            crime_lon = crime.get('Lon')
-
-            if not crime_lat or not crime_lon:
-                continue  # Skip if no coordinates
-
-            # Calculate distance
-            distance = haversine_distance(center_lat, center_lon, crime_lat, crime_lon)
-
-            # Only include crimes within the specified radius
-            # (API might return slightly more due to bounding box)
-            if distance > radius_miles:
-                continue
-
             incident = CrimeIncident(
-                date=date,
+                date=datetime.fromtimestamp(crime['Date'] / 1000),  # Unix timestamp in milliseconds
                 crime_type=crime.get('Crime_Description', 'Unknown'),
                 address=crime.get('Address_Line_1', 'Location not specified'),
-                case_number=crime.get('Case_Number', 'N/A'),
-                distance_miles=distance,
-                latitude=crime_lat,
-                longitude=crime_lon,
+                case_number=crime.get('Case_Number') or 'N/A',
+                distance_miles=float(distances[i]),
+                latitude=crime['Lat'],
+                longitude=crime['Lon'],
                 district=crime.get('District', 'N/A'),
                 beat=crime.get('Beat', 'N/A'),
                 offense_count=crime.get('Total_Offense_Counts', 1)
@@ -467,9 +546,6 @@ def get_crimes_near_address(address: str, radius_miles: float = 0.5,
             print(f"⚠️  Skipping malformed crime record: {e}")
             continue
 
-    # Sort by distance (closest first)
-    incidents.sort(key=lambda x: x.distance_miles)
-
     return incidents
 
 
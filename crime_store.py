@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Local crime incident store for Athens-Clarke County
+Syncs the full Crime_Web_Layer into a compact columnar file so address
+lookups can be answered locally instead of querying the ArcGIS API each time
+
+Usage:
+    python crime_store.py           # Incremental sync (full sync if no store yet)
+    python crime_store.py --full    # Re-download the entire layer
+    python crime_store.py --stats   # Show what is in the local store
+"""
+
+import os
+import sys
+import threading
+from typing import List, Dict, Optional
+from datetime import datetime, timedelta
+
+import numpy as np
+import requests
+
+from atomic_file import atomic_write
+from crime_lookup import CRIME_FIELDS, fetch_crime_records, _date_where_clause
+from spatial_index import PointGridIndex
+
+
+# Location of the synced store (relative to the project root, like data/street_index.json)
+CRIME_STORE_FILE = "data/crime_incidents.npz"
+
+# Store is considered stale after this long (daily sync job plus a day of slack)
+STORE_MAX_AGE_HOURS = 48
+
+# Incremental syncs re-fetch this many days before the newest stored incident,
+# so late-entered reports with older dates are still picked up
+SYNC_OVERLAP_DAYS = 30
+
+
+def _to_ms(value: Optional[datetime]) -> Optional[int]:
+    """Convert a datetime to epoch milliseconds (None passes through)"""
+    return None if value is None else int(value.timestamp() * 1000)
+
+
+def _case_number(record: Dict) -> str:
+    """Case number of a record, or '' if it has none (older stores saved 'N/A')"""
+    case_number = record.get('Case_Number')
+    if not case_number or case_number == 'N/A':
+        return ''
+    return str(case_number)
+
+
+def _crime_type(record: Dict) -> str:
+    """Crime description as stored ('Unknown' if missing)"""
+    return record.get('Crime_Description') or 'Unknown'
+
+
+def _address(record: Dict) -> str:
+    """Address as stored ('Location not specified' if missing)"""
+    return record.get('Address_Line_1') or 'Location not specified'
+
+
+def _dedupe_key(record: Dict) -> tuple:
+    """
+    Identity of an incident: its case number, or its details if it has none
+
+    Details are compared as stored, so a row read back from the store
+    matches the same incident downloaded again.
+    """
+    case_number = _case_number(record)
+    if case_number:
+        return ('case', case_number)
+    return ('anonymous', int(record['Date']), round(float(record['Lat']), 6), round(float(record['Lon']), 6),
+            _crime_type(record), _address(record))
+
+
+def _encode_categories(values: List[str]):
+    """
+    Dictionary-encode a list of strings
+
+    Returns:
+        Tuple of (codes array, vocabulary array)
+    """
+    vocab, codes = np.unique(np.array(values, dtype=str), return_inverse=True)
+    return codes.astype(np.int16), vocab
+
+
+class CrimeStore:
+    """
+    Columnar, in-memory view of every synced crime incident
+
+    Columns are parallel NumPy arrays; low-cardinality text fields
+    (crime type, district, beat) are stored as int16 codes into a vocabulary.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray], synced_at: datetime):
+        self.date_ms = columns['date_ms']
+        self.lat = columns['lat']
+        self.lon = columns['lon']
+        self.type_code = columns['type_code']
+        self.crime_types = columns['crime_types']
+        self.case_number = columns['case_number']
+        self.address = columns['address']
+        self.district_code = columns['district_code']
+        self.districts = columns['districts']
+        self.beat_code = columns['beat_code']
+        self.beats = columns['beats']
+        self.offense_count = columns['offense_count']
+        self.synced_at = synced_at
+        self._index = None
+
+    def __len__(self) -> int:
+        return len(self.date_ms)
+
+    @property
+    def index(self) -> PointGridIndex:
+        """Spatial grid index over incident locations, built on first use"""
+        if self._index is None:
+            self._index = PointGridIndex(self.lat, self.lon, times=self.date_ms)
+        return self._index
+
+    @classmethod
+    def from_records(cls, records: List[Dict], synced_at: Optional[datetime] = None) -> 'CrimeStore':
+        """
+        Build a store from ArcGIS attribute dicts
+
+        Records without a date or coordinates are dropped. Duplicate case
+        numbers keep the last occurrence, so newer downloads win. Records
+        without a case number are deduplicated on (date, location, type)
+        instead, so an incremental sync doesn't collapse them into one.
+
+        Args:
+            records: List of feature attribute dicts
+            synced_at: Time of the sync (default: now)
+
+        Returns:
+            CrimeStore sorted by date
+        """
+        by_key = {}
+        for record in records:
+            if not record.get('Date') or not record.get('Lat') or not record.get('Lon'):
+                continue
+            by_key[_dedupe_key(record)] = record
+
+        rows = sorted(by_key.values(), key=lambda r: r['Date'])
+
+        type_code, crime_types = _encode_categories([_crime_type(r) for r in rows])
+        district_code, districts = _encode_categories([r.get('District') or 'N/A' for r in rows])
+        beat_code, beats = _encode_categories([r.get('Beat') or 'N/A' for r in rows])
+
+        columns = {
+            'date_ms': np.array([r['Date'] for r in rows], dtype=np.int64),
+            'lat': np.array([r['Lat'] for r in rows], dtype=np.float64),
+            'lon': np.array([r['Lon'] for r in rows], dtype=np.float64),
+            'type_code': type_code,
+            'crime_types': crime_types,
+            'case_number': np.array([_case_number(r) for r in rows], dtype=str),
+            'address': np.array([_address(r) for r in rows], dtype=str),
+            'district_code': district_code,
+            'districts': districts,
+            'beat_code': beat_code,
+            'beats': beats,
+            'offense_count': np.array([r.get('Total_Offense_Counts') or 1 for r in rows], dtype=np.int16),
+        }
+
+        return cls(columns, synced_at or datetime.now())
+
+    def to_records(self, indices: Optional[np.ndarray] = None) -> List[Dict]:
+        """
+        Convert rows back to ArcGIS-style attribute dicts
+
+        Args:
+            indices: Row indices to convert (default: all rows)
+
+        Returns:
+            List of attribute dicts with the same keys as the live API
+        """
+        if indices is None:
+            indices = np.arange(len(self))
+
+        return [
+            {
+                'Date': int(self.date_ms[i]),
+                'Lat': float(self.lat[i]),
+                'Lon': float(self.lon[i]),
+                'Crime_Description': str(self.crime_types[self.type_code[i]]),
+                'Address_Line_1': str(self.address[i]),
+                'Case_Number': str(self.case_number[i]) or None,
+                'District': str(self.districts[self.district_code[i]]),
+                'Beat': str(self.beats[self.beat_code[i]]),
+                'Total_Offense_Counts': int(self.offense_count[i]),
+            }
+            for i in indices
+        ]
+
+    def is_fresh(self) -> bool:
+        """Check whether the store was synced recently enough to trust"""
+        age_hours = (datetime.now() - self.synced_at).total_seconds() / 3600
+        return age_hours <= STORE_MAX_AGE_HOURS
+
+    def query_radius(self, lat: float, lon: float, radius_miles: float,
+                     start: Optional[datetime] = None,
+                     end: Optional[datetime] = None) -> List[Dict]:
+        """
+        Find incidents within a radius of a point and a time window
+
+        Args:
+            lat: Center latitude
+            lon: Center longitude
+            radius_miles: Search radius in miles
+            start: Earliest incident date (inclusive, default: no limit)
+            end: Latest incident date (inclusive, default: no limit)
+
+        Returns:
+            List of attribute dicts, same shape as the live API returns
+        """
+        indices, _ = self.index.query_radius(lat, lon, radius_miles,
+                                             start=_to_ms(start), end=_to_ms(end))
+        return self.to_records(np.sort(indices))
+
+    def k_nearest(self, lat: float, lon: float, k: int,
+                  start: Optional[datetime] = None,
+                  end: Optional[datetime] = None) -> List[Dict]:
+        """
+        Find the k incidents closest to a point within a time window
+
+        Args:
+            lat: Query latitude
+            lon: Query longitude
+            k: Number of incidents to return
+            start: Earliest incident date (inclusive, default: no limit)
+            end: Latest incident date (inclusive, default: no limit)
+
+        Returns:
+            List of attribute dicts, nearest first
+        """
+        indices, _ = self.index.k_nearest(lat, lon, k, start=_to_ms(start), end=_to_ms(end))
+        return self.to_records(indices)
+
+    def save(self, path: str = CRIME_STORE_FILE):
+        """
+        Write the store to disk atomically
+
+        The file is written next to the target and renamed into place, so
+        readers never see a half-written store.
+        """
+        with atomic_write(path, 'wb') as f:
+            np.savez_compressed(
+                f,
+                date_ms=self.date_ms, lat=self.lat, lon=self.lon,
+                type_code=self.type_code, crime_types=self.crime_types,
+                case_number=self.case_number, address=self.address,
+                district_code=self.district_code, districts=self.districts,
+                beat_code=self.beat_code, beats=self.beats,
+                offense_count=self.offense_count,
+                synced_at=np.array(self.synced_at.isoformat())
+            )
+
+    @classmethod
+    def load(cls, path: str = CRIME_STORE_FILE) -> Optional['CrimeStore']:
+        """
+        Load a store from disk
+
+        Returns:
+            CrimeStore or None if the file is missing or unreadable
+        """
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with np.load(path) as data:
+                columns = {key: data[key] for key in data.files if key != 'synced_at'}
+                synced_at = datetime.fromisoformat(str(data['synced_at']))
+            return cls(columns, synced_at)
+        except Exception as e:
+            print(f"⚠️  Could not load crime store: {e}")
+            return None
+
+
+# Process-wide store, reloaded when the file on disk changes
+_store = None
+_store_mtime = None
+_store_lock = threading.Lock()
+
+
+def get_crime_store(path: str = CRIME_STORE_FILE) -> Optional[CrimeStore]:
+    """
+    Get the local crime store if it exists and is fresh
+
+    Returns:
+        CrimeStore, or None if no usable store is available (callers should
+        fall back to the live API)
+    """
+    global _store, _store_mtime
+
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+
+    with _store_lock:
+        if _store is None or mtime != _store_mtime:
+            _store = CrimeStore.load(path)
+            _store_mtime = mtime
+
+        if _store is None or not _store.is_fresh():
+            return None
+
+        return _store
+
+
+def fetch_incidents_since(since: Optional[datetime] = None) -> List[Dict]:
+    """
+    Page through the crime layer and download every incident
+
+    Args:
+        since: Only fetch incidents on or after this date (default: everything)
+
+    Returns:
+        List of attribute dicts
+
+    Raises:
+        requests.RequestException: If any page fails to download
+    """
+    params = {
+        'where': _date_where_clause(since),
+        'outFields': ','.join(CRIME_FIELDS),
+        'returnGeometry': 'false',
+        'f': 'json'
+    }
+
+    records = fetch_crime_records(params, timeout=60)
+    print(f"  Downloaded {len(records):,} incidents")
+    return records
+
+
+def sync_crime_store(full: bool = False, path: str = CRIME_STORE_FILE) -> CrimeStore:
+    """
+    Sync the local store with the ArcGIS crime layer
+
+    Incremental syncs only download incidents from the last SYNC_OVERLAP_DAYS
+    before the newest stored incident and merge them into the existing store.
+
+    Args:
+        full: Re-download the whole layer instead of syncing incrementally
+        path: Store file location
+
+    Returns:
+        The updated CrimeStore
+    """
+    existing = None if full else CrimeStore.load(path)
+
+    if existing is not None and len(existing) > 0:
+        newest = datetime.fromtimestamp(int(existing.date_ms[-1]) / 1000)
+        since = newest - timedelta(days=SYNC_OVERLAP_DAYS)
+        print(f"🔄 Incremental sync from {since.strftime('%Y-%m-%d')}...")
+        records = existing.to_records() + fetch_incidents_since(since)
+    else:
+        print("🔄 Full sync of Athens-Clarke crime layer...")
+        records = fetch_incidents_since(None)
+
+    store = CrimeStore.from_records(records)
+    store.save(path)
+
+    print(f"✓ Crime store saved to {path} ({len(store):,} incidents)")
+    return store
+
+
+def main():
+    """Run the sync job"""
+    if '--stats' in sys.argv:
+        store = CrimeStore.load()
+        if store is None:
+            print(f"❌ No crime store at {CRIME_STORE_FILE}")
+            return
+
+        oldest = datetime.fromtimestamp(int(store.date_ms[0]) / 1000) if len(store) else None
+        newest = datetime.fromtimestamp(int(store.date_ms[-1]) / 1000) if len(store) else None
+        print(f"Incidents: {len(store):,}")
+        print(f"Crime types: {len(store.crime_types)}")
+        if oldest and newest:
+            print(f"Date range: {oldest:%Y-%m-%d} to {newest:%Y-%m-%d}")
+        print(f"Synced at: {store.synced_at:%Y-%m-%d %H:%M} ({'fresh' if store.is_fresh() else 'stale'})")
+        return
+
+    try:
+        sync_crime_store(full='--full' in sys.argv)
+    except requests.RequestException as e:
+        print(f"❌ Sync failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,20 @@
 #!/usr/bin/env python3
 """
-Extract the complete street index from the PDF and save to JSON
+Extract the complete street index from the PDF and save to JSON, plus the
+precompiled data/street_index.pkl loaded by street_index_lookup
+
+Usage:
+    python extract_full_street_index.py                  # PDF -> JSON -> compiled index
+    python extract_full_street_index.py --compile-only   # Recompile from the existing JSON
 """
 
-import fitz  # PyMuPDF
 import re
+import sys
 import json
 from typing import List, Dict
 
+from street_index_lookup import save_compiled_index
+
 
 def is_street_name(line: str) -> bool:
     """Check if a line looks like a street name"""
@@ -65,6 +72,8 @@ def extract_street_index(pdf_path: str) -> List[Dict]:
 
     Returns list of dicts with: street, parameters, elementary, middle, high
     """
+    import fitz  # PyMuPDF
+
     streets = []
 
     doc = fitz.open(pdf_path)
@@ -158,11 +167,26 @@ def build_lookup_index(streets: List[Dict]) -> Dict:
     return index
 
 
+def compile_index():
+    """Write the precompiled street index next to the JSON"""
+    print("Compiling street index...")
+    output_path = save_compiled_index("data")
+    print(f"✓ Compiled index saved to {output_path}")
+
+
 def main():
     """Extract data from PDF and save to JSON"""
     pdf_path = "data/street_index.pdf"
     output_json = "data/street_index.json"
 
+    if '--compile-only' in sys.argv:
+        try:
+            compile_index()
+        except FileNotFoundError as e:
+            print(f"✗ Error: {e}")
+            sys.exit(1)
+        return
+
     print("=" * 70)
     print("Athens-Clarke County Street Index Extractor")
     print("=" * 70)
@@ -188,6 +212,9 @@ def main():
         print("✓ Data saved successfully")
         print()
 
+        compile_index()
+        print()
+
         # Show some statistics
         print("Statistics:")
         print(f"  Total street entries: {len(streets)}")
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Source-file signatures for build artifacts
+An artifact records the size, mtime and checksum of each file it was built
+from; it is current while every source still matches. The checksum is only
+recomputed when the size matches but the mtime doesn't (e.g. after a checkout).
+"""
+
+import os
+import hashlib
+from typing import Dict, Optional
+
+
+def file_sha256(path: str) -> str:
+    """SHA-256 hex digest of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def file_signature(path: str) -> Optional[Dict]:
+    """
+    Signature of a source file
+
+    Returns:
+        Dict with size, mtime_ns and sha256, or None if the file doesn't exist
+    """
+    if not os.path.exists(path):
+        return None
+    stat = os.stat(path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': file_sha256(path)}
+
+
+def signature_matches(path: str, signature: Optional[Dict]) -> bool:
+    """
+    Check a file against a recorded signature
+
+    Args:
+        path: Source file
+        signature: Signature from file_signature (None = file was absent)
+
+    Returns:
+        True if the file is unchanged (or still absent)
+    """
+    if not os.path.exists(path):
+        return signature is None
+    if signature is None:
+        return False
+
+    stat = os.stat(path)
+    if stat.st_size != signature.get('size'):
+        return False
+    if stat.st_mtime_ns == signature.get('mtime_ns'):
+        return True
+    return file_sha256(path) == signature.get('sha256')
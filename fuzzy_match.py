@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Fuzzy matching over a fixed vocabulary (e.g. normalized street names)
+SymSpell-style: every key is indexed under all strings reachable by deleting
+up to MAX_EDIT_DISTANCE characters, so a query only generates its own deletes
+and verifies the few keys that share one, instead of scanning the vocabulary.
+"""
+
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+# Largest edit distance a suggestion may be from the query
+MAX_EDIT_DISTANCE = 2
+
+
+def edit_distance(a: str, b: str) -> int:
+    """
+    Optimal string alignment distance (Levenshtein plus adjacent transpositions)
+
+    Args:
+        a: First string
+        b: Second string
+
+    Returns:
+        Number of single-character edits between the strings
+    """
+    # Typos are local: only the differing middle needs the DP table
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    end = 0
+    while end < len(a) - start and end < len(b) - start and a[-1 - end] == b[-1 - end]:
+        end += 1
+    a, b = a[start:len(a) - end], b[start:len(b) - end]
+
+    previous2 = None
+    previous = list(range(len(b) + 1))
+
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous2 is not None and i > 1 and j > 1
+                    and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        previous2, previous = previous, current
+
+    return previous[len(b)]
+
+
+def _deletes(word: str, max_distance: int) -> Set[str]:
+    """The word plus every string obtained by deleting up to max_distance characters"""
+    variants = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))} - variants
+        variants |= frontier
+    return variants
+
+
+class FuzzyIndex:
+    """
+    Delete-neighborhood index over a set of keys
+
+    Usage:
+        >>> index = FuzzyIndex(['hancock ave', 'prince ave'])
+        >>> index.suggest('hancok ave')
+        [('hancock ave', 1)]
+    """
+
+    def __init__(self, keys: Iterable[str], max_distance: int = MAX_EDIT_DISTANCE):
+        """
+        Args:
+            keys: Vocabulary to match against
+            max_distance: Largest edit distance supported by suggest()
+        """
+        self.max_distance = max_distance
+        self.keys = sorted(set(keys))
+        self.deletes: Dict[str, List[int]] = {}
+
+        for key_id, key in enumerate(self.keys):
+            for variant in _deletes(key, max_distance):
+                self.deletes.setdefault(variant, []).append(key_id)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def suggest(self, query: str, max_results: int = 5) -> List[Tuple[str, int]]:
+        """
+        Rank keys close to a query
+
+        Args:
+            query: String to match (normalized the same way as the keys)
+            max_results: Maximum number of suggestions
+
+        Returns:
+            List of (key, edit distance), closest first (ties alphabetical)
+        """
+        candidates = set()
+        for variant in _deletes(query, self.max_distance):
+            candidates.update(self.deletes.get(variant, ()))
+
+        ranked = []
+        for key_id in candidates:
+            key = self.keys[key_id]
+            if abs(len(key) - len(query)) > self.max_distance:
+                continue
+            distance = edit_distance(query, key)
+            if distance <= self.max_distance:
+                ranked.append((distance, key))
+
+        ranked.sort()
+        return [(key, distance) for distance, key in ranked[:max_results]]
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Vectorized great-circle distance helpers
+Array versions of crime_lookup.haversine_distance for one-to-many and
+many-to-many distance calculations
+"""
+
+from typing import Sequence, Tuple
+
+import numpy as np
+
+
+# Earth radius in miles (same value crime_lookup.haversine_distance uses)
+EARTH_RADIUS_MILES = 3959
+
+METERS_PER_MILE = 1609.34
+
+
+def haversine_many(center: Tuple[float, float], lats, lons) -> np.ndarray:
+    """
+    Calculate distances from one point to many points (in miles)
+
+    Args:
+        center: (latitude, longitude) of the reference point
+        lats: Array-like of latitudes
+        lons: Array-like of longitudes
+
+    Returns:
+        NumPy array of distances in miles, same length as lats/lons
+    """
+    lat1, lon1 = np.radians(center[0]), np.radians(center[1])
+    lat2 = np.radians(np.asarray(lats, dtype=np.float64))
+    lon2 = np.radians(np.asarray(lons, dtype=np.float64))
+
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return EARTH_RADIUS_MILES * 2 * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def haversine_matrix(centers: Sequence[Tuple[float, float]], lats, lons) -> np.ndarray:
+    """
+    Calculate pairwise distances from many centers to many points (in miles)
+
+    Args:
+        centers: Sequence of (latitude, longitude) pairs, or an (m, 2) array
+        lats: Array-like of n latitudes
+        lons: Array-like of n longitudes
+
+    Returns:
+        NumPy array of shape (m, n); row i holds distances from centers[i]
+    """
+    centers = np.asarray(centers, dtype=np.float64).reshape(-1, 2)
+    lat1 = np.radians(centers[:, 0])[:, np.newaxis]
+    lon1 = np.radians(centers[:, 1])[:, np.newaxis]
+    lat2 = np.radians(np.asarray(lats, dtype=np.float64))[np.newaxis, :]
+    lon2 = np.radians(np.asarray(lons, dtype=np.float64))[np.newaxis, :]
+
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return EARTH_RADIUS_MILES * 2 * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Shared geocoding layer for crime, zoning and school lookups
+Tries the offline address point index first, then one Nominatim client behind
+an in-memory LRU and a persistent disk cache, with concurrent requests for
+the same address coalesced into one call
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Optional, Tuple
+
+from geopy.geocoders import Nominatim
+
+from address_normalization import standardize_address_format
+
+
+# Persistent cache of geocoded addresses (coordinates don't change)
+GEOCODE_CACHE_DIR = "/tmp/athens_geocode_cache"
+
+# Addresses kept in the in-memory LRU
+MEMORY_CACHE_SIZE = 512
+
+# Nominatim's usage policy allows at most one request per second
+MIN_REQUEST_INTERVAL = 1.0
+
+USER_AGENT = "athens_home_buyer_research"
+
+
+_memory_cache = OrderedDict()
+_in_flight = {}
+_cache_lock = threading.Lock()
+
+_geolocator = None
+_geolocator_lock = threading.Lock()
+_rate_lock = threading.Lock()
+_last_request_time = 0.0
+
+
+def normalize_address(address: str) -> str:
+    """
+    Normalize an address for geocoding and cache lookups
+
+    Args:
+        address: Street address as entered
+
+    Returns:
+        Standardized address with ", Athens, GA" appended if no city given
+    """
+    address = standardize_address_format(address)
+
+    if 'athens' not in address.lower():
+        address = f"{address}, Athens, GA"
+
+    return address
+
+
+def _cache_key(normalized: str) -> str:
+    """Cache key for a normalized address (case and spacing insensitive)"""
+    return ' '.join(normalized.lower().split())
+
+
+def _disk_cache_file(key: str) -> str:
+    return os.path.join(GEOCODE_CACHE_DIR, f"{hashlib.md5(key.encode()).hexdigest()}.json")
+
+
+def _load_from_disk(key: str) -> Optional[Tuple[float, float]]:
+    """Load cached coordinates from disk, or None if not cached"""
+    try:
+        with open(_disk_cache_file(key), 'r') as f:
+            data = json.load(f)
+        return (data['lat'], data['lon'])
+    except Exception:
+        return None
+
+
+def _save_to_disk(key: str, coords: Tuple[float, float]):
+    """Save coordinates to the disk cache"""
+    try:
+        os.makedirs(GEOCODE_CACHE_DIR, exist_ok=True)
+        with open(_disk_cache_file(key), 'w') as f:
+            json.dump({'address': key, 'lat': coords[0], 'lon': coords[1]}, f)
+    except Exception:
+        # Fail silently - caching is optional
+        pass
+
+
+def _remember(key: str, coords: Optional[Tuple[float, float]]):
+    """Add a result to the in-memory LRU (caller holds _cache_lock)"""
+    _memory_cache[key] = coords
+    _memory_cache.move_to_end(key)
+    while len(_memory_cache) > MEMORY_CACHE_SIZE:
+        _memory_cache.popitem(last=False)
+
+
+def _lookup_offline(address: str) -> Optional[Tuple[float, float]]:
+    """Geocode from the local address point index, or None on a miss"""
+    try:
+        from address_points import lookup_address
+        return lookup_address(address)
+    except Exception:
+        # Index unavailable - fall back to the network geocoder
+        return None
+
+
+def get_geolocator() -> Nominatim:
+    """Get the shared Nominatim client (created on first use)"""
+    global _geolocator
+
+    if _geolocator is None:
+        with _geolocator_lock:
+            if _geolocator is None:
+                _geolocator = Nominatim(user_agent=USER_AGENT)
+    return _geolocator
+
+
+def _query_nominatim(address: str) -> Optional[Tuple[float, float]]:
+    """Geocode with Nominatim, waiting as needed to respect the rate limit"""
+    global _last_request_time
+
+    geolocator = get_geolocator()
+
+    with _rate_lock:
+        wait = MIN_REQUEST_INTERVAL - (time.monotonic() - _last_request_time)
+        if wait > 0:
+            time.sleep(wait)
+
+        try:
+            location = geolocator.geocode(address, timeout=10)
+        finally:
+            _last_request_time = time.monotonic()
+
+    if not location:
+        return None
+    return (location.latitude, location.longitude)
+
+
+def geocode(address: str) -> Optional[Tuple[float, float]]:
+    """
+    Geocode an address to latitude/longitude coordinates
+
+    Checks the in-memory LRU, the offline address point index, the disk
+    cache and finally Nominatim. If another thread is already geocoding the
+    same address, waits for its result instead of sending a duplicate request.
+
+    Args:
+        address: Street address to geocode
+
+    Returns:
+        Tuple of (latitude, longitude) or None if the address was not found
+
+    Raises:
+        geopy.exc.GeopyError: If the geocoding service fails (not cached)
+    """
+    normalized = normalize_address(address)
+    key = _cache_key(normalized)
+
+    with _cache_lock:
+        if key in _memory_cache:
+            _memory_cache.move_to_end(key)
+            return _memory_cache[key]
+
+        pending = _in_flight.get(key)
+        if pending is None:
+            pending = Future()
+            _in_flight[key] = pending
+            owner = True
+        else:
+            owner = False
+
+    if not owner:
+        return pending.result()
+
+    try:
+        coords = _lookup_offline(normalized)
+        if coords is None:
+            coords = _load_from_disk(key)
+        if coords is None:
+            coords = _query_nominatim(normalized)
+            if coords is not None:
+                _save_to_disk(key, coords)
+
+        with _cache_lock:
+            _remember(key, coords)
+        pending.set_result(coords)
+        return coords
+
+    except Exception as e:
+        pending.set_exception(e)
+        raise
+
+    finally:
+        with _cache_lock:
+            _in_flight.pop(key, None)
+
+
+def clear_memory_cache():
+    """Forget in-memory results (the disk cache is left alone)"""
+    with _cache_lock:
+        _memory_cache.clear()
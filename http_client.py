@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP session for the ArcGIS and geocoding APIs
+Keeps connections alive between requests and retries transient failures,
+and pages through ArcGIS layer queries
+"""
+
+import threading
+from typing import Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Connections kept open per host (enough for the parallel crime chunk fetches)
+POOL_SIZE = 10
+
+# Retry policy for transient server/network errors
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.5  # Sleeps 0.5s, 1s, 2s between attempts
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# ArcGIS paging: records per page, and a field giving every page the same order
+ARCGIS_PAGE_SIZE = 1000
+ARCGIS_ORDER_BY = 'OBJECTID ASC'
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def _build_session() -> requests.Session:
+    """Create a session with connection pooling and retry/backoff"""
+    retry = Retry(
+        total=MAX_RETRIES,
+        backoff_factor=BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(['GET']),
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=retry)
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Get the process-wide HTTP session
+
+    Returns:
+        Shared requests.Session (safe to use from multiple threads for GETs)
+    """
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def query_all_pages(url: str, params: Dict, page_size: int = ARCGIS_PAGE_SIZE,
+                    timeout: int = 30, progress: Optional[str] = None) -> List[Dict]:
+    """
+    Run an ArcGIS layer query and follow pagination until every record is fetched
+
+    Pages are ordered by ARCGIS_ORDER_BY (unless params set orderByFields)
+    so resultOffset paging never skips or repeats records.
+
+    Args:
+        url: Layer query URL
+        params: ArcGIS query parameters (paging parameters are added here)
+        page_size: Records requested per page
+        timeout: Per-request timeout in seconds
+        progress: If given, print a running count after each page
+            (e.g. "incidents" -> "Downloaded 2,000 incidents...")
+
+    Returns:
+        List of ArcGIS features (attributes, plus geometry if requested)
+
+    Raises:
+        requests.exceptions.RequestException: If any page fails, including
+            errors ArcGIS reports in the body of a 200 response
+    """
+    features = []
+    params = dict(params)
+    params.setdefault('orderByFields', ARCGIS_ORDER_BY)
+
+    while True:
+        page_params = dict(params, resultOffset=len(features), resultRecordCount=page_size)
+
+        response = get_session().get(url, params=page_params, timeout=timeout)
+        response.raise_for_status()
+        data = response.json()
+
+        if 'error' in data:
+            raise requests.exceptions.HTTPError(f"ArcGIS error: {data['error']}")
+
+        page = data.get('features', [])
+        features.extend(page)
+        if progress:
+            print(f"  Downloaded {len(features):,} {progress}...")
+
+        if not page or not data.get('exceededTransferLimit'):
+            return features
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Build the prefiltered school performance extracts from the GOSA CSVs
+Reads each statewide file once, types and normalizes the rows, and writes
+one extract per district (e.g. data/performance/extracts/clarke_county_extract.json)
+with the checksums of the files it was built from
+
+Usage:
+    python ingest_school_performance.py
+"""
+
+import os
+import sys
+
+from school_performance import build_performance_extracts, SOURCE_FILES, EXTRACT_DIRNAME, PERFORMANCE_DATA_DIR
+
+
+def main():
+    """Run the ingest"""
+    data_dir = PERFORMANCE_DATA_DIR
+
+    missing = [name for name in SOURCE_FILES if not os.path.exists(os.path.join(data_dir, name))]
+    if missing:
+        print(f"⚠️  Missing source files (skipped): {', '.join(missing)}")
+
+    try:
+        db = build_performance_extracts(data_dir)
+    except Exception as e:
+        print(f"❌ Ingest failed: {e}")
+        sys.exit(1)
+
+    total = sum(len(schools) for schools in db.districts.values())
+    print(f"✓ Extracts saved to {os.path.join(data_dir, EXTRACT_DIRNAME)} ({len(db.districts)} districts, {total} schools)")
+
+
+if __name__ == "__main__":
+    main()
@@ -31,6 +31,7 @@ ATHENS_CLARKE_CONFIG = CountyConfig(
     # Georgia school performance data
     state_school_performance_source="GOSA",  # Governor's Office of Student Achievement
     state_performance_api="https://gosa.georgia.gov/",
+    state_performance_district="Clarke County",  # SCHOOL_DSTRCT_NM in GOSA files
 
     # ===== CRIME & SAFETY =====
     crime_data_source="api",
@@ -42,6 +42,8 @@ class CountyConfig:
     # State-level school performance data
     state_school_performance_source: str = "unknown"  # e.g., "GOSA", "Virginia School Quality Profiles"
     state_performance_api: Optional[str] = None
+    state_performance_district: Optional[str] = None  # District name in the state data, e.g. "Clarke County"
+    state_performance_data_dir: Optional[str] = None  # State data directory (default: the Athens project's data/performance)
 
     # ===== CRIME & SAFETY =====
     crime_data_source: str = ""         # 'api', 'csv', 'manual'
@@ -16,6 +16,9 @@ Phase: 3 - School Data (Week 4)
 Status: Core implementation
 """
 
+import sys
+import importlib
+from pathlib import Path
 import requests
 from typing import Dict, Optional, List, Any
 from dataclasses import dataclass, field
@@ -23,6 +26,26 @@ from dataclasses import dataclass, field
 from config import CountyConfig, get_county_config
 
 
+# The Athens project this package lives in (provides the GOSA performance data)
+ATHENS_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _import_athens_module(name: str):
+    """
+    Import a module from the Athens project root.
+
+    Raises:
+        ImportError: If the module is not in the Athens project
+    """
+    root = str(ATHENS_PROJECT_ROOT)
+    if root not in sys.path:
+        sys.path.append(root)
+    try:
+        return importlib.import_module(name)
+    except ImportError as e:
+        raise ImportError(f"Athens module '{name}' not found under {root}: {e}") from e
+
+
 @dataclass
 class School:
     """
@@ -296,13 +319,44 @@ class SchoolLookup:
         Returns:
             Updated School object with performance metrics
 
+        Raises:
+            ImportError: If the Athens school_performance module is missing
+
         Note:
-            This would query state-level data sources like:
-            - Georgia GOSA for Athens
+            Georgia counties (state_school_performance_source="GOSA") are
+            served from the Athens project's per-district GOSA extracts
+            (school_performance.py), read from state_performance_data_dir
+            or the Athens data/performance directory. Other states are not
+            wired up yet:
             - Virginia School Quality Profiles for Loudoun
         """
-        # TODO: Implement state-level performance data lookup
-        # This would be a separate API call to state education department
+        if self.config.state_school_performance_source != "GOSA":
+            return school
+        if not self.config.state_performance_district:
+            return school
+
+        school_performance = _import_athens_module("school_performance")
+        data_dir = self.config.state_performance_data_dir or school_performance.PERFORMANCE_DATA_DIR
+
+        try:
+            perf = school_performance.get_school_performance(
+                school.name, district=self.config.state_performance_district, data_dir=data_dir
+            )
+        except Exception as e:
+            print(f"Error loading school performance: {e}")
+            return school
+
+        if perf is None:
+            return school
+
+        if perf.demographics and perf.demographics.total_enrollment:
+            school.enrollment = perf.demographics.total_enrollment
+        for score in perf.test_scores:
+            school.test_scores[score.subject] = score.total_proficient_pct
+        if perf.graduation_rate:
+            school.test_scores['graduation_rate'] = perf.graduation_rate
+        if perf.avg_sat_score:
+            school.test_scores['avg_sat_score'] = perf.avg_sat_score
 
         return school
 
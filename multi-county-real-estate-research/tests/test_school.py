@@ -7,13 +7,18 @@ Or: python tests/test_school.py
 Last Updated: November 2025
 """
 
+import os
+import csv
 import sys
+import tempfile
+from dataclasses import replace
 from pathlib import Path
+from unittest import mock
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config import get_county_config
-from core.school_lookup import SchoolLookup, School, SchoolAssignment
+from core.school_lookup import SchoolLookup, School, SchoolAssignment, _import_athens_module
 
 
 def test_school_dataclass():
@@ -144,6 +149,74 @@ def test_rural_and_suburban():
     print("  ✓ Same district serves rural and suburban areas")
 
 
+def _write_gosa_extract(data_dir):
+    """Write minimal GOSA CSVs, build the extracts, then drop the CSVs."""
+    school_performance = _import_athens_module("school_performance")
+    sources = {
+        "eog_2023-24.csv": [{
+            "LONG_SCHOOL_YEAR": "2023-24", "SCHOOL_DSTRCT_NM": "Clarke County",
+            "INSTN_NAME": "Barrow Elementary School", "ACDMC_LVL": "ALL GRADES",
+            "SUBGROUP_NAME": "All Students", "TEST_CMPNT_TYP_NM": "Mathematics",
+            "NUM_TESTED_CNT": "120", "PROFICIENT_PCT": "40.0", "DISTINGUISHED_PCT": "22.5",
+        }],
+        "enrollment_2023-24.csv": [{
+            "SCHOOL_DSTRCT_NM": "Clarke County", "INSTN_NAME": "Barrow Elementary School",
+            "DETAIL_LVL_DESC": "School", "ENROLL_TOTAL": "480",
+        }],
+    }
+    for name, rows in sources.items():
+        with open(os.path.join(data_dir, name), "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+
+    school_performance.build_performance_extracts(data_dir)
+    for name in sources:
+        os.remove(os.path.join(data_dir, name))
+
+
+def test_state_performance_enrichment():
+    """Test GOSA performance data is read from the configured district's extract."""
+    print("\nTesting state performance enrichment...")
+
+    athens = get_county_config("athens_clarke")
+    assert athens.state_performance_district == "Clarke County"
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        _write_gosa_extract(data_dir)
+        config = replace(athens, state_performance_data_dir=data_dir)
+
+        school = SchoolLookup(config).get_school_performance(
+            School(school_id="1", name="Barrow Elementary", school_type="Elementary")
+        )
+
+    # Loudoun is not a GOSA county
+    loudoun_school = School(school_id="2", name="Test Elementary", school_type="Elementary")
+    SchoolLookup(get_county_config("loudoun")).get_school_performance(loudoun_school)
+
+    assert school.enrollment == 480
+    assert school.test_scores == {"Mathematics": 62.5}
+    assert loudoun_school.enrollment is None
+    print("  ✓ Athens school enriched from a GOSA extract, Loudoun untouched")
+
+
+def test_missing_performance_module_fails_loudly():
+    """Test a missing Athens school_performance module raises instead of skipping."""
+    print("\nTesting missing performance module...")
+
+    athens = get_county_config("athens_clarke")
+    school = School(school_id="1", name="Barrow Elementary", school_type="Elementary")
+
+    with mock.patch.dict(sys.modules, {"school_performance": None}):
+        try:
+            SchoolLookup(athens).get_school_performance(school)
+        except ImportError as e:
+            assert "school_performance" in str(e)
+        else:
+            raise AssertionError("missing module was silently ignored")
+    print("  ✓ ImportError raised")
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("SCHOOL MODULE TESTS")
@@ -161,9 +234,11 @@ if __name__ == "__main__":
         test_athens_backward_compatibility()
         test_scalability()
         test_rural_and_suburban()
+        test_state_performance_enrichment()
+        test_missing_performance_module_fails_loudly()
 
         print("\n" + "=" * 60)
-        print("✅ ALL TESTS PASSED (8/8)")
+        print("✅ ALL TESTS PASSED (10/10)")
         print("=" * 60)
         print("\nSchool lookup infrastructure:")
         print("  - Dataclasses: ✅ Working")
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+In-memory cache of per-section address report results
+Lets the web app recompose a report from sections it already has (e.g. when
+only the section checkboxes change) instead of re-running every lookup and
+assistant call; each section expires on its data source's refresh schedule
+"""
+
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+from address_normalization import standardize_address_format
+from street_index_lookup import extract_address_parts, normalize_street_name
+
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+# How long each section stays valid, matching how often its source changes.
+# Assistant responses expire with the data they were written from.
+SECTION_TTL_SECONDS = {
+    'schools': 7 * DAY,           # Assignments and GOSA data change yearly
+    'school_response': 7 * DAY,
+    'crime': 24 * HOUR,           # Crime data is refreshed daily
+    'crime_response': 24 * HOUR,
+    'zoning': 30 * DAY,           # Parcel zoning changes rarely
+}
+
+# Entries kept before the least recently used are dropped
+REPORT_CACHE_MAX_ENTRIES = 1000
+
+
+def normalize_report_address(address: str) -> str:
+    """
+    Cache key form of an address
+
+    "150 Hancock Avenue" and "150 hancock ave, Athens, GA" share a key.
+    """
+    number, street = extract_address_parts(standardize_address_format(address))
+    street_key = normalize_street_name(street)
+    if number is None or not street_key:
+        return ' '.join(address.lower().split())
+    return f"{number} {street_key}"
+
+
+class ReportCache:
+    """
+    Thread-safe LRU of report sections with per-section TTLs
+
+    Keys are (normalized address, section, radius, months, question); leave
+    radius/months as None for sections that don't depend on them and
+    question as None for data (as opposed to assistant responses).
+
+    Usage:
+        >>> cache = ReportCache()
+        >>> crime = cache.get(address, 'crime', radius_miles=0.5, months_back=12)
+        >>> if crime is None:
+        ...     crime = analyze(...)
+        ...     cache.set(address, 'crime', crime, radius_miles=0.5, months_back=12)
+    """
+
+    def __init__(self, max_entries: int = REPORT_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(address: str, section: str, radius_miles, months_back, question) -> tuple:
+        if question is not None:
+            question = ' '.join(question.lower().split())
+        return (normalize_report_address(address), section, radius_miles, months_back, question)
+
+    def get(self, address: str, section: str, radius_miles: Optional[float] = None,
+            months_back: Optional[int] = None, question: Optional[str] = None) -> Any:
+        """
+        Look up a cached section
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        key = self._key(address, section, radius_miles, months_back, question)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            stored_at, value = entry
+            if time.monotonic() - stored_at > SECTION_TTL_SECONDS[section]:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, address: str, section: str, value: Any, radius_miles: Optional[float] = None,
+            months_back: Optional[int] = None, question: Optional[str] = None):
+        """Store a section result (None values are not cached)"""
+        if value is None:
+            return
+
+        key = self._key(address, section, radius_miles, months_back, question)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        """Forget every cached section"""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Disk-backed TTL cache for slow-changing API responses (e.g. parcel zoning)
+Entries are JSON files; once the cache grows past its size limit the least
+recently used ones are evicted in a batch
+
+Usage:
+    python response_cache.py --stats            # Show entries per cache
+    python response_cache.py --clear [name]     # Delete one cache (or all)
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import hashlib
+import threading
+from typing import Optional
+
+from atomic_file import atomic_write
+
+
+# All response caches live under this directory, one subdirectory per cache
+RESPONSE_CACHE_ROOT = "/tmp/athens_response_cache"
+
+# Defaults: parcel zoning changes rarely
+DEFAULT_TTL_DAYS = 30
+DEFAULT_MAX_ENTRIES = 5000
+
+# Eviction trims the cache to this fraction of max_entries, so the directory
+# is only scanned once per that many new entries
+EVICT_TO_FRACTION = 0.9
+
+
+class ResponseCache:
+    """
+    Named on-disk cache of JSON-serializable responses
+
+    Usage:
+        >>> cache = ResponseCache('zoning', ttl_days=30)
+        >>> data = cache.get(key)
+        >>> if data is None:
+        ...     data = fetch()
+        ...     cache.set(key, data)
+    """
+
+    def __init__(self, name: str, ttl_days: float = DEFAULT_TTL_DAYS,
+                 max_entries: int = DEFAULT_MAX_ENTRIES, root: Optional[str] = None):
+        """
+        Args:
+            name: Cache name (subdirectory under the cache root)
+            ttl_days: Entries older than this are treated as missing
+            max_entries: Least recently used entries are evicted beyond this
+            root: Cache root directory (default: RESPONSE_CACHE_ROOT)
+        """
+        self.name = name
+        self.ttl_seconds = ttl_days * 24 * 3600
+        self.max_entries = max_entries
+        self.directory = os.path.join(root or RESPONSE_CACHE_ROOT, name)
+        # Entry count, read from disk on first write and tracked after that
+        self._count = None
+        self._count_lock = threading.Lock()
+
+    def _path(self, key) -> str:
+        digest = hashlib.md5(json.dumps(key, sort_keys=True).encode()).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def get(self, key) -> Optional[dict]:
+        """
+        Look up a cached response
+
+        Args:
+            key: Any JSON-serializable key (e.g. a tuple of query parameters)
+
+        Returns:
+            Cached response, or None if missing or expired
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+        except Exception:
+            return None
+
+        if time.time() - entry.get('cached_at', 0) > self.ttl_seconds:
+            return None
+
+        # Touch the file so eviction treats it as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return entry.get('data')
+
+    def set(self, key, data: dict):
+        """Store a response (fails silently - caching is optional)"""
+        try:
+            path = self._path(key)
+            is_new = not os.path.exists(path)
+            with atomic_write(path) as f:
+                json.dump({'cached_at': time.time(), 'data': data}, f)
+
+            with self._count_lock:
+                if self._count is None:
+                    self._count = len(self)
+                elif is_new:
+                    self._count += 1
+
+                if self._count > self.max_entries:
+                    self._count = self._evict(int(self.max_entries * EVICT_TO_FRACTION))
+        except Exception:
+            pass
+
+    def _evict(self, keep: int) -> int:
+        """
+        Delete least recently used entries until at most keep remain
+
+        Returns:
+            Number of entries left
+        """
+        entries = [os.path.join(self.directory, name)
+                   for name in os.listdir(self.directory) if name.endswith('.json')]
+        excess = len(entries) - keep
+        if excess <= 0:
+            return len(entries)
+
+        entries.sort(key=os.path.getmtime)
+        for path in entries[:excess]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        return keep
+
+    def __len__(self) -> int:
+        try:
+            return sum(1 for name in os.listdir(self.directory) if name.endswith('.json'))
+        except OSError:
+            return 0
+
+    def clear(self):
+        """Delete every entry in this cache"""
+        shutil.rmtree(self.directory, ignore_errors=True)
+        with self._count_lock:
+            self._count = 0
+
+
+def main():
+    """Show or clear response caches"""
+    names = sorted(os.listdir(RESPONSE_CACHE_ROOT)) if os.path.isdir(RESPONSE_CACHE_ROOT) else []
+
+    if '--clear' in sys.argv:
+        args = sys.argv[sys.argv.index('--clear') + 1:]
+        targets = args or names
+        for name in targets:
+            ResponseCache(name).clear()
+            print(f"✓ Cleared {name} cache")
+        if not targets:
+            print("No response caches to clear")
+        return
+
+    if not names:
+        print(f"No response caches in {RESPONSE_CACHE_ROOT}")
+    for name in names:
+        print(f"{name}: {len(ResponseCache(name)):,} entries")
+
+
+if __name__ == "__main__":
+    main()
@@ -21,8 +21,8 @@ except ImportError:
     print("Warning: shapely not installed. Install with: pip install shapely")
 
 try:
-    from geopy.geocoders import Nominatim
     from geopy.exc import GeocoderTimedOut, GeocoderServiceError
+    from geocoding import geocode
     GEOPY_AVAILABLE = True
 except ImportError:
     GEOPY_AVAILABLE = False
@@ -131,7 +131,7 @@ class SchoolDistrictLookup:
 
         # Initialize geocoder
         if GEOPY_AVAILABLE:
-            self.geocoder = Nominatim(user_agent="athens_school_lookup")
+            self.geocoder = geocode  # Shared, cached geocoder
         else:
             self.geocoder = None
             print("Warning: Geocoding not available. Install geopy.")
@@ -183,14 +183,11 @@ class SchoolDistrictLookup:
             print("Geocoder not available")
             return None
 
-        # Add Athens, GA if not already included
-        if 'athens' not in address.lower():
-            address = f"{address}, Athens, GA"
-
         try:
-            location = self.geocoder.geocode(address, timeout=10)
-            if location:
-                return (location.latitude, location.longitude)
+            # Normalizes the address and adds Athens, GA if not already included
+            coords = self.geocoder(address)
+            if coords:
+                return coords
             else:
                 print(f"Could not geocode address: {address}")
                 return None
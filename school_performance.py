@@ -2,13 +2,105 @@
 """
 Georgia School Performance Data
 Data from GOSA (Governor's Office of Student Achievement)
+
+The statewide CSVs are split into one compact extract per district in a
+single pass by ingest_school_performance.py; at runtime a district's extract
+is read on first use instead of the CSVs whenever it is current.
 """
 
 import csv
 import os
-from typing import Dict, List, Optional
-from dataclasses import dataclass, field
+import re
+import json
+import threading
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field, asdict
 from collections import defaultdict
+from functools import lru_cache
+
+from atomic_file import atomic_write
+from file_signature import file_signature, signature_matches
+
+
+# GOSA source files and extracts, next to this module (not the working directory)
+PERFORMANCE_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "performance")
+
+# GOSA source files (under PERFORMANCE_DATA_DIR) the extract is built from
+SOURCE_FILES = [
+    'eog_2023-24.csv',
+    'eoc_2023-24.csv',
+    'enrollment_2023-24.csv',
+    'graduation_2023-24.csv',
+    'sat_2023-24.csv',
+]
+
+# District served when none is given (GOSA SCHOOL_DSTRCT_NM)
+DEFAULT_DISTRICT = "Clarke County"
+
+# Per-district extracts live in this subdirectory of the data directory
+EXTRACT_DIRNAME = "extracts"
+
+# Bump when the extract layout changes so old extracts are rebuilt
+EXTRACT_VERSION = 2
+
+
+# Name variants expanded before suffixes are stripped
+_NAME_VARIANTS = {
+    'johnnie l': 'johnnie lay burks',
+    'bettye h': 'bettye henderson holston',
+}
+_NAME_VARIANT_RE = re.compile(r'(johnnie l|bettye h)\.? (?:burks|holston)')
+
+# School-type suffixes removed to allow flexible matching (longer forms first)
+_SCHOOL_SUFFIX_RE = re.compile(
+    r' (?:elementary school|middle school|high school|elem school'
+    r'|elementary|middle|high|elem|ms|hs|school)'
+)
+
+# Street index school names (normalized) that differ from GOSA's, per
+# district. None marks schools GOSA has no data for yet (new or renamed).
+SCHOOL_NAME_ALIASES: Dict[str, Dict[str, Optional[str]]] = {
+    'Clarke County': {
+        'b-h-l': 'burney-harris-lyons',
+        'bhl': 'burney-harris-lyons',
+        'stroud': 'howard b. stroud',
+        'jj harris': 'judia jackson harris',
+        'whit davis': 'whit davis road',
+        'cleveland': 'cleveland road',
+        'fowler': 'fowler drive',
+        'oglethorpe': 'oglethorpe avenue',
+        'whitehead': 'whitehead road',
+        'elementary c': None,
+        'maxine pinson easom': None,
+    },
+}
+
+
+@lru_cache(maxsize=4096)
+def normalize_school_name(name: str) -> str:
+    """
+    Normalize a school name for lookup
+
+    Lowercases, expands known name variants and strips "Elementary School",
+    "Middle", "HS" and similar suffixes, so "Barrow Elementary School" and
+    "Barrow" share a key.
+
+    Args:
+        name: School name as written in GOSA data or the street index
+
+    Returns:
+        Normalized name
+    """
+    normalized = name.lower().strip()
+    normalized = _NAME_VARIANT_RE.sub(lambda m: _NAME_VARIANTS[m.group(1)], normalized)
+    normalized = _SCHOOL_SUFFIX_RE.sub('', normalized)
+    return normalized.strip()
+
+
+def extract_filename(district: str) -> str:
+    """Extract file name for a district (e.g. "clarke_county_extract.json")"""
+    slug = re.sub(r'[^a-z0-9]+', '_', district.lower()).strip('_')
+    return f"{slug}_extract.json"
 
 
 @dataclass
@@ -59,12 +151,104 @@ class SchoolPerformance:
 
 
 class SchoolPerformanceDB:
-    """Database of school performance data"""
+    """Database of school performance data for one district (or all of them)"""
 
-    def __init__(self, data_dir: str = "data/performance"):
+    def __init__(self, data_dir: str = PERFORMANCE_DATA_DIR, use_extract: bool = True,
+                 district: Optional[str] = DEFAULT_DISTRICT):
+        """
+        Args:
+            data_dir: Directory with the GOSA CSVs (and the extracts)
+            use_extract: Read the district's extract when it is current
+                (False always parses the CSVs)
+            district: GOSA district name, or None to load every district
+                (CSV only; used by the ingest)
+        """
         self.data_dir = data_dir
-        self.schools = {}  # {school_name: SchoolPerformance}
-        self._load_data()
+        self.district = district
+        self.districts = {}  # {district: {school_name: SchoolPerformance}}
+        self.schools = {}  # {school_name: SchoolPerformance} for self.district
+        if district is not None:
+            self.districts[district] = self.schools
+
+        if not (use_extract and district is not None and self._load_extract()):
+            self._load_data()
+
+    @property
+    def extract_path(self) -> str:
+        return os.path.join(self.data_dir, EXTRACT_DIRNAME, extract_filename(self.district))
+
+    def _district_schools(self, district: str, create: bool = False) -> Optional[Dict[str, SchoolPerformance]]:
+        """
+        Schools dict for a CSV row's district, or None if it isn't being loaded
+
+        When loading every district, only test score rows (create=True) add
+        a district; the other files just enrich schools already found.
+        """
+        if self.district is None:
+            return self.districts.setdefault(district, {}) if create else self.districts.get(district)
+        return self.schools if district == self.district else None
+
+    def _source_signatures(self) -> Dict[str, Optional[Dict]]:
+        return {name: file_signature(os.path.join(self.data_dir, name)) for name in SOURCE_FILES}
+
+    def _load_extract(self) -> bool:
+        """
+        Load schools from the prefiltered extract
+
+        Returns:
+            True if loaded; False if the extract is missing, unreadable, or
+            older than a source CSV that is present
+        """
+        try:
+            with open(self.extract_path, 'r') as f:
+                extract = json.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            print(f"⚠️  Could not read school performance extract: {e}")
+            return False
+
+        if extract.get('version') != EXTRACT_VERSION or extract.get('district') != self.district:
+            return False
+
+        for name, signature in extract.get('sources', {}).items():
+            path = os.path.join(self.data_dir, name)
+            # A deployment may ship the extract without the statewide CSVs
+            if os.path.exists(path) and not signature_matches(path, signature):
+                return False
+
+        self.schools.update(
+            (key, _school_from_dict(record)) for key, record in extract['schools'].items()
+        )
+        print(f"Loaded data for {len(self.schools)} schools")
+        return True
+
+    def save_extracts(self) -> List[str]:
+        """
+        Write each loaded district as a compact extract, with source signatures
+
+        Returns:
+            Paths of the extracts
+        """
+        sources = self._source_signatures()
+        paths = []
+
+        extract_dir = os.path.join(self.data_dir, EXTRACT_DIRNAME)
+
+        for district, schools in self.districts.items():
+            path = os.path.join(extract_dir, extract_filename(district))
+            extract = {
+                'version': EXTRACT_VERSION,
+                'district': district,
+                'sources': sources,
+                'schools': {key: asdict(school) for key, school in schools.items()},
+            }
+
+            with atomic_write(path) as f:
+                json.dump(extract, f, separators=(',', ':'))
+            paths.append(path)
+
+        return paths
 
     def _load_data(self):
         """Load all performance data from CSV files"""
@@ -85,47 +269,11 @@ class SchoolPerformanceDB:
         # Analyze and add achievements/concerns
         self._analyze_performance()
 
-        print(f"Loaded data for {len(self.schools)} schools")
+        print(f"Loaded data for {sum(len(schools) for schools in self.districts.values())} schools")
 
     def _normalize_school_name(self, name: str) -> str:
-        """Normalize school name for lookup"""
-        # Remove "Elementary School", "Middle School", "High School" suffixes
-        # to allow flexible matching
-        normalized = name.lower().strip()
-
-        # Standardize common name variations
-        name_variations = {
-            'johnnie l. burks': 'johnnie lay burks',
-            'johnnie l burks': 'johnnie lay burks',
-            'bettye h. holston': 'bettye henderson holston',
-            'bettye h holston': 'bettye henderson holston',
-        }
-
-        for variant, standard in name_variations.items():
-            if variant in normalized:
-                normalized = normalized.replace(variant, standard)
-
-        # Standardize common variations
-        # Note: Order matters - check longer strings first
-        replacements = [
-            (' elementary school', ''),
-            (' middle school', ''),
-            (' high school', ''),
-            (' elem school', ''),
-            (' elementary', ''),
-            (' middle', ''),
-            (' high', ''),
-            (' elem', ''),
-            (' ms', ''),
-            (' hs', ''),
-            (' school', ''),
-        ]
-
-        for old, new in replacements:
-            if old in normalized:
-                normalized = normalized.replace(old, new)
-
-        return normalized.strip()
+        """Normalize school name for lookup (see normalize_school_name)"""
+        return normalize_school_name(name)
 
     def _load_test_scores(self):
         """Load Georgia Milestones test scores"""
@@ -137,21 +285,22 @@ class SchoolPerformanceDB:
             with open(filepath, 'r') as f:
                 reader = csv.DictReader(f)
                 for row in reader:
-                    # Filter for Clarke County and "All Students" subgroup
-                    if row['SCHOOL_DSTRCT_NM'] != 'Clarke County':
-                        continue
+                    # Filter for the district(s) and "All Students" subgroup
                     if row['SUBGROUP_NAME'] != 'All Students':
                         continue
                     if row['ACDMC_LVL'] != 'ALL GRADES':
                         continue
+                    schools = self._district_schools(row['SCHOOL_DSTRCT_NM'], create=True)
+                    if schools is None:
+                        continue
 
                     school_name = row['INSTN_NAME']
                     normalized_name = self._normalize_school_name(school_name)
 
                     # Initialize school if not exists
-                    if normalized_name not in self.schools:
+                    if normalized_name not in schools:
                         level = self._determine_school_level(school_name)
-                        self.schools[normalized_name] = SchoolPerformance(
+                        schools[normalized_name] = SchoolPerformance(
                             school_name=school_name,
                             district_name=row['SCHOOL_DSTRCT_NM'],
                             school_level=level
@@ -172,7 +321,7 @@ class SchoolPerformanceDB:
                             total_proficient_pct=prof_pct + dist_pct
                         )
 
-                        self.schools[normalized_name].test_scores.append(score)
+                        schools[normalized_name].test_scores.append(score)
                     except (ValueError, KeyError):
                         continue
 
@@ -185,15 +334,16 @@ class SchoolPerformanceDB:
         with open(filepath, 'r') as f:
             reader = csv.DictReader(f)
             for row in reader:
-                if row['SCHOOL_DSTRCT_NM'] != 'Clarke County':
-                    continue
                 if row['DETAIL_LVL_DESC'] != 'School':
                     continue
+                schools = self._district_schools(row['SCHOOL_DSTRCT_NM'])
+                if not schools:
+                    continue
 
                 school_name = row['INSTN_NAME']
                 normalized_name = self._normalize_school_name(school_name)
 
-                if normalized_name not in self.schools:
+                if normalized_name not in schools:
                     continue
 
                 # Parse demographics
@@ -213,7 +363,7 @@ class SchoolPerformanceDB:
                     # Total enrollment
                     demo.total_enrollment = int(float(row.get('ENROLL_TOTAL', 0) or 0))
 
-                    self.schools[normalized_name].demographics = demo
+                    schools[normalized_name].demographics = demo
                 except (ValueError, KeyError):
                     continue
 
@@ -226,22 +376,23 @@ class SchoolPerformanceDB:
         with open(filepath, 'r') as f:
             reader = csv.DictReader(f)
             for row in reader:
-                if row['SCHOOL_DSTRCT_NM'] != 'Clarke County':
-                    continue
                 if row['DETAIL_LVL_DESC'] != 'School':
                     continue
                 if row['LABEL_LVL_1_DESC'] != 'Grad Rate -ALL Students':
                     continue
+                schools = self._district_schools(row['SCHOOL_DSTRCT_NM'])
+                if not schools:
+                    continue
 
                 school_name = row['INSTN_NAME']
                 normalized_name = self._normalize_school_name(school_name)
 
-                if normalized_name not in self.schools:
+                if normalized_name not in schools:
                     continue
 
                 try:
                     grad_rate = float(row.get('PROGRAM_RATE', 0) or 0)
-                    self.schools[normalized_name].graduation_rate = grad_rate
+                    schools[normalized_name].graduation_rate = grad_rate
                 except (ValueError, KeyError):
                     continue
 
@@ -254,22 +405,23 @@ class SchoolPerformanceDB:
         with open(filepath, 'r') as f:
             reader = csv.DictReader(f)
             for row in reader:
-                if row['SCHOOL_DSTRCT_NM'] != 'Clarke County':
-                    continue
                 if row['SUBGRP_DESC'] != 'All Students':
                     continue
                 if row['TEST_CMPNT_TYP_CD'] != 'SAT_TOTAL':
                     continue
+                schools = self._district_schools(row['SCHOOL_DSTRCT_NM'])
+                if not schools:
+                    continue
 
                 school_name = row['INSTN_NAME']
                 normalized_name = self._normalize_school_name(school_name)
 
-                if normalized_name not in self.schools:
+                if normalized_name not in schools:
                     continue
 
                 try:
                     avg_score = int(float(row.get('AVG_SCORE', 0) or 0))
-                    self.schools[normalized_name].avg_sat_score = avg_score
+                    schools[normalized_name].avg_sat_score = avg_score
                 except (ValueError, KeyError):
                     continue
 
@@ -286,7 +438,7 @@ class SchoolPerformanceDB:
 
     def _analyze_performance(self):
         """Analyze performance and add achievements/concerns"""
-        for school in self.schools.values():
+        for school in (s for schools in self.districts.values() for s in schools.values()):
             # Analyze test scores
             if school.test_scores:
                 avg_proficiency = sum(s.total_proficient_pct for s in school.test_scores) / len(school.test_scores)
@@ -328,6 +480,11 @@ class SchoolPerformanceDB:
             SchoolPerformance object or None if not found
         """
         normalized = self._normalize_school_name(school_name)
+        if normalized not in self.schools:
+            aliases = SCHOOL_NAME_ALIASES.get(self.district, {})
+            normalized = aliases.get(normalized, normalized)
+            if normalized is None:
+                return None
         return self.schools.get(normalized)
 
     def list_schools(self) -> List[str]:
@@ -335,24 +492,69 @@ class SchoolPerformanceDB:
         return [school.school_name for school in self.schools.values()]
 
 
-# Global instance
-_db = None
+def _school_from_dict(record: Dict) -> SchoolPerformance:
+    """Rebuild a SchoolPerformance from its extract record"""
+    record = dict(record)
+    record['test_scores'] = [TestScores(**score) for score in record.get('test_scores', [])]
+    if record.get('demographics') is not None:
+        record['demographics'] = Demographics(**record['demographics'])
+    return SchoolPerformance(**record)
+
 
-def get_school_performance(school_name: str) -> Optional[SchoolPerformance]:
+def build_performance_extracts(data_dir: str = PERFORMANCE_DATA_DIR) -> SchoolPerformanceDB:
+    """
+    Parse the GOSA CSVs once and write an extract for every district in them
+
+    Returns:
+        The all-district database built from the CSVs
+    """
+    db = SchoolPerformanceDB(data_dir, use_extract=False, district=None)
+    db.save_extracts()
+    return db
+
+
+# Per-district databases, loaded on first use, keyed by (district, data_dir)
+_dbs: Dict[Tuple[str, str], SchoolPerformanceDB] = {}
+_dbs_lock = threading.Lock()
+
+
+def get_performance_db(district: str = DEFAULT_DISTRICT,
+                       data_dir: str = PERFORMANCE_DATA_DIR) -> SchoolPerformanceDB:
+    """
+    Get the performance database for one district
+
+    Args:
+        district: GOSA district name (e.g. "Clarke County", "Oconee County")
+        data_dir: Directory with the GOSA CSVs and extracts
+
+    Returns:
+        SchoolPerformanceDB for the district (empty if GOSA has no data for it)
+    """
+    key = (district, data_dir)
+    db = _dbs.get(key)
+    if db is None:
+        with _dbs_lock:
+            db = _dbs.get(key)
+            if db is None:
+                db = SchoolPerformanceDB(data_dir, district=district)
+                _dbs[key] = db
+    return db
+
+
+def get_school_performance(school_name: str, district: str = DEFAULT_DISTRICT,
+                           data_dir: str = PERFORMANCE_DATA_DIR) -> Optional[SchoolPerformance]:
     """
     Get performance data for a school
 
     Args:
         school_name: Name of the school
+        district: GOSA district name (default: Clarke County)
+        data_dir: Directory with the GOSA CSVs and extracts
 
     Returns:
         SchoolPerformance object with test scores, demographics, etc.
     """
-    global _db
-    if _db is None:
-        _db = SchoolPerformanceDB()
-
-    return _db.get_school_performance(school_name)
+    return get_performance_db(district, data_dir).get_school_performance(school_name)
 
 
 def format_performance_report(perf: SchoolPerformance) -> str:
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Uniform grid spatial index for point data (crime incidents, parcel centroids)
+Radius and nearest-neighbor queries only touch the grid cells near the query
+point, so their cost scales with the number of hits, not the dataset size
+"""
+
+import math
+from typing import Optional, Tuple, Iterator
+
+import numpy as np
+
+from geo_distance import haversine_many
+
+
+# Miles per degree of latitude (close enough everywhere in Georgia)
+MILES_PER_DEGREE_LAT = 69.0
+
+# Default grid cell edge length; a 0.5-mile radius query touches ~25 cells
+DEFAULT_CELL_MILES = 0.25
+
+
+class PointGridIndex:
+    """
+    Grid index over lat/lon points with optional time ordering
+
+    Points are bucketed into square cells on an equirectangular projection.
+    Within each cell, points are sorted by their time value (if given), so a
+    time window becomes a binary search inside each visited cell.
+
+    Usage:
+        >>> index = PointGridIndex(lats, lons, times=date_ms)
+        >>> idx, dist = index.query_radius(33.958, -83.375, 0.5, start=t0, end=t1)
+        >>> idx, dist = index.k_nearest(33.958, -83.375, k=10)
+    """
+
+    def __init__(self, lats, lons, times=None, cell_miles: float = DEFAULT_CELL_MILES):
+        """
+        Build the index
+
+        Args:
+            lats: Array of latitudes
+            lons: Array of longitudes
+            times: Optional array of sortable time values (e.g. epoch ms)
+            cell_miles: Grid cell edge length in miles
+        """
+        self.lats = np.asarray(lats, dtype=np.float64)
+        self.lons = np.asarray(lons, dtype=np.float64)
+        self.times = None if times is None else np.asarray(times)
+        self.cell_miles = cell_miles
+
+        ref_lat = float(np.mean(self.lats)) if len(self.lats) else 0.0
+        self._miles_per_degree_lon = MILES_PER_DEGREE_LAT * math.cos(math.radians(ref_lat))
+
+        ix, iy = self._cell_coords(self.lats, self.lons)
+        if len(ix):
+            self._ix_min, self._ix_max = int(ix.min()), int(ix.max())
+            self._iy_min, self._iy_max = int(iy.min()), int(iy.max())
+        else:
+            self._ix_min = self._iy_min = 0
+            self._ix_max = self._iy_max = -1
+
+        keys = self._cell_key(ix, iy)
+
+        # Sort by cell, then by time within each cell
+        if self.times is None:
+            self._order = np.argsort(keys, kind='stable')
+            self._sorted_times = None
+        else:
+            self._order = np.lexsort((self.times, keys))
+            self._sorted_times = self.times[self._order]
+
+        sorted_keys = keys[self._order]
+        unique_keys, starts = np.unique(sorted_keys, return_index=True)
+        ends = np.append(starts[1:], len(sorted_keys))
+        self._cell_spans = dict(zip(unique_keys.tolist(), zip(starts.tolist(), ends.tolist())))
+
+    def __len__(self) -> int:
+        return len(self.lats)
+
+    def _cell_coords(self, lats, lons) -> Tuple[np.ndarray, np.ndarray]:
+        """Integer grid coordinates for points"""
+        ix = np.floor(np.asarray(lons) * self._miles_per_degree_lon / self.cell_miles).astype(np.int64)
+        iy = np.floor(np.asarray(lats) * MILES_PER_DEGREE_LAT / self.cell_miles).astype(np.int64)
+        return ix, iy
+
+    def _cell_key(self, ix, iy):
+        """Flatten grid coordinates to a single integer key"""
+        height = self._iy_max - self._iy_min + 1
+        return (ix - self._ix_min) * height + (iy - self._iy_min)
+
+    def _occupied(self, ix: int, iy: int) -> Optional[int]:
+        """Key of a cell if it holds any points, else None"""
+        if not (self._ix_min <= ix <= self._ix_max and self._iy_min <= iy <= self._iy_max):
+            return None
+        key = int(self._cell_key(ix, iy))
+        return key if key in self._cell_spans else None
+
+    def _cells_in_box(self, ix0: int, ix1: int, iy0: int, iy1: int) -> Iterator[int]:
+        """Keys of occupied cells inside an (inclusive) cell box"""
+        for ix in range(max(ix0, self._ix_min), min(ix1, self._ix_max) + 1):
+            for iy in range(max(iy0, self._iy_min), min(iy1, self._iy_max) + 1):
+                key = self._occupied(ix, iy)
+                if key is not None:
+                    yield key
+
+    def _cells_on_ring(self, cx: int, cy: int, ring: int) -> Iterator[int]:
+        """Keys of occupied cells exactly `ring` cells away from (cx, cy)"""
+        if ring == 0:
+            coords = [(cx, cy)]
+        else:
+            coords = [(cx + dx, cy + dy) for dx in range(-ring, ring + 1) for dy in (-ring, ring)]
+            coords += [(cx + dx, cy + dy) for dx in (-ring, ring) for dy in range(-ring + 1, ring)]
+
+        for ix, iy in coords:
+            key = self._occupied(ix, iy)
+            if key is not None:
+                yield key
+
+    def _gather(self, keys, start=None, end=None) -> np.ndarray:
+        """Point indices in the given cells, restricted to a time window"""
+        parts = []
+        for key in keys:
+            cell_start, cell_end = self._cell_spans[key]
+            lo, hi = cell_start, cell_end
+            if self._sorted_times is not None:
+                cell_times = self._sorted_times[cell_start:cell_end]
+                if start is not None:
+                    lo = cell_start + int(np.searchsorted(cell_times, start, side='left'))
+                if end is not None:
+                    hi = cell_start + int(np.searchsorted(cell_times, end, side='right'))
+            if hi > lo:
+                parts.append(self._order[lo:hi])
+
+        if not parts:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate(parts)
+
+    def query_radius(self, lat: float, lon: float, miles: float,
+                     start=None, end=None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find all points within a radius (and optional time window)
+
+        Args:
+            lat: Center latitude
+            lon: Center longitude
+            miles: Search radius in miles
+            start: Earliest time value, inclusive (requires times)
+            end: Latest time value, inclusive (requires times)
+
+        Returns:
+            Tuple of (point indices, distances in miles), unordered
+        """
+        lat_span = miles / MILES_PER_DEGREE_LAT
+        lon_span = miles / self._miles_per_degree_lon
+        (ix0, ix1), (iy0, iy1) = self._cell_coords(
+            [lat - lat_span, lat + lat_span], [lon - lon_span, lon + lon_span]
+        )
+
+        candidates = self._gather(self._cells_in_box(int(ix0), int(ix1), int(iy0), int(iy1)), start, end)
+        distances = haversine_many((lat, lon), self.lats[candidates], self.lons[candidates])
+
+        within = distances <= miles
+        return candidates[within], distances[within]
+
+    def k_nearest(self, lat: float, lon: float, k: int,
+                  start=None, end=None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the k points nearest to a location (and optional time window)
+
+        Searches outward one ring of cells at a time and stops once no
+        unvisited cell can contain a closer point.
+
+        Args:
+            lat: Query latitude
+            lon: Query longitude
+            k: Number of neighbors to return
+            start: Earliest time value, inclusive (requires times)
+            end: Latest time value, inclusive (requires times)
+
+        Returns:
+            Tuple of (point indices, distances in miles), nearest first
+        """
+        if k <= 0 or len(self) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+
+        cx, cy = (int(c[0]) for c in self._cell_coords([lat], [lon]))
+        max_ring = max(abs(cx - self._ix_min), abs(cx - self._ix_max),
+                       abs(cy - self._iy_min), abs(cy - self._iy_max))
+
+        found = []
+        found_distances = []
+        best_indices = np.empty(0, dtype=np.int64)
+        best_distances = np.empty(0)
+
+        for ring in range(max_ring + 1):
+            candidates = self._gather(self._cells_on_ring(cx, cy, ring), start, end)
+            if len(candidates):
+                found.append(candidates)
+                found_distances.append(haversine_many((lat, lon), self.lats[candidates], self.lons[candidates]))
+
+                all_indices = np.concatenate(found)
+                all_distances = np.concatenate(found_distances)
+                nearest = np.argsort(all_distances, kind='stable')[:k]
+                best_indices, best_distances = all_indices[nearest], all_distances[nearest]
+
+            # Anything in an unvisited ring is at least ring * cell_miles away
+            if len(best_indices) >= k and best_distances[-1] <= ring * self.cell_miles:
+                break
+
+        return best_indices, best_distances
@@ -23,6 +23,8 @@ from zoning_lookup import (
 )
 from unified_ai_assistant import UnifiedAIAssistant
 from address_extraction import extract_address_from_query
+from warm_start import warm_up, format_timings
+from report_cache import ReportCache
 from crime_visualizations import (
     create_category_chart_data,
     create_trend_chart_data,
@@ -42,6 +44,29 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
+
+# Shared resources, created once per server process (not per browser session)
+@st.cache_resource(show_spinner="Loading local data...")
+def get_warm_up_timings():
+    """Load shared indexes and clients once per server process"""
+    timings = warm_up()
+    print("✓ Warm start complete\n" + format_timings(timings))
+    return timings
+
+
+@st.cache_resource
+def get_unified_assistant(api_key: str) -> UnifiedAIAssistant:
+    """
+    One assistant (and its API clients) shared by every session
+
+    Its report cache lets repeat searches and section toggles reuse earlier
+    lookups and answers; only the synthesis is regenerated.
+    """
+    return UnifiedAIAssistant(api_key=api_key, result_cache=ReportCache())
+
+
+warm_up_timings = get_warm_up_timings()
+
 # Custom CSS for professional styling
 st.markdown("""
 <style>
@@ -295,7 +320,7 @@ if not api_key:
 # Initialize session state
 if 'unified_assistant' not in st.session_state:
     try:
-        st.session_state.unified_assistant = UnifiedAIAssistant(api_key=api_key)
+        st.session_state.unified_assistant = get_unified_assistant(api_key)
         st.session_state.api_ready = True
     except Exception as e:
         st.session_state.api_ready = False
@@ -1101,6 +1126,10 @@ if search_button:
                     with st.expander("🔧 Technical Details (for debugging)"):
                         st.code(traceback.format_exc())
 
+# Warm-up timings for this server process
+with st.expander("⚙️ Server warm-up"):
+    st.code(format_timings(warm_up_timings))
+
 # Footer
 st.markdown("""
 <div class="footer">
@@ -2,14 +2,24 @@
 """
 Athens-Clarke County School District Lookup using Street Index
 Much more accurate than geocoding + GIS boundaries!
+
+The index is loaded on first lookup, from the precompiled
+data/street_index.pkl when it matches data/street_index.json (built by
+extract_full_street_index.py), otherwise from the JSON itself.
 """
 
 import re
 import json
 import os
+import sys
+import pickle
+import threading
+from bisect import bisect_right
 from typing import Optional, Tuple, Dict, List
 from dataclasses import dataclass
 from address_normalization import standardize_address_format
+from atomic_file import atomic_write
+from file_signature import file_signature, signature_matches
 
 
 @dataclass
@@ -47,8 +57,280 @@ def load_street_index(data_dir: str = "data") -> Dict[str, List[Tuple]]:
     return street_index
 
 
-# Load the full street index from JSON
-STREET_INDEX = load_street_index()
+# Precompiled index artifact, written next to the JSON by the build step
+COMPILED_INDEX_FILENAME = "street_index.pkl"
+
+
+def save_compiled_index(data_dir: str = "data") -> str:
+    """
+    Compile data/street_index.json into the binary artifact
+
+    Stores the tuple-form index plus its compiled house-number intervals,
+    so loading skips JSON parsing and rule compilation.
+
+    Returns:
+        Path of the written artifact
+    """
+    json_path = os.path.join(data_dir, "street_index.json")
+    output_path = os.path.join(data_dir, COMPILED_INDEX_FILENAME)
+
+    street_index = load_street_index(data_dir)
+    payload = {
+        'source': file_signature(json_path),
+        'streets': street_index,
+        'compiled': compile_street_index(street_index),
+    }
+
+    with atomic_write(output_path, 'wb') as f:
+        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    return output_path
+
+
+def _load_compiled_index(data_dir: str) -> Optional[Tuple[Dict, Dict]]:
+    """
+    Load the binary artifact if it is present and current
+
+    Returns:
+        Tuple of (street index, compiled intervals), or None if missing,
+        unreadable or built from a different JSON
+    """
+    json_path = os.path.join(data_dir, "street_index.json")
+    compiled_path = os.path.join(data_dir, COMPILED_INDEX_FILENAME)
+
+    if not os.path.exists(compiled_path) or not os.path.exists(json_path):
+        return None
+
+    try:
+        with open(compiled_path, 'rb') as f:
+            payload = pickle.load(f)
+        if not signature_matches(json_path, payload['source']):
+            return None
+        return payload['streets'], payload['compiled']
+    except Exception as e:
+        print(f"⚠️  Could not load compiled street index: {e}")
+        return None
+
+
+# Parity codes for compiled rules
+ANY_PARITY, EVEN_ONLY, ODD_ONLY = None, 0, 1
+
+# Upper bound standing in for "no limit" in compiled rules
+NO_UPPER_LIMIT = sys.maxsize
+
+
+def parse_parameters(parameters: str) -> Tuple[int, int, Optional[int]]:
+    """
+    Parse a street index parameters string into a house-number rule
+
+    Mirrors check_parameters exactly, including its precedence: "and below"
+    and "and above" ignore odd/even, and unparseable text matches everything.
+
+    Args:
+        parameters: Parameters text (e.g., "337 to 475, odd")
+
+    Returns:
+        Tuple of (low, high, parity) with inclusive bounds; parity is
+        ANY_PARITY, EVEN_ONLY or ODD_ONLY
+    """
+    if not parameters:
+        return (0, NO_UPPER_LIMIT, ANY_PARITY)
+
+    params_lower = parameters.lower()
+
+    match = re.search(r'(\d+)\s+and\s+below', params_lower)
+    if match:
+        return (0, int(match.group(1)), ANY_PARITY)
+
+    match = re.search(r'(\d+)\s+and\s+above', params_lower)
+    if match:
+        return (int(match.group(1)), NO_UPPER_LIMIT, ANY_PARITY)
+
+    match = re.search(r'(\d+)\s+to\s+(\d+)', params_lower)
+    if match:
+        low, high = int(match.group(1)), int(match.group(2))
+        if 'odd' in params_lower:
+            return (low, high, ODD_ONLY)
+        elif 'even' in params_lower:
+            return (low, high, EVEN_ONLY)
+        return (low, high, ANY_PARITY)
+
+    if 'odd' in params_lower and 'even' not in params_lower:
+        return (0, NO_UPPER_LIMIT, ODD_ONLY)
+
+    if 'even' in params_lower and 'odd' not in params_lower:
+        return (0, NO_UPPER_LIMIT, EVEN_ONLY)
+
+    return (0, NO_UPPER_LIMIT, ANY_PARITY)
+
+
+def compile_street_rules(entries: List[Tuple]) -> Tuple[List[int], List[Tuple[Optional[int], Optional[int]]]]:
+    """
+    Compile one street's entries into disjoint house-number intervals
+
+    The number line is split at every rule boundary. For each interval the
+    first entry (in index order) matching even numbers and the first
+    matching odd numbers are precomputed, so lookups are a single bisect.
+
+    Args:
+        entries: [(parameters, elementary, middle, high), ...] for one street
+
+    Returns:
+        Tuple of (interval start numbers, [(even winner, odd winner), ...]),
+        where winners are entry indices or None if no entry matches
+    """
+    rules = [parse_parameters(entry[0]) for entry in entries]
+
+    starts = sorted({0} | {low for low, _, _ in rules} |
+                    {high + 1 for _, high, _ in rules if high < NO_UPPER_LIMIT})
+
+    winners = []
+    for start in starts:
+        # Every rule either covers this whole interval or none of it
+        covering = [i for i, (low, high, _) in enumerate(rules) if low <= start <= high]
+        even = next((i for i in covering if rules[i][2] in (ANY_PARITY, EVEN_ONLY)), None)
+        odd = next((i for i in covering if rules[i][2] in (ANY_PARITY, ODD_ONLY)), None)
+        winners.append((even, odd))
+
+    return starts, winners
+
+
+def compile_street_index(street_index: Dict[str, List[Tuple]]) -> Dict[str, Tuple]:
+    """Compile every street's rules (see compile_street_rules)"""
+    return {street: compile_street_rules(entries) for street, entries in street_index.items()}
+
+
+def match_entry(street: str, house_number: Optional[int]) -> Optional[int]:
+    """
+    Find which entry of a street applies to a house number
+
+    Args:
+        street: Normalized street name (a STREET_INDEX key)
+        house_number: House number, or None
+
+    Returns:
+        Index into STREET_INDEX[street] of the first matching entry, or None
+        if no entry's parameters match
+    """
+    if house_number is None:
+        return 0
+
+    starts, winners = get_street_index()[1][street]
+    return winners[bisect_right(starts, house_number) - 1][house_number % 2]
+
+
+# Process-wide index, loaded on first lookup
+_street_index = None
+_index_lock = threading.Lock()
+
+
+def get_street_index(data_dir: str = "data") -> Tuple[Dict[str, List[Tuple]], Dict[str, Tuple]]:
+    """
+    Get the street index, loading it on first use
+
+    Returns:
+        Tuple of (street index, compiled intervals per street)
+    """
+    global _street_index
+
+    if _street_index is None:
+        with _index_lock:
+            if _street_index is None:
+                loaded = _load_compiled_index(data_dir)
+                if loaded is None:
+                    street_index = load_street_index(data_dir)
+                    loaded = (street_index, compile_street_index(street_index))
+                _street_index = loaded
+    return _street_index
+
+
+# Fuzzy indexes built on the first unknown street: one over full street
+# keys (suggestions) and one per street-type suffix over base names
+# (auto-correction)
+_street_matcher = None
+_base_matchers = None
+
+# Misspellings are auto-corrected only when one street is clearly closest:
+# same suffix, and a unique best base name at distance 1, or at distance 2
+# for longer base names
+AUTO_CORRECT_MIN_LENGTH_FOR_2_EDITS = 8
+
+
+def _split_suffix(street: str) -> Tuple[str, str]:
+    """Split a street key into (base name, street-type suffix): 'prince ave' -> ('prince', 'ave')"""
+    base, _, suffix = street.rpartition(' ')
+    return (base, suffix) if base else (street, '')
+
+
+def _build_matchers():
+    global _street_matcher, _base_matchers
+
+    from fuzzy_match import FuzzyIndex
+    street_index = get_street_index()[0]
+    with _index_lock:
+        if _street_matcher is None:
+            bases_by_suffix = {}
+            for street in street_index:
+                base, suffix = _split_suffix(street)
+                bases_by_suffix.setdefault(suffix, []).append(base)
+            _base_matchers = {suffix: FuzzyIndex(bases) for suffix, bases in bases_by_suffix.items()}
+            _street_matcher = FuzzyIndex(street_index)
+
+
+def suggest_street_names(street: str, max_results: int = 5) -> List[Tuple[str, int]]:
+    """
+    Rank known streets close to a normalized street name
+
+    Args:
+        street: Normalized street name (see normalize_street_name)
+        max_results: Maximum number of suggestions
+
+    Returns:
+        List of (street key, edit distance), closest first
+    """
+    if _street_matcher is None:
+        _build_matchers()
+
+    return _street_matcher.suggest(street, max_results)
+
+
+def auto_correct_street_name(street: str) -> Optional[str]:
+    """
+    Correct a misspelled street name when the match is unambiguous
+
+    Only the base name is corrected: the suffix must match exactly, so
+    'abington ct' is never turned into 'abington ln'.
+
+    Returns:
+        The known street key, or None if there is no confident match
+    """
+    if _street_matcher is None:
+        _build_matchers()
+
+    base, suffix = _split_suffix(street)
+    matcher = _base_matchers.get(suffix)
+    if matcher is None:
+        return None
+
+    suggestions = matcher.suggest(base, max_results=2)
+    if not suggestions:
+        return None
+
+    best, distance = suggestions[0]
+    if len(suggestions) > 1 and suggestions[1][1] == distance:
+        return None
+    if distance == 1 or (distance == 2 and len(base) >= AUTO_CORRECT_MIN_LENGTH_FOR_2_EDITS):
+        return f"{best} {suffix}" if suffix else best
+    return None
+
+
+def __getattr__(name: str):
+    # STREET_INDEX / COMPILED_STREET_INDEX used to be built at import time
+    if name == 'STREET_INDEX':
+        return get_street_index()[0]
+    if name == 'COMPILED_STREET_INDEX':
+        return get_street_index()[1]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def normalize_street_name(street: str) -> str:
@@ -178,22 +460,30 @@ def lookup_school_district(address: str) -> Optional[SchoolAssignment]:
     print(f"Looking up: {address}")
     print(f"  Parsed: #{house_number} on '{normalized_street}'")
 
-    # Look up in index
-    if normalized_street in STREET_INDEX:
-        entries = STREET_INDEX[normalized_street]
+    # Look up in index, correcting unambiguous misspellings
+    street_index = get_street_index()[0]
+    if normalized_street and normalized_street not in street_index:
+        corrected = auto_correct_street_name(normalized_street)
+        if corrected:
+            print(f"  🔍 Auto-corrected street '{normalized_street}' -> '{corrected}'")
+            normalized_street = corrected
+
+    if normalized_street in street_index:
+        entries = street_index[normalized_street]
         print(f"  Found {len(entries)} possible matches")
 
-        # Check each entry's parameters
-        for params, elem, middle, high in entries:
-            if check_parameters(house_number, params):
-                print(f"  ✓ Matched parameters: '{params}'")
-                return SchoolAssignment(
-                    elementary=elem,
-                    middle=middle,
-                    high=high,
-                    street_matched=normalized_street,
-                    parameters_matched=params
-                )
+        # Find the first entry whose parameters match (precompiled intervals)
+        matched = match_entry(normalized_street, house_number)
+        if matched is not None:
+            params, elem, middle, high = entries[matched]
+            print(f"  ✓ Matched parameters: '{params}'")
+            return SchoolAssignment(
+                elementary=elem,
+                middle=middle,
+                high=high,
+                street_matched=normalized_street,
+                parameters_matched=params
+            )
 
         # If no parameters matched, use first entry
         params, elem, middle, high = entries[0]
@@ -207,6 +497,9 @@ def lookup_school_district(address: str) -> Optional[SchoolAssignment]:
         )
 
     print(f"  ✗ Street not found in index")
+    suggestions = suggest_street_names(normalized_street) if normalized_street else []
+    if suggestions:
+        print(f"  Did you mean: {', '.join(key for key, _ in suggestions)}?")
     return None
 
 
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Test the offline address point geocoder (synthetic data, no network)
+"""
+
+import os
+import csv
+import tempfile
+from unittest import mock
+
+import geocoding
+from address_points import AddressPointIndex, build_address_index
+
+
+def _points():
+    # 100-block of Test Street: odd side at lon -83.370, even side at -83.371
+    return [
+        (101, 'test st', 33.9500, -83.3700),
+        (121, 'test st', 33.9520, -83.3700),
+        (100, 'test st', 33.9500, -83.3710),
+        (140, 'test st', 33.9540, -83.3710),
+        (500, 'test st', 33.9900, -83.3710),
+    ]
+
+
+def test_exact_match():
+    """Indexed addresses return their own point"""
+    print("Testing exact match...")
+    index = AddressPointIndex.from_points(_points())
+    assert index.lookup("101 Test Street, Athens, GA") == (33.95, -83.37)
+    print("  ✓ Exact point returned")
+
+
+def test_interpolation_uses_same_side():
+    """Missing numbers are interpolated between same-parity neighbors"""
+    print("Testing interpolation...")
+    index = AddressPointIndex.from_points(_points())
+
+    lat, lon = index.lookup("111 Test St")
+    assert abs(lat - 33.951) < 1e-9 and lon == -83.37
+
+    lat, lon = index.lookup("120 Test St")
+    assert abs(lat - 33.952) < 1e-9 and lon == -83.371
+    print("  ✓ Odd and even sides interpolated separately")
+
+
+def test_misses():
+    """Unknown streets, wide gaps and out-of-range numbers fall through"""
+    print("Testing misses...")
+    index = AddressPointIndex.from_points(_points())
+    assert index.lookup("101 Unknown Rd") is None
+    assert index.lookup("300 Test St") is None    # 140 -> 500 gap too wide
+    assert index.lookup("99 Test St") is None     # Nothing below on odd side
+    assert index.lookup("Test St") is None
+    print("  ✓ Misses return None")
+
+
+def test_build_from_csv_and_geocode_offline():
+    """A CSV export builds an index the shared geocoder uses before Nominatim"""
+    print("Testing CSV build and geocoder integration...")
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'points.csv')
+        with open(source, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['ADDRNUM', 'FULLNAME', 'LATITUDE', 'LONGITUDE'])
+            writer.writerow(['150', 'Hancock Avenue', '33.9590', '-83.3780'])
+            writer.writerow(['', 'Missing Number Rd', '33.9', '-83.3'])
+
+        index = build_address_index(source, os.path.join(tmp, 'index.pkl'))
+        assert len(index) == 1
+
+        geocoding.clear_memory_cache()
+        with mock.patch('address_points.get_address_index', return_value=index), \
+             mock.patch.object(geocoding, '_query_nominatim') as query:
+            assert geocoding.geocode("150 Hancock Ave") == (33.959, -83.378)
+            query.assert_not_called()
+    print("  ✓ Offline hit, no Nominatim request")
+
+
+if __name__ == "__main__":
+    test_exact_match()
+    test_interpolation_uses_same_side()
+    test_misses()
+    test_build_from_csv_and_geocode_offline()
+    print("\n✅ All address point tests passed")
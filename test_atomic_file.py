@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Test atomic file writes (temporary directory, no network)
+"""
+
+import os
+import tempfile
+
+from atomic_file import atomic_write
+
+
+def test_interleaved_writers_of_one_path():
+    """Two writers open at once each publish a complete file"""
+    print("Testing interleaved writers...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'entry.json')
+
+        with atomic_write(path) as first:
+            with atomic_write(path) as second:
+                second.write('second')
+            assert open(path).read() == 'second'
+            first.write('first')
+
+        assert open(path).read() == 'first'
+        assert os.listdir(tmp) == ['entry.json']
+    print("  ✓ Each writer had its own temporary file")
+
+
+def test_failed_write_leaves_target_untouched():
+    """An exception inside the block keeps the old file and removes the temporary one"""
+    print("Testing failed write...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'nested', 'entry.json')
+        with atomic_write(path) as f:
+            f.write('old')
+
+        try:
+            with atomic_write(path) as f:
+                f.write('partial')
+                raise ValueError("serialization failed")
+        except ValueError:
+            pass
+
+        assert open(path).read() == 'old'
+        assert os.listdir(os.path.dirname(path)) == ['entry.json']
+    print("  ✓ Old file kept, nothing left behind")
+
+
+if __name__ == "__main__":
+    test_interleaved_writers_of_one_path()
+    test_failed_write_leaves_target_untouched()
+    print("\n✅ All atomic file tests passed")
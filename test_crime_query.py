@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Test chunked crime API queries against a fake ArcGIS endpoint (no network)
+"""
+
+import time
+import threading
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import crime_lookup
+import http_client
+
+
+def _feature(case_number, days_ago):
+    date = datetime.now() - timedelta(days=days_ago)
+    return {'attributes': {
+        'Date': int(date.timestamp() * 1000),
+        'Lat': 33.958,
+        'Lon': -83.375,
+        'Crime_Description': 'Larceny: All Other',
+        'Case_Number': case_number,
+    }}
+
+
+def _patch_get(**kwargs):
+    """Patch the shared HTTP session's get method"""
+    session = mock.Mock()
+    session.get = mock.Mock(**kwargs)
+    return mock.patch.object(http_client, 'get_session', return_value=session)
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+
+def test_chunks_are_deduplicated_by_case_number():
+    """The same incident returned by several chunks is only counted once"""
+    print("Testing chunk deduplication...")
+    features = [_feature('C1', 10), _feature('C2', 400), _feature('C3', 700)]
+
+    with _patch_get(return_value=FakeResponse({'features': features})):
+        crimes = crime_lookup.query_crimes_in_radius(33.958, -83.375, 0.5, months_back=36)
+
+    assert sorted(c['Case_Number'] for c in crimes) == ['C1', 'C2', 'C3']
+    print("  ✓ Each case number appears once")
+
+
+def test_incidents_without_case_number_kept_across_chunks():
+    """Incidents with no case number in different chunks are not treated as duplicates"""
+    print("Testing anonymous incidents across chunks...")
+    responses = iter([FakeResponse({'features': [_feature(None, 10)]}),
+                      FakeResponse({'features': [_feature(None, 400)]})])
+
+    with _patch_get(side_effect=lambda *args, **kwargs: next(responses)):
+        crimes = crime_lookup.query_crimes_in_radius(33.958, -83.375, 0.5, months_back=24)
+
+    assert len(crimes) == 2
+    assert all(c['Case_Number'] is None for c in crimes)
+    print("  ✓ Both anonymous incidents kept")
+
+
+def test_pagination_follows_transfer_limit():
+    """Pages are requested until exceededTransferLimit is cleared"""
+    print("Testing pagination...")
+    pages = [
+        {'features': [_feature(f'P{i}', 5) for i in range(crime_lookup.API_PAGE_SIZE)],
+         'exceededTransferLimit': True},
+        {'features': [_feature('LAST', 5)]},
+    ]
+    requested = []
+
+    def fake_get(url, params=None, timeout=None):
+        requested.append(params)
+        return FakeResponse(pages[len(requested) - 1])
+
+    with _patch_get(side_effect=fake_get):
+        crimes = crime_lookup.query_crimes_in_radius(33.958, -83.375, 0.5, months_back=12)
+
+    assert len(crimes) == crime_lookup.API_PAGE_SIZE + 1
+    assert [p['resultOffset'] for p in requested] == [0, crime_lookup.API_PAGE_SIZE]
+    assert all(p['orderByFields'] == http_client.ARCGIS_ORDER_BY for p in requested)
+    print("  ✓ Second page fetched in a stable order, nothing truncated")
+
+
+def test_date_range_pushed_to_server():
+    """Each chunk filters by date in the where clause and skips geometry"""
+    print("Testing server-side date filter...")
+    requested = []
+
+    def fake_get(url, params=None, timeout=None):
+        requested.append(params)
+        return FakeResponse({'features': []})
+
+    with _patch_get(side_effect=fake_get):
+        crime_lookup.query_crimes_in_radius(33.958, -83.375, 0.5, months_back=24)
+
+    assert len(requested) == 2
+    for params in requested:
+        assert params['where'].startswith("Date >= TIMESTAMP '")
+        assert " AND Date <= TIMESTAMP '" in params['where']
+        assert params['returnGeometry'] == 'false'
+        assert params['outFields'] == ','.join(crime_lookup.CRIME_FIELDS)
+    print("  ✓ Date window and field list sent to the API")
+
+
+def test_api_error_body_is_reported():
+    """An ArcGIS error payload fails the query instead of returning nothing"""
+    print("Testing API error payload...")
+    with _patch_get(return_value=FakeResponse({'error': {'code': 400}})):
+        crimes = crime_lookup.query_crimes_in_radius(33.958, -83.375, 0.5, months_back=12)
+
+    assert crimes is None
+    print("  ✓ Error payload surfaced as a failed query")
+
+
+def test_chunks_fetched_concurrently_and_merged_in_order():
+    """Chunks run in parallel but results keep newest-chunk-first order"""
+    print("Testing concurrent chunk fetch...")
+
+    # The first MAX_CONCURRENT_CHUNKS requests only return once all of them
+    # are in flight; fetched one at a time, the barrier would time out
+    barrier = threading.Barrier(crime_lookup.MAX_CONCURRENT_CHUNKS, timeout=5)
+    lock = threading.Lock()
+    calls = []
+
+    def fake_get(url, params=None, timeout=None):
+        with lock:
+            calls.append(params)
+            waits = len(calls) <= barrier.parties
+        if waits:
+            barrier.wait()
+
+        # One incident a day after each chunk's start; newer chunks answer slower
+        start = datetime.strptime(params['where'].split("'")[1], '%Y-%m-%d %H:%M:%S')
+        start = start.replace(tzinfo=timezone.utc) + timedelta(days=1)
+        days_ago = (datetime.now(timezone.utc) - start).days
+        time.sleep(0.02 if days_ago < 1000 else 0)
+        return FakeResponse({'features': [{'attributes': {
+            'Date': int(start.timestamp() * 1000),
+            'Case_Number': f'C{days_ago}',
+        }}]})
+
+    with _patch_get(side_effect=fake_get):
+        crimes = crime_lookup.query_crimes_in_radius(33.958, -83.375, 0.5, months_back=120)
+
+    assert not barrier.broken
+    print(f"  ✓ {barrier.parties} chunks were in flight at once")
+
+    assert len(crimes) == 20
+    dates = [c['Date'] for c in crimes]
+    assert dates == sorted(dates, reverse=True)
+    print("  ✓ Results merged newest chunk first")
+
+
+if __name__ == "__main__":
+    test_chunks_are_deduplicated_by_case_number()
+    test_incidents_without_case_number_kept_across_chunks()
+    test_pagination_follows_transfer_limit()
+    test_date_range_pushed_to_server()
+    test_api_error_body_is_reported()
+    test_chunks_fetched_concurrently_and_merged_in_order()
+    print("\n✅ All crime query tests passed")
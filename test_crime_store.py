@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Test the local crime incident store (no network access needed)
+"""
+
+import os
+import tempfile
+from datetime import datetime, timedelta
+from unittest import mock
+
+import crime_store
+from crime_store import CrimeStore, STORE_MAX_AGE_HOURS
+
+
+# Downtown Athens reference point
+CENTER_LAT, CENTER_LON = 33.9580, -83.3750
+
+
+def _record(case_number, days_ago, lat, lon, crime_type='Larceny: All Other'):
+    """Build an ArcGIS-style attribute dict"""
+    date = datetime.now() - timedelta(days=days_ago)
+    return {
+        'Date': int(date.timestamp() * 1000),
+        'Lat': lat,
+        'Lon': lon,
+        'Crime_Description': crime_type,
+        'Address_Line_1': f'{case_number} Test St',
+        'Case_Number': case_number,
+        'District': 'D1',
+        'Beat': 'B1',
+        'Total_Offense_Counts': 1,
+    }
+
+
+def _sample_records():
+    return [
+        _record('A1', 10, CENTER_LAT + 0.001, CENTER_LON),           # ~0.07 mi, recent
+        _record('A2', 200, CENTER_LAT, CENTER_LON + 0.002),          # ~0.11 mi, 200 days ago
+        _record('A3', 5, CENTER_LAT + 0.05, CENTER_LON),             # ~3.5 mi, recent
+        _record('A4', 30, CENTER_LAT - 0.003, CENTER_LON, 'Robbery'),  # ~0.2 mi
+        _record('A1', 10, CENTER_LAT + 0.001, CENTER_LON, 'Robbery'),  # Duplicate case, newer wins
+        {'Date': None, 'Lat': CENTER_LAT, 'Lon': CENTER_LON, 'Case_Number': 'X'},  # No date
+    ]
+
+
+def test_build_deduplicates_and_sorts():
+    """Records are deduplicated by case number and sorted by date"""
+    print("Testing store build...")
+    store = CrimeStore.from_records(_sample_records())
+
+    assert len(store) == 4
+    assert list(store.date_ms) == sorted(store.date_ms)
+
+    records = {r['Case_Number']: r for r in store.to_records()}
+    assert records['A1']['Crime_Description'] == 'Robbery'
+    print("  ✓ Duplicates collapsed, undated record dropped")
+
+
+def test_query_radius_and_window():
+    """Radius and time window are both applied"""
+    print("Testing radius query...")
+    store = CrimeStore.from_records(_sample_records())
+
+    now = datetime.now()
+    found = store.query_radius(CENTER_LAT, CENTER_LON, 0.5, start=now - timedelta(days=180), end=now)
+    assert sorted(r['Case_Number'] for r in found) == ['A1', 'A4']
+
+    found = store.query_radius(CENTER_LAT, CENTER_LON, 0.5)
+    assert sorted(r['Case_Number'] for r in found) == ['A1', 'A2', 'A4']
+    print("  ✓ Only nearby incidents inside the window returned")
+
+
+def test_k_nearest():
+    """Nearest incidents come back closest first"""
+    print("Testing k nearest...")
+    store = CrimeStore.from_records(_sample_records())
+
+    nearest = store.k_nearest(CENTER_LAT, CENTER_LON, 2)
+    assert [r['Case_Number'] for r in nearest] == ['A1', 'A2']
+    print("  ✓ Closest incidents returned in order")
+
+
+def test_save_and_load_roundtrip():
+    """Store survives a save/load cycle"""
+    print("Testing save/load...")
+    store = CrimeStore.from_records(_sample_records())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'incidents.npz')
+        store.save(path)
+        assert os.listdir(tmp) == [os.path.basename(path)]
+
+        loaded = CrimeStore.load(path)
+        assert loaded is not None
+        assert loaded.to_records() == store.to_records()
+        assert loaded.is_fresh()
+
+    print("  ✓ Roundtrip preserved every record")
+
+
+def test_stale_store():
+    """Stores older than STORE_MAX_AGE_HOURS are not trusted"""
+    print("Testing staleness...")
+    synced_at = datetime.now() - timedelta(hours=STORE_MAX_AGE_HOURS + 1)
+    store = CrimeStore.from_records(_sample_records(), synced_at=synced_at)
+    assert not store.is_fresh()
+    print("  ✓ Stale store detected")
+
+
+def test_incremental_sync_keeps_anonymous_incidents():
+    """Incidents without a case number survive repeated sync merges"""
+    print("Testing incremental sync with anonymous incidents...")
+
+    def anonymous(days_ago, lat, address='Test St', crime_type='Larceny: All Other'):
+        record = _record(None, days_ago, lat, CENTER_LON, crime_type=crime_type)
+        record['Address_Line_1'] = address
+        return record
+
+    initial = [
+        _record('A1', 3, CENTER_LAT, CENTER_LON),
+        anonymous(3, CENTER_LAT + 0.001),
+        anonymous(2, CENTER_LAT + 0.002, address=None),      # Stored as 'Location not specified'
+        anonymous(1, CENTER_LAT + 0.003, crime_type=None),   # Stored as 'Unknown'
+    ]
+    # The overlap window re-downloads recent incidents, plus one new one
+    overlap = initial[1:] + [anonymous(0, CENTER_LAT + 0.004)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'incidents.npz')
+        with mock.patch.object(crime_store, 'fetch_incidents_since', return_value=initial):
+            assert len(crime_store.sync_crime_store(full=True, path=path)) == 4
+
+        with mock.patch.object(crime_store, 'fetch_incidents_since', return_value=overlap):
+            assert len(crime_store.sync_crime_store(path=path)) == 5
+            store = crime_store.sync_crime_store(path=path)
+
+    assert len(store) == 5
+    assert sum(1 for r in store.to_records() if r['Case_Number'] is None) == 4
+    print("  ✓ 4 anonymous incidents kept across two merges, none duplicated")
+
+
+if __name__ == "__main__":
+    test_build_deduplicates_and_sorts()
+    test_query_radius_and_window()
+    test_k_nearest()
+    test_save_and_load_roundtrip()
+    test_stale_store()
+    test_incremental_sync_keeps_anonymous_incidents()
+    print("\n✅ All crime store tests passed")
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test fuzzy street-name matching and auto-correction (no network)
+"""
+
+from fuzzy_match import FuzzyIndex, edit_distance
+from street_index_lookup import (
+    STREET_INDEX, suggest_street_names, auto_correct_street_name, lookup_school_district
+)
+
+
+def test_edit_distance():
+    """Insertions, deletions, substitutions and transpositions each cost one"""
+    print("Testing edit distance...")
+    assert edit_distance('hancock ave', 'hancock ave') == 0
+    assert edit_distance('hancok ave', 'hancock ave') == 1
+    assert edit_distance('hancock avee', 'hancock ave') == 1
+    assert edit_distance('hancack ave', 'hancock ave') == 1
+    assert edit_distance('hnacock ave', 'hancock ave') == 1
+    assert edit_distance('milege ave', 'milledge ave') == 2
+    assert edit_distance('', 'abc') == 3
+    print("  ✓ Distances correct")
+
+
+def test_suggestions_ranked():
+    """Suggestions come back closest first, within the edit limit"""
+    print("Testing ranked suggestions...")
+    index = FuzzyIndex(['baker st', 'baxter st', 'prince ave', 'price ave'])
+
+    assert index.suggest('baxtr st') == [('baxter st', 1), ('baker st', 2)]
+    assert index.suggest('prnce ave') == [('price ave', 1), ('prince ave', 1)]
+    assert index.suggest('zzzz') == []
+    print("  ✓ Ranking and cutoff correct")
+
+
+def test_auto_correct_only_when_unambiguous():
+    """Only a clear single best match is auto-corrected"""
+    print("Testing auto-correction...")
+    assert 'hancock ave' in STREET_INDEX
+    assert auto_correct_street_name('hancok ave') == 'hancock ave'
+    assert auto_correct_street_name('barnett shols rd') == 'barnett shoals rd'
+
+    # Equally close to "price ave" and "prince ave"
+    assert auto_correct_street_name('prnce ave') is None
+    assert [key for key, _ in suggest_street_names('prnce ave')][:2] == ['price ave', 'prince ave']
+    print("  ✓ Typos corrected, ties left alone")
+
+
+def test_auto_correct_never_changes_suffix():
+    """A different street type is suggested, never silently substituted"""
+    print("Testing suffix-preserving correction...")
+    assert 'abington ct' not in STREET_INDEX and 'abington ln' in STREET_INDEX
+    assert auto_correct_street_name('abington ct') is None
+    assert [key for key, _ in suggest_street_names('abington ct')] == ['abington ln']
+
+    # A misspelled suffix is not guessed either
+    assert auto_correct_street_name('hancock av') is None
+    assert auto_correct_street_name('abingtn ln') == 'abington ln'
+    print("  ✓ Base names corrected, suffixes left to suggestions")
+
+
+def test_lookup_uses_correction():
+    """A misspelled street still gets its school assignment"""
+    print("Testing lookup with a typo...")
+    expected = lookup_school_district("150 Hancock Ave")
+    corrected = lookup_school_district("150 Hancok Ave")
+
+    assert corrected is not None
+    assert corrected.street_matched == 'hancock ave'
+    assert corrected.elementary == expected.elementary
+    print(f"  ✓ 150 Hancok Ave -> {corrected.elementary}")
+
+
+if __name__ == "__main__":
+    test_edit_distance()
+    test_suggestions_ranked()
+    test_auto_correct_only_when_unambiguous()
+    test_auto_correct_never_changes_suffix()
+    test_lookup_uses_correction()
+    print("\n✅ All fuzzy match tests passed")
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Test vectorized haversine helpers against the scalar implementation
+"""
+
+import numpy as np
+
+from crime_lookup import haversine_distance
+from geo_distance import haversine_many, haversine_matrix
+
+
+POINTS = [
+    (33.9580, -83.3750),  # Downtown Athens
+    (33.9519, -83.3576),  # UGA campus
+    (33.9416, -83.4370),  # West Athens
+    (34.0007, -83.3404),  # North Athens
+]
+
+
+def test_haversine_many_matches_scalar():
+    """One-to-many distances match haversine_distance"""
+    print("Testing haversine_many...")
+    center = POINTS[0]
+    lats = [p[0] for p in POINTS]
+    lons = [p[1] for p in POINTS]
+
+    distances = haversine_many(center, lats, lons)
+    expected = [haversine_distance(center[0], center[1], lat, lon) for lat, lon in POINTS]
+
+    assert np.allclose(distances, expected)
+    assert distances[0] == 0.0
+    print("  ✓ Matches scalar implementation")
+
+
+def test_haversine_matrix_matches_scalar():
+    """Pairwise matrix matches haversine_distance for every pair"""
+    print("Testing haversine_matrix...")
+    lats = [p[0] for p in POINTS]
+    lons = [p[1] for p in POINTS]
+
+    matrix = haversine_matrix(POINTS[:2], lats, lons)
+    assert matrix.shape == (2, len(POINTS))
+
+    for i, (clat, clon) in enumerate(POINTS[:2]):
+        for j, (lat, lon) in enumerate(POINTS):
+            assert np.isclose(matrix[i, j], haversine_distance(clat, clon, lat, lon))
+
+    print("  ✓ Matrix matches scalar implementation")
+
+
+def test_empty_inputs():
+    """Empty point lists give empty results"""
+    print("Testing empty inputs...")
+    assert haversine_many(POINTS[0], [], []).shape == (0,)
+    assert haversine_matrix(POINTS, [], []).shape == (len(POINTS), 0)
+    print("  ✓ Empty inputs handled")
+
+
+if __name__ == "__main__":
+    test_haversine_many_matches_scalar()
+    test_haversine_matrix_matches_scalar()
+    test_empty_inputs()
+    print("\n✅ All distance tests passed")
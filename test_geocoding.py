@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Test the shared geocoding cache (Nominatim is mocked, no network)
+"""
+
+import tempfile
+import threading
+import time
+from unittest import mock
+
+import geocoding
+
+
+COORDS = (33.9519, -83.3576)
+
+
+def _fresh_cache(tmp):
+    """Point the disk cache at a temp dir and clear memory"""
+    geocoding.clear_memory_cache()
+    return mock.patch.object(geocoding, 'GEOCODE_CACHE_DIR', tmp)
+
+
+def test_normalized_addresses_share_cache():
+    """Different spellings of one address hit Nominatim once"""
+    print("Testing normalization and memory cache...")
+    with tempfile.TemporaryDirectory() as tmp, _fresh_cache(tmp):
+        with mock.patch.object(geocoding, '_query_nominatim', return_value=COORDS) as query:
+            assert geocoding.geocode("150 Hancock Ave") == COORDS
+            assert geocoding.geocode("150  hancock ave, Athens, GA") == COORDS
+            assert query.call_count == 1
+            assert query.call_args[0][0] == "150 Hancock Ave, Athens, GA"
+    print("  ✓ One Nominatim request for both spellings")
+
+
+def test_disk_cache_survives_memory_clear():
+    """Results persist on disk across processes"""
+    print("Testing disk cache...")
+    with tempfile.TemporaryDirectory() as tmp, _fresh_cache(tmp):
+        with mock.patch.object(geocoding, '_query_nominatim', return_value=COORDS):
+            geocoding.geocode("220 College Station Rd")
+
+        geocoding.clear_memory_cache()
+        with mock.patch.object(geocoding, '_query_nominatim') as query:
+            assert geocoding.geocode("220 College Station Rd") == COORDS
+            query.assert_not_called()
+    print("  ✓ Second lookup served from disk")
+
+
+def test_concurrent_requests_are_coalesced():
+    """Threads asking for the same address share one request"""
+    print("Testing in-flight coalescing...")
+
+    def slow_query(address):
+        time.sleep(0.2)
+        return COORDS
+
+    with tempfile.TemporaryDirectory() as tmp, _fresh_cache(tmp):
+        with mock.patch.object(geocoding, '_query_nominatim', side_effect=slow_query) as query:
+            results = []
+            threads = [threading.Thread(target=lambda: results.append(geocoding.geocode("1 Main St")))
+                       for _ in range(5)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+            assert results == [COORDS] * 5
+            assert query.call_count == 1
+    print("  ✓ Five callers, one request")
+
+
+def test_errors_are_not_cached():
+    """Service failures propagate and are retried next time"""
+    print("Testing error handling...")
+    with tempfile.TemporaryDirectory() as tmp, _fresh_cache(tmp):
+        with mock.patch.object(geocoding, '_query_nominatim', side_effect=RuntimeError("down")):
+            try:
+                geocoding.geocode("9 Error Ln")
+                assert False, "expected an error"
+            except RuntimeError:
+                pass
+
+        with mock.patch.object(geocoding, '_query_nominatim', return_value=COORDS):
+            assert geocoding.geocode("9 Error Ln") == COORDS
+    print("  ✓ Failure not remembered")
+
+
+if __name__ == "__main__":
+    test_normalized_addresses_share_cache()
+    test_disk_cache_survives_memory_clear()
+    test_concurrent_requests_are_coalesced()
+    test_errors_are_not_cached()
+    print("\n✅ All geocoding tests passed")
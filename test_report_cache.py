@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Test the per-section report cache (no network)
+"""
+
+from unittest import mock
+
+import report_cache
+from report_cache import ReportCache, normalize_report_address, SECTION_TTL_SECONDS
+
+
+def test_address_normalization():
+    """Spelling variants of one address share a key"""
+    print("Testing address keys...")
+    assert normalize_report_address("150 Hancock Avenue") == "150 hancock ave"
+    assert normalize_report_address("150 hancock ave, Athens, GA 30601") == "150 hancock ave"
+    assert normalize_report_address("1398 Hancock Ave W") == normalize_report_address("1398 W Hancock Ave")
+    assert normalize_report_address("151 Hancock Ave") != "150 hancock ave"
+    print("  ✓ Variants collapse to one key")
+
+
+def test_keys_include_parameters_and_question():
+    """Crime results depend on radius/months; responses on the question"""
+    print("Testing cache keys...")
+    cache = ReportCache()
+    cache.set("150 Hancock Ave", 'crime', "half mile", radius_miles=0.5, months_back=12)
+    cache.set("150 Hancock Ave", 'school_response', "answer", question="Good schools?")
+
+    assert cache.get("150 Hancock Avenue", 'crime', radius_miles=0.5, months_back=12) == "half mile"
+    assert cache.get("150 Hancock Ave", 'crime', radius_miles=1.0, months_back=12) is None
+    assert cache.get("150 Hancock Ave", 'school_response', question="good  schools?") == "answer"
+    assert cache.get("150 Hancock Ave", 'school_response', question="Is it safe?") is None
+    print("  ✓ Parameters and question are part of the key")
+
+
+def test_ttl_per_section():
+    """Crime expires after a day; zoning is still valid"""
+    print("Testing TTLs...")
+    cache = ReportCache()
+    with mock.patch.object(report_cache.time, 'monotonic', return_value=1000.0):
+        cache.set("150 Hancock Ave", 'crime', "crime")
+        cache.set("150 Hancock Ave", 'zoning', "zoning")
+
+    later = 1000.0 + SECTION_TTL_SECONDS['crime'] + 1
+    with mock.patch.object(report_cache.time, 'monotonic', return_value=later):
+        assert cache.get("150 Hancock Ave", 'crime') is None
+        assert cache.get("150 Hancock Ave", 'zoning') == "zoning"
+    assert len(cache) == 1
+    print("  ✓ Expired section dropped")
+
+
+def test_lru_eviction():
+    """Oldest entries go first once the cache is full; None isn't stored"""
+    print("Testing eviction...")
+    cache = ReportCache(max_entries=2)
+    cache.set("1 Main St", 'zoning', 1)
+    cache.set("2 Main St", 'zoning', 2)
+    cache.get("1 Main St", 'zoning')
+    cache.set("3 Main St", 'zoning', 3)
+    cache.set("4 Main St", 'zoning', None)
+
+    assert cache.get("2 Main St", 'zoning') is None
+    assert cache.get("1 Main St", 'zoning') == 1
+    assert cache.get("3 Main St", 'zoning') == 3
+    assert len(cache) == 2
+    print("  ✓ Least recently used entry evicted")
+
+
+if __name__ == "__main__":
+    test_address_normalization()
+    test_keys_include_parameters_and_question()
+    test_ttl_per_section()
+    test_lru_eviction()
+    print("\n✅ All report cache tests passed")
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test the disk TTL response cache and its use by zoning queries (no network)
+"""
+
+import os
+import tempfile
+import time
+from unittest import mock
+
+import zoning_lookup
+from response_cache import ResponseCache
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+
+def test_get_set_and_ttl():
+    """Entries round-trip and expire after the TTL"""
+    print("Testing TTL...")
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ResponseCache('test', ttl_days=1, root=tmp)
+        cache.set(['zoning', 33.95, -83.37, 50], {'features': [1]})
+        assert cache.get(['zoning', 33.95, -83.37, 50]) == {'features': [1]}
+        assert cache.get(['zoning', 33.95, -83.37, 250]) is None
+
+        with mock.patch('response_cache.time.time', return_value=time.time() + 2 * 86400):
+            assert cache.get(['zoning', 33.95, -83.37, 50]) is None
+    print("  ✓ Hit before expiry, miss after")
+
+
+def test_lru_eviction_and_clear():
+    """Past max_entries the least recently used entries are evicted in one batch"""
+    print("Testing eviction...")
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ResponseCache('test', max_entries=10, root=tmp)
+        for i in range(10):
+            cache.set(i, {'v': i})
+            past = time.time() - 100 + i
+            os.utime(cache._path(i), (past, past))
+
+        cache.get(0)            # 0 becomes most recently used
+        cache.set(0, {'v': 0})  # Overwrites don't grow the cache
+        assert len(cache) == 10
+
+        cache.set(10, {'v': 10})
+        assert len(cache) == 9  # Trimmed to EVICT_TO_FRACTION of max_entries
+        assert cache.get(0) == {'v': 0}
+        assert cache.get(1) is None and cache.get(2) is None
+        assert cache.get(3) == {'v': 3}
+
+        cache.clear()
+        assert len(cache) == 0
+    print("  ✓ LRU entries evicted, clear empties the cache")
+
+
+def test_writes_do_not_scan_directory():
+    """The directory is listed once up front and then only when evicting"""
+    print("Testing eviction bookkeeping...")
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ResponseCache('test', max_entries=100, root=tmp)
+        with mock.patch('response_cache.os.listdir', wraps=os.listdir) as listdir:
+            for i in range(150):
+                cache.set(i, {'v': i})
+            # First write, then one eviction per 10 new entries past the limit
+            assert listdir.call_count == 1 + 5, listdir.call_count
+        assert len(cache) <= 100
+    print(f"  ✓ {listdir.call_count} directory scans for 150 writes")
+
+
+def test_zoning_queries_use_cache():
+    """Repeated zoning queries for the same point skip the network"""
+    print("Testing zoning response caching...")
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ResponseCache('zoning', root=tmp)
+        with mock.patch.object(zoning_lookup, '_zoning_cache', cache), \
+             mock.patch('zoning_snapshot.get_zoning_snapshot', return_value=None), \
+             mock.patch.object(zoning_lookup, 'get_session') as session:
+            http_get = session.return_value.get
+            http_get.return_value = FakeResponse({'features': []})
+            zoning_lookup.query_zoning_api(33.950001, -83.370001, 50)
+            zoning_lookup.query_zoning_api(33.950002, -83.370002, 50)
+            zoning_lookup.query_future_land_use_api(33.950001, -83.370001, 50)
+            assert http_get.call_count == 2
+
+            http_get.return_value = FakeResponse({'error': {'code': 500}})
+            zoning_lookup.query_zoning_api(34.0, -83.3, 50)
+            zoning_lookup.query_zoning_api(34.0, -83.3, 50)
+            assert http_get.call_count == 4
+    print("  ✓ Cache shared by nearby points, errors not cached")
+
+
+if __name__ == "__main__":
+    test_get_set_and_ttl()
+    test_lru_eviction_and_clear()
+    test_writes_do_not_scan_directory()
+    test_zoning_queries_use_cache()
+    print("\n✅ All response cache tests passed")
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Test the prefiltered school performance extract (synthetic GOSA CSVs)
+"""
+
+import os
+import csv
+import tempfile
+from unittest import mock
+
+from school_performance import SchoolPerformanceDB, build_performance_extracts, extract_filename, EXTRACT_DIRNAME
+
+
+def _write_csv(path, rows):
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _write_sources(data_dir):
+    eog = []
+    for district, school in [('Clarke County', 'Barrow Elementary School'),
+                             ('Clarke County', 'Clarke Central High School'),
+                             ('Oconee County', 'Malcom Bridge Elementary School')]:
+        for subject, prof in [('English Language Arts', '40.5'), ('Mathematics', 'TFS')]:
+            eog.append({
+                'LONG_SCHOOL_YEAR': '2023-24', 'SCHOOL_DSTRCT_NM': district, 'INSTN_NAME': school,
+                'ACDMC_LVL': 'ALL GRADES', 'SUBGROUP_NAME': 'All Students',
+                'TEST_CMPNT_TYP_NM': subject, 'NUM_TESTED_CNT': '120',
+                'PROFICIENT_PCT': prof, 'DISTINGUISHED_PCT': '35.0',
+            })
+    _write_csv(os.path.join(data_dir, 'eog_2023-24.csv'), eog)
+
+    _write_csv(os.path.join(data_dir, 'enrollment_2023-24.csv'), [{
+        'SCHOOL_DSTRCT_NM': 'Clarke County', 'INSTN_NAME': 'Barrow Elementary School',
+        'DETAIL_LVL_DESC': 'School', 'ENROLL_PCT_WHITE': '55.5', 'ENROLL_TOTAL': '480',
+    }, {
+        # District with enrollment but no test scores
+        'SCHOOL_DSTRCT_NM': 'Madison County', 'INSTN_NAME': 'Madison County High School',
+        'DETAIL_LVL_DESC': 'School', 'ENROLL_PCT_WHITE': '70.0', 'ENROLL_TOTAL': '1500',
+    }])
+    _write_csv(os.path.join(data_dir, 'graduation_2023-24.csv'), [{
+        'SCHOOL_DSTRCT_NM': 'Clarke County', 'INSTN_NAME': 'Clarke Central High School',
+        'DETAIL_LVL_DESC': 'School', 'LABEL_LVL_1_DESC': 'Grad Rate -ALL Students', 'PROGRAM_RATE': '88.1',
+    }])
+    _write_csv(os.path.join(data_dir, 'sat_2023-24.csv'), [{
+        'SCHOOL_DSTRCT_NM': 'Clarke County', 'INSTN_NAME': 'Clarke Central High School',
+        'SUBGRP_DESC': 'All Students', 'TEST_CMPNT_TYP_CD': 'SAT_TOTAL', 'AVG_SCORE': '1105',
+    }])
+
+
+def test_extract_matches_csv_load():
+    """Schools read back from the extract equal those parsed from the CSVs"""
+    print("Testing extract round trip...")
+    with tempfile.TemporaryDirectory() as data_dir:
+        _write_sources(data_dir)
+        from_csv = SchoolPerformanceDB(data_dir, use_extract=False)
+        all_districts = build_performance_extracts(data_dir)
+        assert os.path.exists(os.path.join(data_dir, EXTRACT_DIRNAME, extract_filename('Clarke County')))
+        # Enrollment rows alone don't produce an (empty) extract
+        assert set(all_districts.districts) == {'Clarke County', 'Oconee County'}
+        assert not os.path.exists(os.path.join(data_dir, EXTRACT_DIRNAME, extract_filename('Madison County')))
+
+        with mock.patch.object(SchoolPerformanceDB, '_load_data') as load_csv:
+            from_extract = SchoolPerformanceDB(data_dir)
+            load_csv.assert_not_called()
+
+        assert from_extract.schools == from_csv.schools
+        assert set(from_extract.schools) == {'barrow', 'clarke central'}
+
+        barrow = from_extract.get_school_performance('Barrow Elementary')
+        assert barrow.test_scores[1].proficient_pct == 0.0
+        assert barrow.demographics.total_enrollment == 480
+        assert from_extract.get_school_performance('Clarke Central High').avg_sat_score == 1105
+    print("  ✓ Extract loaded without touching the CSVs")
+
+
+def test_changed_source_falls_back_to_csv():
+    """Editing a source CSV invalidates the extract"""
+    print("Testing invalidation...")
+    with tempfile.TemporaryDirectory() as data_dir:
+        _write_sources(data_dir)
+        build_performance_extracts(data_dir)
+
+        with open(os.path.join(data_dir, 'sat_2023-24.csv'), 'a') as f:
+            f.write('Clarke County,Cedar Shoals High School,All Students,SAT_TOTAL,990\n')
+
+        with mock.patch.object(SchoolPerformanceDB, '_load_data') as load_csv:
+            SchoolPerformanceDB(data_dir)
+            load_csv.assert_called_once()
+
+        # Same content with a new mtime is still current
+        build_performance_extracts(data_dir)
+        os.utime(os.path.join(data_dir, 'sat_2023-24.csv'), ns=(0, 0))
+        with mock.patch.object(SchoolPerformanceDB, '_load_data') as load_csv:
+            SchoolPerformanceDB(data_dir)
+            load_csv.assert_not_called()
+    print("  ✓ Stale extract ignored, touched file accepted")
+
+
+def test_missing_test_score_files():
+    """Without EOG/EOC files there are no schools, as before"""
+    print("Testing missing test score files...")
+    with tempfile.TemporaryDirectory() as data_dir:
+        _write_sources(data_dir)
+        os.remove(os.path.join(data_dir, 'eog_2023-24.csv'))
+
+        build_performance_extracts(data_dir)
+        assert SchoolPerformanceDB(data_dir).schools == {}
+    print("  ✓ Empty database")
+
+
+def test_every_district_in_one_pass():
+    """The ingest writes an extract per district, each loadable on its own"""
+    print("Testing multi-district ingest...")
+    with tempfile.TemporaryDirectory() as data_dir:
+        _write_sources(data_dir)
+        db = build_performance_extracts(data_dir)
+        assert set(db.districts) == {'Clarke County', 'Oconee County'}
+
+        with mock.patch.object(SchoolPerformanceDB, '_load_data') as load_csv:
+            oconee = SchoolPerformanceDB(data_dir, district='Oconee County')
+            load_csv.assert_not_called()
+
+        assert list(oconee.schools) == ['malcom bridge']
+        assert oconee.get_school_performance('Malcom Bridge Elementary').district_name == 'Oconee County'
+        assert oconee.get_school_performance('Barrow Elementary') is None
+
+        # Same result as a single-district CSV load
+        assert oconee.schools == SchoolPerformanceDB(data_dir, use_extract=False, district='Oconee County').schools
+    print("  ✓ Oconee County served from its own extract")
+
+
+if __name__ == "__main__":
+    test_extract_matches_csv_load()
+    test_changed_source_falls_back_to_csv()
+    test_missing_test_score_files()
+    test_every_district_in_one_pass()
+    print("\n✅ All school performance extract tests passed")
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Test the grid spatial index against brute-force distance scans
+"""
+
+import numpy as np
+
+from geo_distance import haversine_many
+from spatial_index import PointGridIndex
+
+
+def _random_points(n=5000, seed=7):
+    """Random points spread across Athens-Clarke County"""
+    rng = np.random.default_rng(seed)
+    lats = rng.uniform(33.85, 34.05, n)
+    lons = rng.uniform(-83.50, -83.25, n)
+    times = rng.integers(0, 1_000_000, n)
+    return lats, lons, times
+
+
+def test_query_radius_matches_brute_force():
+    """Radius query returns exactly the points a full scan would"""
+    print("Testing radius query...")
+    lats, lons, times = _random_points()
+    index = PointGridIndex(lats, lons, times=times)
+
+    for lat, lon, miles in [(33.958, -83.375, 0.5), (33.90, -83.45, 2.0), (34.04, -83.26, 1.0)]:
+        expected = np.nonzero(haversine_many((lat, lon), lats, lons) <= miles)[0]
+        found, distances = index.query_radius(lat, lon, miles)
+        assert sorted(found.tolist()) == expected.tolist()
+        assert np.all(distances <= miles)
+
+    print("  ✓ Grid results match brute force")
+
+
+def test_query_radius_time_window():
+    """Time window is applied inside each cell"""
+    print("Testing time window...")
+    lats, lons, times = _random_points()
+    index = PointGridIndex(lats, lons, times=times)
+
+    lat, lon, miles = 33.958, -83.375, 3.0
+    in_radius = haversine_many((lat, lon), lats, lons) <= miles
+    in_window = (times >= 200_000) & (times <= 600_000)
+    expected = np.nonzero(in_radius & in_window)[0]
+
+    found, _ = index.query_radius(lat, lon, miles, start=200_000, end=600_000)
+    assert sorted(found.tolist()) == expected.tolist()
+    print("  ✓ Only points inside the window returned")
+
+
+def test_k_nearest_matches_brute_force():
+    """k nearest neighbors come back in distance order"""
+    print("Testing k nearest...")
+    lats, lons, times = _random_points()
+    index = PointGridIndex(lats, lons, times=times)
+
+    for lat, lon in [(33.958, -83.375), (33.86, -83.49), (34.2, -83.0)]:
+        distances = haversine_many((lat, lon), lats, lons)
+        expected = np.argsort(distances, kind='stable')[:10]
+        found, found_distances = index.k_nearest(lat, lon, 10)
+        assert found.tolist() == expected.tolist()
+        assert list(found_distances) == sorted(found_distances)
+
+    print("  ✓ Nearest neighbors match brute force")
+
+
+def test_empty_index():
+    """Queries on an empty index return nothing"""
+    print("Testing empty index...")
+    index = PointGridIndex([], [])
+    assert len(index.query_radius(33.958, -83.375, 1.0)[0]) == 0
+    assert len(index.k_nearest(33.958, -83.375, 5)[0]) == 0
+    print("  ✓ Empty index handled")
+
+
+if __name__ == "__main__":
+    test_query_radius_matches_brute_force()
+    test_query_radius_time_window()
+    test_k_nearest_matches_brute_force()
+    test_empty_index()
+    print("\n✅ All spatial index tests passed")
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Test the compiled house-number intervals used for school assignment
+(checked against check_parameters on the real street index, no network)
+"""
+
+import os
+import json
+import shutil
+import tempfile
+
+import street_index_lookup
+from street_index_lookup import (
+    STREET_INDEX, check_parameters, parse_parameters, compile_street_rules,
+    match_entry, lookup_school_district, save_compiled_index, _load_compiled_index, ANY_PARITY, EVEN_ONLY, ODD_ONLY, NO_UPPER_LIMIT
+)
+
+
+def _first_match(entries, house_number):
+    """Reference behavior: first entry whose parameters pass check_parameters"""
+    return next((i for i, entry in enumerate(entries) if check_parameters(house_number, entry[0])), None)
+
+
+def test_parse_parameters():
+    """Parameter strings compile to (low, high, parity) like check_parameters reads them"""
+    print("Testing parameter parsing...")
+    assert parse_parameters('') == (0, NO_UPPER_LIMIT, ANY_PARITY)
+    assert parse_parameters('1099 and below') == (0, 1099, ANY_PARITY)
+    assert parse_parameters('1100 and above, even') == (1100, NO_UPPER_LIMIT, ANY_PARITY)
+    assert parse_parameters('337 to 475, odd') == (337, 475, ODD_ONLY)
+    assert parse_parameters('100 to 200 even') == (100, 200, EVEN_ONLY)
+    assert parse_parameters('Odd') == (0, NO_UPPER_LIMIT, ODD_ONLY)
+    assert parse_parameters('odd and even') == (0, NO_UPPER_LIMIT, ANY_PARITY)
+    print("  ✓ All rule shapes parsed")
+
+
+def test_first_entry_wins():
+    """Overlapping rules resolve to the earliest entry, per parity"""
+    print("Testing rule precedence...")
+    entries = [
+        ('100 to 199, odd', 'A', 'M', 'H'),
+        ('150 and below', 'B', 'M', 'H'),
+        ('even', 'C', 'M', 'H'),
+    ]
+    starts, winners = compile_street_rules(entries)
+
+    for number in range(0, 400):
+        assert _first_match(entries, number) == \
+            [w for s, w in zip(starts, winners) if s <= number][-1][number % 2], number
+    print("  ✓ Matches check_parameters on a synthetic street")
+
+
+def test_matches_check_parameters_on_street_index():
+    """Compiled lookup agrees with check_parameters for every street"""
+    print("Testing every street in the index...")
+    numbers = list(range(0, 2000, 7)) + list(range(2000, 10000, 97))
+
+    for street, entries in STREET_INDEX.items():
+        for number in numbers:
+            assert match_entry(street, number) == _first_match(entries, number), (street, number)
+        assert match_entry(street, None) == 0
+
+    print(f"  ✓ {len(STREET_INDEX):,} streets agree")
+
+
+def test_lookup_school_district():
+    """Assignments still come back through the public lookup"""
+    print("Testing lookup_school_district...")
+    street = next(s for s, entries in STREET_INDEX.items() if len(entries) > 1)
+    entries = STREET_INDEX[street]
+    number = next(n for n in range(1, 5000) if match_entry(street, n) is not None)
+
+    assignment = lookup_school_district(f"{number} {street}")
+    params, elem, middle, high = entries[match_entry(street, number)]
+    assert assignment.elementary == elem and assignment.parameters_matched == params
+    print(f"  ✓ {number} {street} -> {elem}")
+
+
+def test_compiled_artifact_round_trip():
+    """The binary artifact loads back the same index, and is ignored once the JSON changes"""
+    print("Testing compiled index artifact...")
+    with tempfile.TemporaryDirectory() as data_dir:
+        shutil.copy(os.path.join("data", "street_index.json"), data_dir)
+        assert _load_compiled_index(data_dir) is None
+
+        save_compiled_index(data_dir)
+        streets, compiled = _load_compiled_index(data_dir)
+        assert streets == STREET_INDEX
+        assert compiled == street_index_lookup.COMPILED_STREET_INDEX
+        print("  ✓ Artifact matches the JSON index")
+
+        # Same content, new mtime: still valid via the checksum
+        json_path = os.path.join(data_dir, "street_index.json")
+        os.utime(json_path, ns=(0, 0))
+        assert _load_compiled_index(data_dir) is not None
+
+        with open(json_path, 'w') as f:
+            json.dump({'test st': [['', 'A', 'B', 'C']]}, f)
+        assert _load_compiled_index(data_dir) is None
+        print("  ✓ Stale artifact rejected")
+
+
+if __name__ == "__main__":
+    test_parse_parameters()
+    test_first_entry_wins()
+    test_matches_check_parameters_on_street_index()
+    test_lookup_school_district()
+    test_compiled_artifact_round_trip()
+    print("\n✅ All street interval tests passed")
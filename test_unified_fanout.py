@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Test that the unified analysis runs its data stages concurrently (data sources mocked)
+"""
+
+import threading
+from unittest import mock
+
+import unified_ai_assistant
+from unified_ai_assistant import UnifiedAIAssistant
+from report_cache import ReportCache
+
+
+def _returns(value, before=None):
+    """Stage stub that runs before() (e.g. waits on a barrier) and returns value"""
+    def fn(*args, **kwargs):
+        if before:
+            before()
+        return value
+    return fn
+
+
+def _assistant(result_cache=None):
+    assistant = UnifiedAIAssistant(api_key="test-key", result_cache=result_cache)
+    assistant.school_assistant = mock.Mock()
+    assistant.crime_assistant = mock.Mock()
+    assistant._synthesize_insights = mock.Mock(return_value="synthesis")
+    return assistant
+
+
+def test_stages_run_concurrently():
+    """Every stage is in flight at the same time"""
+    print("Testing concurrent stages...")
+    zoning = mock.Mock(current_parcel="parcel")
+    # Each stage waits for the other two; run one at a time, the barrier times out
+    barrier = threading.Barrier(3, timeout=5)
+
+    with mock.patch.object(unified_ai_assistant, 'get_school_info', _returns("schools", barrier.wait)), \
+         mock.patch.object(unified_ai_assistant, 'analyze_crime_near_address', _returns("crime", barrier.wait)), \
+         mock.patch.object(unified_ai_assistant, 'get_nearby_zoning', _returns(zoning, barrier.wait)):
+        result = _assistant().get_comprehensive_analysis("150 Hancock Ave", "Is it safe?")
+
+    assert not barrier.broken, "stages did not overlap"
+    assert result['school_info'] == "schools"
+    assert result['crime_analysis'] == "crime"
+    assert result['zoning_info'] == "parcel"
+    assert result['synthesis'] == "synthesis"
+    print("  ✓ All three stages overlapped")
+
+
+def test_slow_stage_returns_partial_results():
+    """A stage past its timeout is dropped and reported"""
+    print("Testing stage timeout...")
+    zoning = mock.Mock(current_parcel="parcel")
+    timeouts = {'schools': 5, 'crime': 0.2, 'zoning': 5}
+    # The crime stage is held until the analysis has returned without it
+    release = threading.Event()
+
+    try:
+        with mock.patch.object(unified_ai_assistant, 'get_school_info', _returns("schools")), \
+             mock.patch.object(unified_ai_assistant, 'analyze_crime_near_address',
+                               _returns("crime", lambda: release.wait(5))), \
+             mock.patch.object(unified_ai_assistant, 'get_nearby_zoning', _returns(zoning)), \
+             mock.patch.dict(unified_ai_assistant.STAGE_TIMEOUT_SECONDS, timeouts):
+            result = _assistant().get_comprehensive_analysis("150 Hancock Ave", "Is it safe?")
+    finally:
+        release.set()
+
+    assert result['crime_analysis'] is None
+    assert result['school_info'] == "schools"
+    assert result['zoning_info'] == "parcel"
+    assert "timed out" in result['error']
+    assert result['synthesis'] == "synthesis"
+    print("  ✓ Analysis returned without the slow crime stage")
+
+
+def test_datasets_computed_once():
+    """Assistants receive the stage results instead of refetching them"""
+    print("Testing single computation per dataset...")
+    zoning = mock.Mock(current_parcel="parcel")
+    school_lookup = mock.Mock(return_value="schools")
+    crime_lookup = mock.Mock(return_value="crime")
+
+    with mock.patch.object(unified_ai_assistant, 'get_school_info', school_lookup), \
+         mock.patch.object(unified_ai_assistant, 'analyze_crime_near_address', crime_lookup), \
+         mock.patch.object(unified_ai_assistant, 'get_nearby_zoning', return_value=zoning):
+        assistant = _assistant()
+        assistant.get_comprehensive_analysis("150 Hancock Ave", "Is it safe?")
+
+    assert school_lookup.call_count == 1
+    assert crime_lookup.call_count == 1
+    assert assistant.school_assistant.ask_claude_about_schools.call_args.kwargs['info'] == "schools"
+    assert assistant.crime_assistant.answer_crime_question.call_args.kwargs['analysis'] == "crime"
+    print("  ✓ Schools and crime each computed once")
+
+
+def test_cached_sections_reused():
+    """A repeat analysis reuses cached sections and only re-runs the synthesis"""
+    print("Testing result cache...")
+    zoning_lookup = mock.Mock(return_value=mock.Mock(current_parcel="parcel"))
+    school_lookup = mock.Mock(return_value="schools")
+    crime_lookup = mock.Mock(return_value="crime")
+
+    with mock.patch.object(unified_ai_assistant, 'get_school_info', school_lookup), \
+         mock.patch.object(unified_ai_assistant, 'analyze_crime_near_address', crime_lookup), \
+         mock.patch.object(unified_ai_assistant, 'get_nearby_zoning', zoning_lookup):
+        assistant = _assistant(ReportCache())
+        first = assistant.get_comprehensive_analysis("150 Hancock Ave", "Is it safe?", include_zoning=False)
+        # Same address, different spelling, zoning toggled on
+        second = assistant.get_comprehensive_analysis("150 Hancock Avenue", "Is it safe?")
+        # New question: data reused, assistants asked again
+        assistant.get_comprehensive_analysis("150 Hancock Ave", "Good for kids?")
+
+    assert school_lookup.call_count == 1
+    assert crime_lookup.call_count == 1
+    assert zoning_lookup.call_count == 1
+    assert assistant.school_assistant.ask_claude_about_schools.call_count == 2
+    assert assistant.crime_assistant.answer_crime_question.call_count == 2
+    assert assistant._synthesize_insights.call_count == 3
+    assert second['school_response'] == first['school_response']
+    assert second['zoning_info'] == "parcel"
+    print("  ✓ Lookups ran once, synthesis ran every time")
+
+
+if __name__ == "__main__":
+    test_stages_run_concurrently()
+    test_slow_stage_returns_partial_results()
+    test_datasets_computed_once()
+    test_cached_sections_reused()
+    print("\n✅ All unified fan-out tests passed")
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Test the process-wide warm start (local data only, no network)
+"""
+
+from unittest import mock
+
+import warm_start
+import street_index_lookup
+
+
+def test_warm_up_reports_every_step():
+    """Every resource is loaded and timed, in order"""
+    print("Testing warm-up timings...")
+    timings = warm_start.warm_up()
+
+    assert list(timings) == [name for name, _ in warm_start.WARM_UP_STEPS]
+    assert all(seconds is not None and seconds >= 0 for seconds in timings.values())
+    assert street_index_lookup._street_index is not None
+    print("  ✓ " + ", ".join(f"{name}={seconds * 1000:.0f}ms" for name, seconds in timings.items()))
+
+
+def test_failed_step_is_skipped():
+    """A resource that fails to load doesn't stop the others"""
+    print("Testing failed step...")
+    steps = [('broken', mock.Mock(side_effect=OSError("disk"))), ('ok', mock.Mock())]
+
+    with mock.patch.object(warm_start, 'WARM_UP_STEPS', steps):
+        timings = warm_start.warm_up()
+
+    assert timings['broken'] is None
+    assert timings['ok'] is not None
+    steps[1][1].assert_called_once()
+    assert 'broken: failed' in warm_start.format_timings(timings)
+    print("  ✓ Failure recorded, remaining steps ran")
+
+
+if __name__ == "__main__":
+    test_warm_up_reports_every_step()
+    test_failed_step_is_skipped()
+    print("\n✅ All warm start tests passed")
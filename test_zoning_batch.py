@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test bulk zoning extraction against fake envelope queries (no network)
+"""
+
+from unittest import mock
+
+import requests
+
+import http_client
+import zoning_batch
+import zoning_lookup
+from test_zoning_parcels import LAT, LON, STEP, _zoning, _future
+
+
+# Two neighborhoods ~5 km apart
+OTHER_LAT, OTHER_LON = LAT + 0.05, LON
+
+
+def _fake_layers():
+    zoning = [
+        _zoning('HOME', 'RS-8', LAT, LON),
+        _zoning('NEXT', 'C-G', LAT, LON + 2 * STEP),
+        _zoning('OTHER', 'I-N', OTHER_LAT, OTHER_LON),
+    ]
+    future = [
+        _future('HOME', 'Single-Family Residential', LAT, LON),
+        _future('OTHER', 'Industrial', OTHER_LAT, OTHER_LON),
+    ]
+    return {zoning_lookup.ZONING_API_URL: zoning, zoning_lookup.FUTURE_LAND_USE_API_URL: future}
+
+
+def test_batch_clusters_and_keeps_order():
+    """One envelope query per cluster and layer; results follow input order"""
+    print("Testing batch zoning...")
+    layers = _fake_layers()
+    envelopes = []
+
+    def fake_envelope(url, envelope):
+        envelopes.append((url, envelope))
+        xmin, ymin, xmax, ymax = envelope
+        return [f for f in layers[url]
+                if any(xmin <= x <= xmax and ymin <= y <= ymax for x, y in f['geometry']['rings'][0])]
+
+    points = [
+        (OTHER_LAT, OTHER_LON),
+        (LAT, LON),
+        (LAT, LON + 2 * STEP),
+        (LAT + 0.2 * STEP, LON),
+        (LAT - 0.02, LON - 0.02),   # Empty area
+    ]
+
+    with mock.patch('zoning_snapshot.get_zoning_snapshot', return_value=None), \
+         mock.patch.object(zoning_batch, 'query_envelope', side_effect=fake_envelope):
+        results = zoning_batch.get_zoning_for_points(points)
+
+    assert [r.parcel_number if r else None for r in results] == ['OTHER', 'HOME', 'NEXT', 'HOME', None]
+    assert results[1].future_land_use == 'Single-Family Residential'
+    assert results[1].nearby_zones == ['C-G']
+
+    # Three clusters x two layers, regardless of the four points in Athens
+    assert len(envelopes) == 6
+    print("  ✓ 5 points answered with 6 envelope queries, in order")
+
+
+def test_envelope_error_body_raises_http_error():
+    """An ArcGIS error payload surfaces as requests HTTPError, like the other layer queries"""
+    print("Testing envelope query errors...")
+    response = mock.Mock()
+    response.json.return_value = {'error': {'code': 400, 'message': 'Invalid query'}}
+
+    with mock.patch.object(http_client, 'get_session') as session:
+        session.return_value.get.return_value = response
+        try:
+            zoning_batch.query_envelope(zoning_lookup.ZONING_API_URL, (LON, LAT, LON + STEP, LAT + STEP))
+        except requests.exceptions.HTTPError as e:
+            assert 'Invalid query' in str(e)
+        else:
+            raise AssertionError("error payload was not raised")
+    print("  ✓ HTTPError raised")
+
+
+if __name__ == "__main__":
+    test_batch_clusters_and_keeps_order()
+    test_envelope_error_body_raises_http_error()
+    print("\n✅ All zoning batch tests passed")
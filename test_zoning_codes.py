@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Test the precomputed zoning code registry (no network)
+"""
+
+from zoning_lookup import (
+    ZONING_REGISTRY, ZoningInfo, classify_zoning_code, get_zoning_code_description,
+    _summarize_nearby, _identify_concerns
+)
+
+
+def _parcel(zone, future=''):
+    return ZoningInfo(
+        parcel_number=zone, pin='', address='', current_zoning=zone,
+        current_zoning_description='', combined_zoning=zone, split_zoned=False,
+        future_land_use=future, future_land_use_description='', future_changed=False,
+        acres=0.5, nearby_zones=[], nearby_future_use=[], latitude=0.0, longitude=0.0
+    )
+
+
+def test_registry_flags():
+    """Known and unknown codes get the same flags as the old prefix checks"""
+    print("Testing code classification...")
+    assert ZONING_REGISTRY['RS-8'].residential
+    assert ZONING_REGISTRY['MU'].commercial_or_mixed
+    assert ZONING_REGISTRY['I-G'].industrial
+    assert not ZONING_REGISTRY['G'].residential
+
+    unknown = classify_zoning_code('rs-8a')
+    assert unknown.residential and unknown.description == ZONING_REGISTRY['RS-8'].description
+    assert classify_zoning_code('Mixed Use').commercial_or_mixed
+    assert classify_zoning_code('').description == "Zoning: "
+    assert get_zoning_code_description('XYZ') == "Zoning: XYZ"
+    assert classify_zoning_code('XYZ') is classify_zoning_code('XYZ')
+    print("  ✓ Flags and descriptions match, unknown codes memoized")
+
+
+def test_single_pass_summary():
+    """Aggregated flags and diversity come from one pass"""
+    print("Testing nearby summary...")
+    parcels = [_parcel('RS-8'), _parcel('RS-8'), _parcel('C-G'), _parcel('I-N'), _parcel('')]
+    summary = _summarize_nearby(parcels)
+
+    assert summary['unique_zones'] == ['RS-8', 'C-G', 'I-N']
+    assert summary['zone_diversity_score'] == 3 / 5
+    assert summary['commercial_count'] == 1 and summary['industrial_count'] == 1
+    assert summary['commercial_nearby'] and summary['industrial_nearby']
+    assert not summary['residential_only']
+
+    assert _summarize_nearby([_parcel('RS-8'), _parcel('RM-1')])['residential_only']
+    assert not _summarize_nearby([])['residential_only']
+
+    concerns = _identify_concerns(_parcel('RS-8'), parcels, summary)
+    assert any('1 commercial' in c for c in concerns)
+    assert any('1 industrial' in c for c in concerns)
+    print("  ✓ Summary and concerns consistent")
+
+
+if __name__ == "__main__":
+    test_registry_flags()
+    test_single_pass_summary()
+    print("\n✅ All zoning code tests passed")
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Test zoning parcel selection against fake ArcGIS responses (no network)
+"""
+
+from unittest import mock
+
+import zoning_lookup
+
+
+LAT, LON = 33.9500, -83.3700
+
+# Roughly 11 m per 0.0001 degree
+STEP = 0.0001
+
+
+def _square(lat, lon, half=0.5 * STEP):
+    """Clockwise ArcGIS ring around a point"""
+    return {'rings': [[
+        [lon - half, lat - half], [lon - half, lat + half],
+        [lon + half, lat + half], [lon + half, lat - half],
+        [lon - half, lat - half],
+    ]]}
+
+
+def _zoning(parcel, zone, lat, lon, acres=0.25):
+    return {'attributes': {'PARCEL_NO': parcel, 'PIN': f'PIN-{parcel}', 'CurrentZn': zone,
+                           'CombinedZn': zone, 'Acres': acres, 'SplitZoned': None},
+            'geometry': _square(lat, lon)}
+
+
+def _future(parcel, use, lat, lon):
+    return {'attributes': {'PARCEL_NO': parcel, 'Updated_FL': use, 'Change': 'No'},
+            'geometry': _square(lat, lon)}
+
+
+def _layers():
+    # Listed out of distance order on purpose: ArcGIS returns OBJECTID order
+    zoning = [
+        _zoning('FAR', 'C-G', LAT + 20 * STEP, LON),            # ~220 m north
+        _zoning('NEXT', 'RM-1', LAT, LON + 2 * STEP),           # ~20 m east
+        _zoning('HOME', 'RS-8', LAT, LON),                      # Contains the point
+    ]
+    future = [
+        _future('FAR', 'General Commercial', LAT + 20 * STEP, LON),
+        _future('HOME', 'Single-Family Residential', LAT, LON),
+        _future('NEXT', 'Mixed Residential', LAT, LON + 2 * STEP),
+    ]
+    return {'features': zoning}, {'features': future}
+
+
+def _patched(calls):
+    zoning, future = _layers()
+
+    def fake_zoning(lat, lon, distance_meters=100):
+        calls.append(('zoning', distance_meters))
+        return zoning
+
+    def fake_future(lat, lon, distance_meters=100):
+        calls.append(('future', distance_meters))
+        return future
+
+    return (mock.patch.object(zoning_lookup, 'geocode_address', return_value=(LAT, LON)),
+            mock.patch.object(zoning_lookup, 'query_zoning_api', side_effect=fake_zoning),
+            mock.patch.object(zoning_lookup, 'query_future_land_use_api', side_effect=fake_future))
+
+
+def test_primary_parcel_by_containment():
+    """The parcel containing the point wins, not the first feature returned"""
+    print("Testing primary parcel selection...")
+    calls = []
+    geocode, zoning, future = _patched(calls)
+    with geocode, zoning, future:
+        info = zoning_lookup.get_zoning_info("1 Test St")
+
+    assert info.parcel_number == 'HOME'
+    assert info.current_zoning == 'RS-8'
+    assert info.future_land_use == 'Single-Family Residential'
+    assert info.nearby_zones == ['RM-1']   # FAR is outside PRIMARY_SEARCH_METERS
+    print("  ✓ Containing parcel selected, neighbors limited to 50 m")
+
+
+def test_nearby_zoning_single_pass():
+    """One query per layer feeds both the current parcel and its neighbors"""
+    print("Testing single-pass nearby zoning...")
+    calls = []
+    geocode, zoning, future = _patched(calls)
+    with geocode as geocoder, zoning, future:
+        nearby = zoning_lookup.get_nearby_zoning("1 Test St", radius_meters=250)
+        assert geocoder.call_count == 1
+
+    assert sorted(calls) == [('future', 250), ('zoning', 250)]
+    assert nearby.current_parcel.parcel_number == 'HOME'
+    assert sorted(p.parcel_number for p in nearby.nearby_parcels) == ['FAR', 'NEXT']
+    assert nearby.commercial_nearby
+    far = next(p for p in nearby.nearby_parcels if p.parcel_number == 'FAR')
+    assert far.future_land_use == 'General Commercial'
+    print("  ✓ Two API calls, one geocode")
+
+
+def test_missing_geometry_falls_back_to_api_order():
+    """Without geometry the first feature is used, as before"""
+    print("Testing fallback without geometry...")
+    ranked = zoning_lookup._rank_features(
+        [{'attributes': {'PARCEL_NO': 'A'}}, {'attributes': {'PARCEL_NO': 'B'}}], LAT, LON
+    )
+    assert [f['attributes']['PARCEL_NO'] for _, f in ranked] == ['A', 'B']
+    assert ranked[0][0] is None
+    print("  ✓ API order preserved")
+
+
+def test_future_land_use_join_normalizes_keys():
+    """Parcel numbers are joined after stripping whitespace; None is handled"""
+    print("Testing parcel join...")
+    index = zoning_lookup._index_by_parcel([
+        {'attributes': {'PARCEL_NO': ' 123 ', 'Updated_FL': 'Office'}},
+        {'attributes': {'PARCEL_NO': '123', 'Updated_FL': 'Duplicate'}},
+        {'attributes': {'PARCEL_NO': None, 'Updated_FL': None}},
+    ])
+    assert index['123']['Updated_FL'] == 'Office'
+    assert '' in index
+
+    info = zoning_lookup._build_zoning_info(
+        {'PARCEL_NO': '123 ', 'CurrentZn': None, 'SplitZoned': '  '}, index['123'], "x", LAT, LON
+    )
+    assert info.parcel_number == '123'
+    assert info.current_zoning == ''
+    assert not info.split_zoned
+    assert info.future_land_use == 'Office'
+    print("  ✓ First match wins, whitespace and None cleaned")
+
+
+def test_nearby_geometry_metrics():
+    """Nearby parcels sit at their centroids and feed distance-based metrics"""
+    print("Testing geometry metrics...")
+    calls = []
+    geocode, zoning, future = _patched(calls)
+    with geocode, zoning, future:
+        nearby = zoning_lookup.get_nearby_zoning("1 Test St", radius_meters=250)
+
+    far = next(p for p in nearby.nearby_parcels if p.parcel_number == 'FAR')
+    assert abs(far.latitude - (LAT + 20 * STEP)) < 1e-6
+    assert abs(far.longitude - LON) < 1e-6
+
+    assert 200 < nearby.nearest_commercial_meters < 240
+    assert nearby.nearest_industrial_meters is None
+    assert nearby.distance_rings == {'0-50m': 1, '50-100m': 0, '100-250m': 1, '250-500m': 0}
+    assert nearby.zone_mix_by_acreage == {'C-G': 0.5, 'RM-1': 0.5}
+    print("  ✓ Centroids, rings, zone mix and nearest distances computed")
+
+
+if __name__ == "__main__":
+    test_primary_parcel_by_containment()
+    test_nearby_zoning_single_pass()
+    test_missing_geometry_falls_back_to_api_order()
+    test_future_land_use_join_normalizes_keys()
+    test_nearby_geometry_metrics()
+    print("\n✅ All zoning parcel tests passed")
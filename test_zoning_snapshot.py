@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Test the local zoning snapshot (synthetic parcels, no network)
+"""
+
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+from unittest import mock
+
+import zoning_lookup
+import zoning_snapshot
+from zoning_snapshot import ZoningLayer, ZoningSnapshot, SNAPSHOT_MAX_AGE_DAYS
+from test_zoning_parcels import LAT, LON, STEP, _layers, _patched
+
+
+def _snapshot(synced_at=None):
+    zoning, future = _layers()
+    return ZoningSnapshot({
+        'zoning': ZoningLayer.from_features(zoning['features']),
+        'future_land_use': ZoningLayer.from_features(future['features']),
+    }, synced_at or datetime.now())
+
+
+def test_radius_query_matches_distance():
+    """Only parcels within the radius are returned, in layer order"""
+    print("Testing snapshot radius query...")
+    snapshot = _snapshot()
+
+    near = snapshot.query('zoning', LAT, LON, 50)['features']
+    assert [f['attributes']['PARCEL_NO'] for f in near] == ['NEXT', 'HOME']
+
+    wide = snapshot.query('zoning', LAT, LON, 250)['features']
+    assert [f['attributes']['PARCEL_NO'] for f in wide] == ['FAR', 'NEXT', 'HOME']
+
+    # Point inside HOME only, zero radius
+    inside = snapshot.query('zoning', LAT + 0.2 * STEP, LON, 0)['features']
+    assert [f['attributes']['PARCEL_NO'] for f in inside] == ['HOME']
+    print("  ✓ Radius and containment queries correct")
+
+
+def test_lookups_use_snapshot_before_api():
+    """With a snapshot loaded, zoning lookups make no HTTP requests"""
+    print("Testing snapshot-backed lookups...")
+    with mock.patch.object(zoning_snapshot, 'get_zoning_snapshot', return_value=_snapshot()), \
+         mock.patch.object(zoning_lookup, 'geocode_address', return_value=(LAT, LON)), \
+         mock.patch.object(zoning_lookup, 'get_session') as session:
+        start = time.perf_counter()
+        nearby = zoning_lookup.get_nearby_zoning("1 Test St", radius_meters=250)
+        elapsed = time.perf_counter() - start
+        session.return_value.get.assert_not_called()
+
+    assert nearby.current_parcel.parcel_number == 'HOME'
+    assert nearby.total_nearby_parcels == 2
+    print(f"  ✓ Nearby zoning answered locally in {elapsed * 1000:.1f} ms")
+
+
+def test_snapshot_geometry_reused():
+    """Snapshot results carry their geometry; nothing is re-projected, same answer as the API path"""
+    print("Testing snapshot geometry reuse...")
+    geocode, zoning, future = _patched([])
+    with geocode, zoning, future:
+        expected = zoning_lookup.get_nearby_zoning("1 Test St", radius_meters=250)
+
+    with mock.patch.object(zoning_snapshot, 'get_zoning_snapshot', return_value=_snapshot()), \
+         mock.patch.object(zoning_lookup, 'geocode_address', return_value=(LAT, LON)), \
+         mock.patch.object(zoning_lookup, '_parcel_shape', side_effect=AssertionError("re-projected")):
+        nearby = zoning_lookup.get_nearby_zoning("1 Test St", radius_meters=250)
+
+    assert nearby.current_parcel.parcel_number == expected.current_parcel.parcel_number
+    assert nearby.distance_rings == expected.distance_rings
+    assert nearby.zone_mix_by_acreage == expected.zone_mix_by_acreage
+    assert abs(nearby.nearest_commercial_meters - expected.nearest_commercial_meters) < 0.5
+    for got, want in zip(sorted(nearby.nearby_parcels, key=lambda p: p.parcel_number),
+                         sorted(expected.nearby_parcels, key=lambda p: p.parcel_number)):
+        assert got.parcel_number == want.parcel_number
+        assert abs(got.latitude - want.latitude) < 1e-6
+        assert abs(got.longitude - want.longitude) < 1e-6
+    print("  ✓ Snapshot shapes and distances reused")
+
+
+def test_save_load_and_staleness():
+    """Snapshots roundtrip through disk; stale ones are ignored"""
+    print("Testing snapshot persistence...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'zoning.pkl')
+        _snapshot().save(path)
+        assert os.listdir(tmp) == [os.path.basename(path)]
+
+        loaded = zoning_snapshot.get_zoning_snapshot(path)
+        assert loaded is not None
+        near = loaded.query('future_land_use', LAT, LON, 50)['features']
+        assert sorted(f['attributes']['PARCEL_NO'] for f in near) == ['HOME', 'NEXT']
+
+        stale = datetime.now() - timedelta(days=SNAPSHOT_MAX_AGE_DAYS + 1)
+        _snapshot(synced_at=stale).save(path)
+        os.utime(path, (time.time() + 5, time.time() + 5))
+        assert zoning_snapshot.get_zoning_snapshot(path) is None
+    print("  ✓ Roundtrip preserved parcels, stale snapshot skipped")
+
+
+if __name__ == "__main__":
+    test_radius_query_matches_distance()
+    test_lookups_use_snapshot_before_api()
+    test_snapshot_geometry_reused()
+    test_save_load_and_staleness()
+    print("\n✅ All zoning snapshot tests passed")
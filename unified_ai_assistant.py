@@ -5,6 +5,8 @@ Combines school and crime analysis for comprehensive neighborhood insights
 """
 
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from typing import Optional
 from datetime import datetime
 from school_info import get_school_info, CompleteSchoolInfo
@@ -12,6 +14,22 @@ from crime_analysis import analyze_crime_near_address, CrimeAnalysis
 from zoning_lookup import get_zoning_info, get_nearby_zoning, ZoningInfo, NearbyZoning
 from ai_school_assistant import SchoolAIAssistant
 from crime_ai_assistant import CrimeAIAssistant
+from report_cache import ReportCache
+
+
+# Seconds each data stage may take (measured from when all stages start)
+# before the analysis continues without it
+STAGE_TIMEOUT_SECONDS = {
+    'schools': 60,
+    'crime': 90,
+    'zoning': 45,
+}
+
+STAGE_LABELS = {
+    'schools': "School lookup",
+    'crime': "Crime analysis",
+    'zoning': "Zoning lookup",
+}
 
 
 class UnifiedAIAssistant:
@@ -20,12 +38,15 @@ class UnifiedAIAssistant:
     combining schools, crime, and synthesized insights
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, result_cache: Optional[ReportCache] = None):
         """
         Initialize unified assistant
 
         Args:
             api_key: Anthropic API key (will use ANTHROPIC_API_KEY env var if not provided)
+            result_cache: Optional cache of per-section results; when given,
+                repeated analyses reuse cached lookups and assistant answers
+                and only the synthesis is regenerated
         """
         if api_key is None:
             api_key = os.environ.get('ANTHROPIC_API_KEY')
@@ -36,6 +57,18 @@ class UnifiedAIAssistant:
         self.api_key = api_key
         self.school_assistant = SchoolAIAssistant(api_key=api_key)
         self.crime_assistant = CrimeAIAssistant(api_key=api_key)
+        self.result_cache = result_cache
+
+    def _cached(self, address: str, section: str, compute, **key):
+        """Return a cached section result, computing and storing it on a miss"""
+        if self.result_cache is None:
+            return compute()
+
+        value = self.result_cache.get(address, section, **key)
+        if value is None:
+            value = compute()
+            self.result_cache.set(address, section, value, **key)
+        return value
 
     def get_comprehensive_analysis(
         self,
@@ -50,6 +83,10 @@ class UnifiedAIAssistant:
         """
         Get comprehensive analysis combining schools, crime, and zoning data
 
+        The school, crime and zoning stages run concurrently. A stage that
+        exceeds its STAGE_TIMEOUT_SECONDS budget is left out of the result
+        (with an error noted) rather than holding up the whole analysis.
+
         Args:
             address: Street address in Athens-Clarke County
             question: User's question about the area
@@ -75,55 +112,40 @@ class UnifiedAIAssistant:
         }
 
         try:
-            # Get school data if requested
+            # Run the data stages concurrently; each only touches its own keys
+            stages = []
             if include_schools:
-                try:
-                    school_info = get_school_info(address)
-                    result['school_info'] = school_info
-
-                    if school_info:
-                        school_response = self.school_assistant.ask_claude_about_schools(
-                            address, question
-                        )
-                        result['school_response'] = school_response
-                except Exception as e:
-                    result['error'] = f"School lookup error: {str(e)}"
-
-            # Get crime data if requested
+                stages.append(('schools', self._school_stage, (address, question)))
             if include_crime:
-                try:
-                    crime_analysis = analyze_crime_near_address(
-                        address,
-                        radius_miles=radius_miles,
-                        months_back=months_back
-                    )
-                    result['crime_analysis'] = crime_analysis
-
-                    if crime_analysis:
-                        crime_response = self.crime_assistant.answer_crime_question(
-                            address, question, radius_miles=radius_miles, months_back=months_back
-                        )
-                        result['crime_response'] = crime_response
-                except Exception as e:
-                    # Crime errors are less critical - address might not geocode
-                    result['error'] = f"Crime analysis error: {str(e)}"
-
-            # Get zoning data if requested
+                stages.append(('crime', self._crime_stage, (address, question, radius_miles, months_back)))
             if include_zoning:
-                try:
-                    # Use nearby zoning analysis for comprehensive insights
-                    nearby_zoning = get_nearby_zoning(address, radius_meters=250)
-                    if nearby_zoning and nearby_zoning.current_parcel:
-                        # Store the basic zoning info for backward compatibility
-                        result['zoning_info'] = nearby_zoning.current_parcel
-                        # Also store the nearby analysis
-                        result['nearby_zoning'] = nearby_zoning
-                    else:
-                        # Fallback to basic zoning if nearby analysis fails
-                        result['zoning_info'] = get_zoning_info(address)
-                except Exception as e:
-                    # Zoning errors are non-critical
-                    print(f"Zoning lookup error: {str(e)}")
+                stages.append(('zoning', self._zoning_stage, (address,)))
+
+            executor = ThreadPoolExecutor(max_workers=max(len(stages), 1))
+            futures = [(name, executor.submit(stage, *args)) for name, stage, args in stages]
+
+            started = time.monotonic()
+            try:
+                # Collect in a fixed order so error reporting matches the old sequential flow
+                for name, future in futures:
+                    remaining = STAGE_TIMEOUT_SECONDS[name] - (time.monotonic() - started)
+                    try:
+                        stage_result = future.result(timeout=max(remaining, 0))
+                    except FutureTimeoutError:
+                        # Return what we have; the slow stage keeps running in the background
+                        message = f"{STAGE_LABELS[name]} timed out after {STAGE_TIMEOUT_SECONDS[name]}s"
+                        if name == 'zoning':
+                            print(message)
+                        else:
+                            result['error'] = message
+                        continue
+
+                    error = stage_result.pop('error', None)
+                    result.update(stage_result)
+                    if error:
+                        result['error'] = error
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
 
             # Generate synthesis if we have data
             if result['school_info'] or result['crime_analysis'] or result['zoning_info']:
@@ -143,6 +165,76 @@ class UnifiedAIAssistant:
             result['error'] = f"Analysis error: {str(e)}"
             return result
 
+    def _school_stage(self, address: str, question: str) -> dict:
+        """Look up schools and ask the school assistant (runs in a worker thread)"""
+        stage_result = {}
+        try:
+            school_info = self._cached(address, 'schools', lambda: get_school_info(address))
+            stage_result['school_info'] = school_info
+
+            if school_info:
+                # Reuse the lookup instead of letting the assistant repeat it
+                school_response = self._cached(
+                    address, 'school_response',
+                    lambda: self.school_assistant.ask_claude_about_schools(address, question, info=school_info),
+                    question=question
+                )
+                stage_result['school_response'] = school_response
+        except Exception as e:
+            stage_result['error'] = f"School lookup error: {str(e)}"
+        return stage_result
+
+    def _crime_stage(self, address: str, question: str, radius_miles: float, months_back: int) -> dict:
+        """Analyze crime and ask the crime assistant (runs in a worker thread)"""
+        stage_result = {}
+        try:
+            crime_analysis = self._cached(
+                address, 'crime',
+                lambda: analyze_crime_near_address(address, radius_miles=radius_miles, months_back=months_back),
+                radius_miles=radius_miles, months_back=months_back
+            )
+            stage_result['crime_analysis'] = crime_analysis
+
+            if crime_analysis:
+                # Reuse the analysis instead of letting the assistant repeat it
+                crime_response = self._cached(
+                    address, 'crime_response',
+                    lambda: self.crime_assistant.answer_crime_question(
+                        address, question, radius_miles=radius_miles, months_back=months_back,
+                        analysis=crime_analysis
+                    ),
+                    radius_miles=radius_miles, months_back=months_back, question=question
+                )
+                stage_result['crime_response'] = crime_response
+        except Exception as e:
+            # Crime errors are less critical - address might not geocode
+            stage_result['error'] = f"Crime analysis error: {str(e)}"
+        return stage_result
+
+    def _zoning_stage(self, address: str) -> dict:
+        """Look up zoning for the address and its neighbors (runs in a worker thread)"""
+        try:
+            zoning = self._cached(address, 'zoning', lambda: self._lookup_zoning(address))
+            # Copy so callers can't alter the cached entry
+            return dict(zoning) if zoning else {}
+        except Exception as e:
+            # Zoning errors are non-critical
+            print(f"Zoning lookup error: {str(e)}")
+            return {}
+
+    def _lookup_zoning(self, address: str) -> Optional[dict]:
+        """Zoning result keys for the address, or None if no parcel was found"""
+        # Use nearby zoning analysis for comprehensive insights
+        nearby_zoning = get_nearby_zoning(address, radius_meters=250)
+        if nearby_zoning and nearby_zoning.current_parcel:
+            # Store the basic zoning info for backward compatibility,
+            # plus the nearby analysis
+            return {'zoning_info': nearby_zoning.current_parcel, 'nearby_zoning': nearby_zoning}
+
+        # Fallback to basic zoning if nearby analysis fails
+        zoning_info = get_zoning_info(address)
+        return {'zoning_info': zoning_info} if zoning_info else None
+
     def _synthesize_insights(
         self,
         address: str,
@@ -272,6 +364,12 @@ NEIGHBORHOOD ZONING ANALYSIS (250m radius):
                 else:
                     zoning_summary += "  → High diversity: Transitional or evolving area\n"
 
+                # Distance to the nearest non-residential uses
+                if nearby_zoning.nearest_commercial_meters is not None:
+                    zoning_summary += f"- Nearest commercial/mixed-use parcel: ~{nearby_zoning.nearest_commercial_meters:.0f}m away\n"
+                if nearby_zoning.nearest_industrial_meters is not None:
+                    zoning_summary += f"- Nearest industrial parcel: ~{nearby_zoning.nearest_industrial_meters:.0f}m away\n"
+
                 # Pattern flags
                 if nearby_zoning.residential_only:
                     zoning_summary += "- Neighborhood character: Residential only\n"
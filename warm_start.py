@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Process-wide warm start for the web app
+Loads the local indexes and shared clients once per server process, so the
+first request of each browser session doesn't pay their cold-start cost
+
+Usage:
+    python warm_start.py    # Warm everything up and print the timings
+"""
+
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+def _street_index():
+    from street_index_lookup import get_street_index
+    get_street_index()
+
+
+def _school_performance():
+    from school_performance import get_performance_db
+    get_performance_db()
+
+
+def _geocoder():
+    from geocoding import get_geolocator
+    from address_points import get_address_index
+    get_geolocator()
+    get_address_index()
+
+
+def _http_session():
+    from http_client import get_session
+    get_session()
+
+
+def _crime_store():
+    from crime_store import get_crime_store
+    get_crime_store()
+
+
+def _zoning_snapshot():
+    from zoning_snapshot import get_zoning_snapshot
+    get_zoning_snapshot()
+
+
+# Resources loaded by warm_up(), in order: (name, loader)
+WARM_UP_STEPS: List[Tuple[str, Callable[[], None]]] = [
+    ('street_index', _street_index),
+    ('school_performance', _school_performance),
+    ('geocoder', _geocoder),
+    ('http_session', _http_session),
+    ('crime_store', _crime_store),
+    ('zoning_snapshot', _zoning_snapshot),
+]
+
+
+def warm_up() -> Dict[str, Optional[float]]:
+    """
+    Load every shared resource into this process
+
+    Every resource is a process-wide singleton, so later lookups reuse what
+    is loaded here. A resource that fails to load is skipped; its lookups
+    fall back to loading on demand as before.
+
+    Returns:
+        Dict of resource name -> seconds taken (None if it failed), in load order
+    """
+    timings = {}
+    for name, load in WARM_UP_STEPS:
+        start = time.perf_counter()
+        try:
+            load()
+            timings[name] = time.perf_counter() - start
+        except Exception as e:
+            print(f"⚠️  Warm-up of {name} failed: {e}")
+            timings[name] = None
+    return timings
+
+
+def format_timings(timings: Dict[str, Optional[float]]) -> str:
+    """One line per resource, e.g. "street_index: 12 ms" """
+    lines = []
+    for name, seconds in timings.items():
+        lines.append(f"{name}: {seconds * 1000:.0f} ms" if seconds is not None else f"{name}: failed")
+    total = sum(seconds for seconds in timings.values() if seconds is not None)
+    lines.append(f"total: {total * 1000:.0f} ms")
+    return "\n".join(lines)
+
+
+def main():
+    """Warm up and print timings"""
+    print("🔄 Warming up...")
+    print(format_timings(warm_up()))
+
+
+if __name__ == "__main__":
+    main()
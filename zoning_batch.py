@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Bulk zoning lookup for many properties at once
+Groups points into spatial clusters and issues one envelope query per
+cluster and layer, then assigns parcels to points locally
+
+Usage:
+    python zoning_batch.py addresses.txt    # One address per line; prints a CSV
+"""
+
+import sys
+import csv
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import shapely
+from shapely.strtree import STRtree
+
+from http_client import query_all_pages
+from zoning_lookup import (
+    ZoningInfo, ZONING_API_URL, FUTURE_LAND_USE_API_URL, GEOMETRY_OFFSET_DEGREES,
+    METERS_PER_DEGREE_LAT, PRIMARY_SEARCH_METERS,
+    geocode_address, _parcel_shape, _rank_features, _primary_parcel_info, _to_local_meters
+)
+
+
+# Points in the same square cell of this size share one envelope query
+CLUSTER_CELL_METERS = 1000
+
+# Records per page for envelope queries
+BATCH_PAGE_SIZE = 1000
+
+LAYER_URLS = {
+    'zoning': ZONING_API_URL,
+    'future_land_use': FUTURE_LAND_USE_API_URL,
+}
+
+
+def _cluster_points(points: Sequence[Tuple[float, float]]) -> Dict[Tuple[int, int], List[int]]:
+    """
+    Group point indices by grid cell
+
+    Returns:
+        Dict of cell -> indices of the points in it (input order)
+    """
+    if not points:
+        return {}
+
+    ref_lat = float(np.mean([lat for lat, _ in points]))
+    meters_per_degree_lon = METERS_PER_DEGREE_LAT * math.cos(math.radians(ref_lat))
+
+    clusters = {}
+    for i, (lat, lon) in enumerate(points):
+        cell = (int(math.floor(lon * meters_per_degree_lon / CLUSTER_CELL_METERS)),
+                int(math.floor(lat * METERS_PER_DEGREE_LAT / CLUSTER_CELL_METERS)))
+        clusters.setdefault(cell, []).append(i)
+    return clusters
+
+
+def _envelope(points: Sequence[Tuple[float, float]], margin_meters: float) -> Tuple[float, float, float, float]:
+    """Bounding box (xmin, ymin, xmax, ymax) in degrees around points, padded by a margin"""
+    lats = [lat for lat, _ in points]
+    lons = [lon for _, lon in points]
+    lat_margin = margin_meters / METERS_PER_DEGREE_LAT
+    lon_margin = margin_meters / (METERS_PER_DEGREE_LAT * math.cos(math.radians(max(map(abs, lats)))))
+    return (min(lons) - lon_margin, min(lats) - lat_margin,
+            max(lons) + lon_margin, max(lats) + lat_margin)
+
+
+def query_envelope(url: str, envelope: Tuple[float, float, float, float]) -> List[dict]:
+    """
+    Fetch every parcel intersecting a bounding box (follows pagination)
+
+    Args:
+        url: Layer query URL
+        envelope: (xmin, ymin, xmax, ymax) in WGS84 degrees
+
+    Returns:
+        List of ArcGIS features with generalized WGS84 geometry
+
+    Raises:
+        requests.RequestException: If any page fails
+    """
+    params = {
+        'geometry': ','.join(f'{v:.6f}' for v in envelope),
+        'geometryType': 'esriGeometryEnvelope',
+        'inSR': '4326',
+        'spatialRel': 'esriSpatialRelIntersects',
+        'outFields': '*',
+        'returnGeometry': 'true',
+        'outSR': '4326',
+        'maxAllowableOffset': GEOMETRY_OFFSET_DEGREES,
+        'geometryPrecision': 6,
+        'f': 'json'
+    }
+    return query_all_pages(url, params, page_size=BATCH_PAGE_SIZE, timeout=30)
+
+
+class _ClusterParcels:
+    """One layer's parcels for a cluster, indexed for local radius queries"""
+
+    def __init__(self, features: List[dict], origin: Tuple[float, float]):
+        self.features = features
+        self.origin = origin
+        self.tree = STRtree(np.array([_parcel_shape(f.get('geometry'), *origin) for f in features],
+                                     dtype=object))
+
+    def near(self, latitude: float, longitude: float, distance_meters: float) -> List[dict]:
+        """Features within a distance of a point, in layer order"""
+        point = shapely.Point(*_to_local_meters(latitude, longitude, *self.origin))
+        hits = self.tree.query(point, predicate='dwithin', distance=distance_meters)
+        return [self.features[i] for i in np.sort(hits)]
+
+
+def get_zoning_for_points(points: Sequence[Tuple[float, float]],
+                          addresses: Optional[Sequence[str]] = None) -> List[Optional[ZoningInfo]]:
+    """
+    Get zoning for many geocoded points with as few API queries as possible
+
+    With a synced zoning snapshot every point is answered locally. Otherwise
+    points are grouped into CLUSTER_CELL_METERS cells; each cell costs one
+    envelope query per layer, and each point then gets the same parcel
+    selection as get_zoning_info: the parcel containing it (or the nearest
+    one), with neighbors within PRIMARY_SEARCH_METERS.
+
+    Args:
+        points: (latitude, longitude) per property
+        addresses: Optional address label per point (default: "lat, lon")
+
+    Returns:
+        ZoningInfo (or None if no parcel was found) for each point, in input order
+    """
+    results: List[Optional[ZoningInfo]] = [None] * len(points)
+
+    def _assign(i, near):
+        latitude, longitude = points[i]
+        zoning = near('zoning', latitude, longitude)
+        if not zoning['features']:
+            return
+        future = near('future_land_use', latitude, longitude)
+        address = addresses[i] if addresses else f"{latitude:.6f}, {longitude:.6f}"
+        results[i] = _primary_parcel_info(
+            address, latitude, longitude,
+            _rank_features(zoning['features'], latitude, longitude, zoning.get('distances')),
+            _rank_features(future['features'], latitude, longitude, future.get('distances'))
+        )
+
+    # A synced snapshot answers every point locally
+    from zoning_snapshot import get_zoning_snapshot
+    snapshot = get_zoning_snapshot()
+    if snapshot is not None:
+        def near_snapshot(layer, latitude, longitude):
+            return snapshot.query(layer, latitude, longitude, PRIMARY_SEARCH_METERS)
+
+        for i in range(len(points)):
+            _assign(i, near_snapshot)
+        return results
+
+    for indices in _cluster_points(points).values():
+        cluster_points = [points[i] for i in indices]
+        envelope = _envelope(cluster_points, PRIMARY_SEARCH_METERS)
+        origin = ((envelope[1] + envelope[3]) / 2, (envelope[0] + envelope[2]) / 2)
+
+        try:
+            layers = {name: _ClusterParcels(query_envelope(url, envelope), origin)
+                      for name, url in LAYER_URLS.items()}
+        except Exception as e:
+            print(f"⚠️  Zoning batch query failed for {len(indices)} point(s): {e}")
+            continue
+
+        def near_cluster(layer, latitude, longitude):
+            return {'features': layers[layer].near(latitude, longitude, PRIMARY_SEARCH_METERS)}
+
+        for i in indices:
+            _assign(i, near_cluster)
+
+    return results
+
+
+def get_zoning_for_addresses(addresses: Sequence[str]) -> List[Optional[ZoningInfo]]:
+    """
+    Geocode addresses and look up their zoning in bulk
+
+    Args:
+        addresses: Street addresses in Athens-Clarke County
+
+    Returns:
+        ZoningInfo (or None if not geocoded/found) for each address, in input order
+    """
+    coords = [geocode_address(address) for address in addresses]
+    located = [i for i, c in enumerate(coords) if c]
+
+    found = get_zoning_for_points([coords[i] for i in located], [addresses[i] for i in located])
+
+    results: List[Optional[ZoningInfo]] = [None] * len(addresses)
+    for i, info in zip(located, found):
+        results[i] = info
+    return results
+
+
+def main():
+    """Look up zoning for every address in a file and print CSV"""
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+
+    with open(sys.argv[1], 'r') as f:
+        addresses = [line.strip() for line in f if line.strip()]
+
+    writer = csv.writer(sys.stdout)
+    writer.writerow(['address', 'parcel_number', 'current_zoning', 'future_land_use', 'acres'])
+    for address, info in zip(addresses, get_zoning_for_addresses(addresses)):
+        if info:
+            writer.writerow([address, info.parcel_number, info.current_zoning, info.future_land_use, info.acres])
+        else:
+            writer.writerow([address, '', '', '', ''])
+
+
+if __name__ == "__main__":
+    main()
@@ -4,10 +4,44 @@ Athens-Clarke County Zoning Lookup
 Retrieves zoning and future land use information for properties
 """
 
-import requests
-from dataclasses import dataclass
-from typing import Optional, List, Tuple
-from geopy.geocoders import Nominatim
+import sys
+import math
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Optional, List, Tuple, Dict
+import numpy as np
+from shapely.geometry import Point, Polygon, MultiPolygon
+from geocoding import geocode
+from http_client import get_session
+from response_cache import ResponseCache
+
+
+# ArcGIS REST API endpoints for Athens-Clarke County parcel layers
+ZONING_API_URL = "https://enigma.accgov.com/server/rest/services/Parcel_Zoning_Types/FeatureServer/0/query"
+FUTURE_LAND_USE_API_URL = "https://enigma.accgov.com/server/rest/services/FutureLandUse/FeatureServer/0/query"
+
+# Live zoning responses are cached on disk this long (zoning changes rarely)
+ZONING_CACHE_TTL_DAYS = 30
+ZONING_CACHE_MAX_ENTRIES = 5000
+
+# Cache keys round coordinates to this many decimals (~1 m)
+ZONING_CACHE_COORD_DECIMALS = 5
+
+# Parcels within this distance of the address count as its immediate neighbors
+PRIMARY_SEARCH_METERS = 50
+
+# Parcel outlines are simplified server-side to about this tolerance (degrees, ~1 m)
+GEOMETRY_OFFSET_DEGREES = 0.00001
+
+# Outer edges of the distance rings reported for nearby parcels
+DISTANCE_RING_EDGES_METERS = (50, 100, 250, 500)
+
+# Meters per degree of latitude (local equirectangular projection)
+METERS_PER_DEGREE_LAT = 111320.0
+
+
+_zoning_cache = ResponseCache('zoning', ttl_days=ZONING_CACHE_TTL_DAYS,
+                              max_entries=ZONING_CACHE_MAX_ENTRIES)
 
 
 @dataclass
@@ -64,64 +98,95 @@ class NearbyZoning:
     unique_zones: List[str]
     zone_diversity_score: float  # 0.0 (all same) to 1.0 (all different)
 
-
-def get_zoning_code_description(code: str) -> str:
-    """
-    Get human-readable description of zoning code
-
-    Args:
-        code: Zoning code (e.g., "RS-8", "C-D", "G")
-
-    Returns:
-        Description of the zoning classification
-    """
-    zoning_descriptions = {
-        # Residential - Single Family
-        'RS-40': 'Single-Family Residential (40,000 sq ft minimum lot)',
-        'RS-25': 'Single-Family Residential (25,000 sq ft minimum lot)',
-        'RS-15': 'Single-Family Residential (15,000 sq ft minimum lot)',
-        'RS-8': 'Single-Family Residential (8,000 sq ft minimum lot)',
-        'RS-5': 'Single-Family Residential (5,000 sq ft minimum lot)',
-
-        # Residential - Multi-Family
-        'RM-1': 'Multi-Family Residential (Low Density)',
-        'RM-2': 'Multi-Family Residential (Medium Density)',
-        'RM-3': 'Multi-Family Residential (High Density)',
-
-        # Commercial
-        'C-N': 'Commercial-Neighborhood (Local retail and services)',
-        'C-G': 'Commercial-General (Broad range of commercial uses)',
-        'C-D': 'Commercial-Downtown (Downtown core commercial)',
-        'C-R': 'Commercial-Regional (Large-scale retail)',
-
-        # Mixed Use
-        'MU': 'Mixed Use (Residential and commercial)',
-        'MU-C': 'Mixed Use-Commercial',
-        'MU-R': 'Mixed Use-Residential',
-
-        # Industrial
-        'I-N': 'Industrial-Neighborhood (Light industrial)',
-        'I-G': 'Industrial-General (Heavy industrial)',
-
-        # Government/Institutional
-        'G': 'Government/Institutional',
-        'G-I': 'Government-Institutional',
-
-        # Agricultural
-        'A-R': 'Agricultural-Residential',
-
-        # Special
-        'PUD': 'Planned Unit Development',
-        'PRD': 'Planned Residential Development',
-    }
-
+    # Geometry-based metrics (distances from the address to parcel centroids)
+    distance_rings: Dict[str, int] = field(default_factory=dict)  # Parcel count per ring, e.g. "0-50m"
+    zone_mix_by_acreage: Dict[str, float] = field(default_factory=dict)  # Zone -> share of nearby acreage
+    nearest_commercial_meters: Optional[float] = None
+    nearest_industrial_meters: Optional[float] = None
+
+
+# Zoning code -> human-readable description
+ZONING_DESCRIPTIONS = {
+    # Residential - Single Family
+    'RS-40': 'Single-Family Residential (40,000 sq ft minimum lot)',
+    'RS-25': 'Single-Family Residential (25,000 sq ft minimum lot)',
+    'RS-15': 'Single-Family Residential (15,000 sq ft minimum lot)',
+    'RS-8': 'Single-Family Residential (8,000 sq ft minimum lot)',
+    'RS-5': 'Single-Family Residential (5,000 sq ft minimum lot)',
+
+    # Residential - Multi-Family
+    'RM-1': 'Multi-Family Residential (Low Density)',
+    'RM-2': 'Multi-Family Residential (Medium Density)',
+    'RM-3': 'Multi-Family Residential (High Density)',
+
+    # Commercial
+    'C-N': 'Commercial-Neighborhood (Local retail and services)',
+    'C-G': 'Commercial-General (Broad range of commercial uses)',
+    'C-D': 'Commercial-Downtown (Downtown core commercial)',
+    'C-R': 'Commercial-Regional (Large-scale retail)',
+
+    # Mixed Use
+    'MU': 'Mixed Use (Residential and commercial)',
+    'MU-C': 'Mixed Use-Commercial',
+    'MU-R': 'Mixed Use-Residential',
+
+    # Industrial
+    'I-N': 'Industrial-Neighborhood (Light industrial)',
+    'I-G': 'Industrial-General (Heavy industrial)',
+
+    # Government/Institutional
+    'G': 'Government/Institutional',
+    'G-I': 'Government-Institutional',
+
+    # Agricultural
+    'A-R': 'Agricultural-Residential',
+
+    # Special
+    'PUD': 'Planned Unit Development',
+    'PRD': 'Planned Residential Development',
+}
+
+# Future land use designation -> planned use description
+FUTURE_USE_DESCRIPTIONS = {
+    'Single-Family Residential': 'Planned for detached single-family homes',
+    'Multi-Family Residential': 'Planned for apartments or condos',
+    'Mixed Residential': 'Planned for variety of housing types',
+    'Neighborhood Commercial': 'Planned for local shops and services',
+    'General Commercial': 'Planned for broader commercial development',
+    'Downtown Commercial': 'Planned for downtown-style development',
+    'Office': 'Planned for office buildings',
+    'Industrial': 'Planned for industrial/manufacturing uses',
+    'Government': 'Planned for public/institutional uses',
+    'Parks and Recreation': 'Planned for parks, trails, recreation',
+    'Conservation': 'Planned for environmental conservation',
+    'Mixed Use': 'Planned for combination of residential and commercial',
+}
+
+# Code prefixes for each use class
+RESIDENTIAL_PREFIXES = ('RS-', 'RM-', 'R-', 'A-R', 'PRD')
+COMMERCIAL_PREFIXES = ('C-', 'MU-', 'MU')
+INDUSTRIAL_PREFIXES = ('I-', 'IN-', 'IND-')
+
+
+@dataclass(frozen=True)
+class ZoningCodeClass:
+    """Precomputed description and use-class flags for one zoning code"""
+    code: str
+    description: str
+    residential: bool
+    commercial_or_mixed: bool
+    industrial: bool
+
+
+def _describe_code(code: str) -> str:
+    """Description for a zoning code (exact match, then prefix match)"""
     # Try exact match first
-    if code in zoning_descriptions:
-        return zoning_descriptions[code]
+    if code in ZONING_DESCRIPTIONS:
+        return ZONING_DESCRIPTIONS[code]
 
     # Try partial match for variants
     code_upper = code.upper().strip()
-    for key, description in zoning_descriptions.items():
+    for key, description in ZONING_DESCRIPTIONS.items():
         if code_upper.startswith(key):
             return description
 
@@ -129,131 +194,134 @@ def get_zoning_code_description(code: str) -> str:
     return f"Zoning: {code}"
 
 
-def get_future_land_use_description(land_use: str) -> str:
+@lru_cache(maxsize=None)
+def classify_zoning_code(code: str) -> ZoningCodeClass:
     """
-    Get human-readable description of future land use
+    Get the description and use-class flags for a zoning code
+
+    Known codes come from ZONING_REGISTRY; anything else is classified once
+    and memoized, so each distinct code is only examined a single time.
 
     Args:
-        land_use: Future land use designation
+        code: Zoning code (e.g., "RS-8", "C-D", "G")
 
     Returns:
-        Description of planned future use
+        ZoningCodeClass for the code
     """
-    future_use_descriptions = {
-        'Single-Family Residential': 'Planned for detached single-family homes',
-        'Multi-Family Residential': 'Planned for apartments or condos',
-        'Mixed Residential': 'Planned for variety of housing types',
-        'Neighborhood Commercial': 'Planned for local shops and services',
-        'General Commercial': 'Planned for broader commercial development',
-        'Downtown Commercial': 'Planned for downtown-style development',
-        'Office': 'Planned for office buildings',
-        'Industrial': 'Planned for industrial/manufacturing uses',
-        'Government': 'Planned for public/institutional uses',
-        'Parks and Recreation': 'Planned for parks, trails, recreation',
-        'Conservation': 'Planned for environmental conservation',
-        'Mixed Use': 'Planned for combination of residential and commercial',
-    }
-
-    # Try exact match
-    if land_use in future_use_descriptions:
-        return future_use_descriptions[land_use]
+    code_upper = code.upper().strip() if code else ''
+    return ZoningCodeClass(
+        code=sys.intern(code or ''),
+        description=_describe_code(code or ''),
+        residential=bool(code_upper) and code_upper.startswith(RESIDENTIAL_PREFIXES),
+        commercial_or_mixed=bool(code_upper) and (code_upper.startswith(COMMERCIAL_PREFIXES)
+                                                   or code_upper == 'MIXED USE'),
+        industrial=bool(code_upper) and code_upper.startswith(INDUSTRIAL_PREFIXES)
+    )
 
-    # Try case-insensitive partial match
-    land_use_lower = land_use.lower()
-    for key, description in future_use_descriptions.items():
-        if key.lower() in land_use_lower or land_use_lower in key.lower():
-            return description
 
-    # Default
-    return f"Planned for: {land_use}"
+# Every known code, classified once at import
+ZONING_REGISTRY = {code: classify_zoning_code(code) for code in ZONING_DESCRIPTIONS}
 
 
-def _is_residential(zoning_code: str) -> bool:
+def get_zoning_code_description(code: str) -> str:
     """
-    Check if a zoning code is residential
+    Get human-readable description of zoning code
 
     Args:
-        zoning_code: Zoning code to check
+        code: Zoning code (e.g., "RS-8", "C-D", "G")
 
     Returns:
-        True if residential, False otherwise
+        Description of the zoning classification
     """
-    if not zoning_code:
-        return False
-
-    code_upper = zoning_code.upper().strip()
-
-    # Residential patterns
-    residential_prefixes = ['RS-', 'RM-', 'R-', 'A-R', 'PRD']
-
-    for prefix in residential_prefixes:
-        if code_upper.startswith(prefix):
-            return True
+    return classify_zoning_code(code).description
 
-    return False
 
-
-def _is_commercial_or_mixed(zoning_code: str) -> bool:
+@lru_cache(maxsize=None)
+def get_future_land_use_description(land_use: str) -> str:
     """
-    Check if a zoning code is commercial or mixed use
+    Get human-readable description of future land use
 
     Args:
-        zoning_code: Zoning code to check
+        land_use: Future land use designation
 
     Returns:
-        True if commercial/mixed, False otherwise
+        Description of planned future use
     """
-    if not zoning_code:
-        return False
+    # Try exact match
+    if land_use in FUTURE_USE_DESCRIPTIONS:
+        return FUTURE_USE_DESCRIPTIONS[land_use]
 
-    code_upper = zoning_code.upper().strip()
+    # Try case-insensitive partial match
+    land_use_lower = land_use.lower()
+    for key, description in FUTURE_USE_DESCRIPTIONS.items():
+        if key.lower() in land_use_lower or land_use_lower in key.lower():
+            return description
+
+    # Default
+    return f"Planned for: {land_use}"
 
-    # Commercial and mixed use patterns
-    commercial_prefixes = ['C-', 'MU-', 'MU']
 
-    for prefix in commercial_prefixes:
-        if code_upper.startswith(prefix):
-            return True
+def _is_residential(zoning_code: str) -> bool:
+    """Check if a zoning code is residential"""
+    return classify_zoning_code(zoning_code).residential
 
-    # Exact matches for mixed use
-    if code_upper in ['MU', 'MIXED USE']:
-        return True
 
-    return False
+def _is_commercial_or_mixed(zoning_code: str) -> bool:
+    """Check if a zoning code is commercial or mixed use"""
+    return classify_zoning_code(zoning_code).commercial_or_mixed
 
 
 def _is_industrial(zoning_code: str) -> bool:
+    """Check if a zoning code is industrial"""
+    return classify_zoning_code(zoning_code).industrial
+
+
+def _summarize_nearby(nearby_parcels: List[ZoningInfo]) -> dict:
     """
-    Check if a zoning code is industrial
+    Aggregate use-class flags and zone diversity in one pass
 
     Args:
-        zoning_code: Zoning code to check
+        nearby_parcels: List of nearby parcel zoning info
 
     Returns:
-        True if industrial, False otherwise
+        Dict with unique_zones, zone_diversity_score, commercial_count,
+        industrial_count, residential_only, commercial_nearby and
+        industrial_nearby
     """
-    if not zoning_code:
-        return False
-
-    code_upper = zoning_code.upper().strip()
-
-    # Industrial patterns
-    industrial_prefixes = ['I-', 'IN-', 'IND-']
-
-    for prefix in industrial_prefixes:
-        if code_upper.startswith(prefix):
-            return True
-
-    return False
+    unique_zones = {}
+    commercial_count = 0
+    industrial_count = 0
+    residential_only = bool(nearby_parcels)
+
+    for parcel in nearby_parcels:
+        code_class = classify_zoning_code(parcel.current_zoning)
+        if parcel.current_zoning:
+            unique_zones[code_class.code] = None
+        commercial_count += code_class.commercial_or_mixed
+        industrial_count += code_class.industrial
+        residential_only = residential_only and code_class.residential
+
+    total = len(nearby_parcels)
+    return {
+        'unique_zones': list(unique_zones),
+        'zone_diversity_score': len(unique_zones) / total if total > 0 else 0.0,
+        'commercial_count': commercial_count,
+        'industrial_count': industrial_count,
+        'residential_only': residential_only,
+        'commercial_nearby': commercial_count > 0,
+        'industrial_nearby': industrial_count > 0,
+    }
 
 
-def _identify_concerns(current_zoning: Optional[ZoningInfo], nearby_parcels: List[ZoningInfo]) -> List[str]:
+def _identify_concerns(current_zoning: Optional[ZoningInfo], nearby_parcels: List[ZoningInfo],
+                       summary: Optional[dict] = None) -> List[str]:
     """
     Identify potential zoning concerns
 
     Args:
         current_zoning: The current property's zoning info
         nearby_parcels: List of nearby parcel zoning info
+        summary: Precomputed _summarize_nearby() result (computed if not given)
 
     Returns:
         List of concern strings
@@ -263,20 +331,18 @@ def _identify_concerns(current_zoning: Optional[ZoningInfo], nearby_parcels: Lis
     if not current_zoning:
         return concerns
 
-    current_code = current_zoning.current_zoning
-    current_is_residential = _is_residential(current_code)
+    if summary is None:
+        summary = _summarize_nearby(nearby_parcels)
+
+    current_is_residential = _is_residential(current_zoning.current_zoning)
 
     # Check for residential next to commercial
-    if current_is_residential:
-        commercial_nearby = [p for p in nearby_parcels if _is_commercial_or_mixed(p.current_zoning)]
-        if commercial_nearby:
-            concerns.append(f"Residential property has {len(commercial_nearby)} commercial/mixed-use parcel(s) nearby")
+    if current_is_residential and summary['commercial_count']:
+        concerns.append(f"Residential property has {summary['commercial_count']} commercial/mixed-use parcel(s) nearby")
 
     # Check for residential next to industrial
-    if current_is_residential:
-        industrial_nearby = [p for p in nearby_parcels if _is_industrial(p.current_zoning)]
-        if industrial_nearby:
-            concerns.append(f"Residential property has {len(industrial_nearby)} industrial parcel(s) nearby - potential noise/traffic concerns")
+    if current_is_residential and summary['industrial_count']:
+        concerns.append(f"Residential property has {summary['industrial_count']} industrial parcel(s) nearby - potential noise/traffic concerns")
 
     # Check for future land use changes
     if current_zoning.future_changed:
@@ -293,9 +359,9 @@ def _identify_concerns(current_zoning: Optional[ZoningInfo], nearby_parcels: Lis
         concerns.append("Property has split zoning - different regulations apply to different parts")
 
     # Check for very diverse nearby zoning (might indicate transitional area)
-    unique_zones = set(p.current_zoning for p in nearby_parcels if p.current_zoning)
-    if len(unique_zones) >= 5:
-        concerns.append(f"High zoning diversity nearby ({len(unique_zones)} different zones) - may indicate transitional neighborhood")
+    unique_zone_count = len(summary['unique_zones'])
+    if unique_zone_count >= 5:
+        concerns.append(f"High zoning diversity nearby ({unique_zone_count} different zones) - may indicate transitional neighborhood")
 
     return concerns
 
@@ -311,37 +377,44 @@ def geocode_address(address: str) -> Optional[Tuple[float, float]]:
         Tuple of (latitude, longitude) or None if not found
     """
     try:
-        geolocator = Nominatim(user_agent="athens_home_buyer_research")
-
-        # Add Athens, GA if not present
-        if 'athens' not in address.lower():
-            address = f"{address}, Athens, GA"
-
-        location = geolocator.geocode(address, timeout=10)
-
-        if location:
-            return (location.latitude, location.longitude)
-        else:
-            return None
+        # Shared, cached geocoder (normalizes the address and adds Athens, GA)
+        return geocode(address)
 
     except Exception as e:
         print(f"Geocoding error: {e}")
         return None
 
 
-def query_zoning_api(latitude: float, longitude: float, distance_meters: int = 100) -> Optional[dict]:
+def _query_layer(layer: str, url: str, latitude: float, longitude: float,
+                 distance_meters: int, error_label: str) -> Optional[dict]:
     """
-    Query the Parcel Zoning Types API
+    Radius query against a parcel layer: local snapshot, then response cache,
+    then the live API
 
     Args:
+        layer: Layer name ('zoning' or 'future_land_use')
+        url: Live API query URL
         latitude: Latitude coordinate
         longitude: Longitude coordinate
-        distance_meters: Search radius in meters (default 100)
+        distance_meters: Search radius in meters
+        error_label: Name used in error messages
 
     Returns:
-        API response dict or None if error
+        API response dict (snapshot results also carry parcel distances and
+        centroid offsets, see ZoningLayer.query) or None if error
     """
-    url = "https://enigma.accgov.com/server/rest/services/Parcel_Zoning_Types/FeatureServer/0/query"
+    # Answer from the local snapshot when one has been synced
+    from zoning_snapshot import get_zoning_snapshot
+    snapshot = get_zoning_snapshot()
+    if snapshot is not None:
+        return snapshot.query(layer, latitude, longitude, distance_meters)
+
+    # Then from recently cached responses for (about) the same point
+    cache_key = [layer, round(latitude, ZONING_CACHE_COORD_DECIMALS),
+                 round(longitude, ZONING_CACHE_COORD_DECIMALS), distance_meters]
+    cached = _zoning_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
     params = {
         'geometry': f'{longitude},{latitude}',
@@ -351,23 +424,45 @@ def query_zoning_api(latitude: float, longitude: float, distance_meters: int = 1
         'units': 'esriSRUnit_Meter',
         'spatialRel': 'esriSpatialRelIntersects',
         'outFields': '*',
-        'returnGeometry': 'false',  # We don't need polygon geometry
+        'returnGeometry': 'true',  # Generalized outlines to locate the parcel containing the point
+        'outSR': '4326',
+        'maxAllowableOffset': GEOMETRY_OFFSET_DEGREES,
+        'geometryPrecision': 6,
         'f': 'json'
     }
 
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = get_session().get(url, params=params, timeout=10)
         response.raise_for_status()
         data = response.json()
+
+        # Don't cache ArcGIS error payloads
+        if 'error' not in data:
+            _zoning_cache.set(cache_key, data)
         return data
     except Exception as e:
-        print(f"Zoning API error: {e}")
+        print(f"{error_label} API error: {e}")
         return None
 
 
+def query_zoning_api(latitude: float, longitude: float, distance_meters: int = 100) -> Optional[dict]:
+    """
+    Query the Parcel Zoning Types layer (local snapshot or cache if available, else the live API)
+
+    Args:
+        latitude: Latitude coordinate
+        longitude: Longitude coordinate
+        distance_meters: Search radius in meters (default 100)
+
+    Returns:
+        API response dict or None if error
+    """
+    return _query_layer('zoning', ZONING_API_URL, latitude, longitude, distance_meters, "Zoning")
+
+
 def query_future_land_use_api(latitude: float, longitude: float, distance_meters: int = 100) -> Optional[dict]:
     """
-    Query the Future Land Use API
+    Query the Future Land Use layer (local snapshot or cache if available, else the live API)
 
     Args:
         latitude: Latitude coordinate
@@ -377,126 +472,345 @@ def query_future_land_use_api(latitude: float, longitude: float, distance_meters
     Returns:
         API response dict or None if error
     """
-    url = "https://enigma.accgov.com/server/rest/services/FutureLandUse/FeatureServer/0/query"
+    return _query_layer('future_land_use', FUTURE_LAND_USE_API_URL, latitude, longitude,
+                        distance_meters, "Future Land Use")
 
-    params = {
-        'geometry': f'{longitude},{latitude}',
-        'geometryType': 'esriGeometryPoint',
-        'inSR': '4326',  # WGS84 (standard lat/lon)
-        'distance': distance_meters,
-        'units': 'esriSRUnit_Meter',
-        'spatialRel': 'esriSpatialRelIntersects',
-        'outFields': '*',
-        'returnGeometry': 'false',  # We don't need polygon geometry
-        'f': 'json'
+
+def _to_local_meters(latitude: float, longitude: float,
+                     origin_lat: float, origin_lon: float) -> Tuple[float, float]:
+    """Project a point onto a flat (x, y) meter plane centered on the origin"""
+    meters_per_degree_lon = METERS_PER_DEGREE_LAT * math.cos(math.radians(origin_lat))
+    return ((longitude - origin_lon) * meters_per_degree_lon,
+            (latitude - origin_lat) * METERS_PER_DEGREE_LAT)
+
+
+def _centroid_offsets(shapes: list) -> Tuple[np.ndarray, np.ndarray]:
+    """Centroid (x, y) offsets in meters for each shape (NaN where missing)"""
+    x = np.full(len(shapes), np.nan)
+    y = np.full(len(shapes), np.nan)
+    for i, shape in enumerate(shapes):
+        if shape is not None and not shape.is_empty:
+            centroid = shape.centroid
+            x[i], y[i] = centroid.x, centroid.y
+    return x, y
+
+
+def _analyze_parcel_geometry(codes: List[str], acres: np.ndarray, distances: np.ndarray) -> dict:
+    """
+    Distance rings, acreage-weighted zone mix and nearest commercial/industrial
+    distance for a set of nearby parcels, computed over arrays
+
+    Args:
+        codes: Zoning code per parcel
+        acres: Parcel acreage per parcel
+        distances: Distance in meters from the address to each parcel
+            centroid (NaN if the parcel has no geometry)
+
+    Returns:
+        Dict with distance_rings, zone_mix_by_acreage,
+        nearest_commercial_meters and nearest_industrial_meters
+    """
+    classes = [classify_zoning_code(code) for code in codes]
+    commercial = np.array([c.commercial_or_mixed for c in classes], dtype=bool)
+    industrial = np.array([c.industrial for c in classes], dtype=bool)
+    located = ~np.isnan(distances)
+
+    # Parcel counts per ring (parcels past the last edge are not counted)
+    edges = np.array((0,) + DISTANCE_RING_EDGES_METERS, dtype=float)
+    counts, _ = np.histogram(distances[located], bins=edges)
+    distance_rings = {
+        f"{int(lo)}-{int(hi)}m": int(count) for lo, hi, count in zip(edges[:-1], edges[1:], counts)
     }
 
-    try:
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        return data
-    except Exception as e:
-        print(f"Future Land Use API error: {e}")
-        return None
+    # Share of total acreage per zone code
+    zone_mix_by_acreage = {}
+    total_acres = float(acres.sum())
+    if total_acres > 0 and codes:
+        zone_codes, inverse = np.unique(np.array(codes, dtype=str), return_inverse=True)
+        zone_acres = np.bincount(inverse, weights=acres, minlength=len(zone_codes))
+        zone_mix_by_acreage = {
+            str(code): float(share) for code, share in zip(zone_codes, zone_acres / total_acres)
+            if code
+        }
+
+    def _nearest(mask):
+        hits = distances[mask & located]
+        return float(hits.min()) if len(hits) else None
+
+    return {
+        'distance_rings': distance_rings,
+        'zone_mix_by_acreage': zone_mix_by_acreage,
+        'nearest_commercial_meters': _nearest(commercial),
+        'nearest_industrial_meters': _nearest(industrial),
+    }
 
 
-def get_zoning_info(address: str) -> Optional[ZoningInfo]:
+def _parcel_shape(geometry: Optional[dict], origin_lat: float, origin_lon: float):
     """
-    Get comprehensive zoning information for an address
+    Convert an ArcGIS polygon to a shapely shape in local meters
+
+    Coordinates are projected onto a flat plane centered on the origin, so
+    the origin is (0, 0) and distances come out in meters.
 
     Args:
-        address: Street address in Athens-Clarke County
+        geometry: ArcGIS JSON geometry with 'rings' (WGS84)
+        origin_lat: Latitude of the projection origin
+        origin_lon: Longitude of the projection origin
 
     Returns:
-        ZoningInfo object or None if address not found
+        Polygon/MultiPolygon, or None if the feature has no usable geometry
     """
-    # Step 1: Geocode the address
-    coords = geocode_address(address)
-    if not coords:
-        print(f"Could not geocode address: {address}")
+    if not geometry or not geometry.get('rings'):
         return None
 
-    latitude, longitude = coords
-    print(f"Geocoded to: ({latitude}, {longitude})")
+    # ArcGIS outer rings run clockwise; counter-clockwise rings are holes
+    # in the most recent outer ring
+    polygons = []
+    for ring in geometry['rings']:
+        if len(ring) < 4:
+            continue
+        coords = [_to_local_meters(y, x, origin_lat, origin_lon) for x, y in ring]
+        if Polygon(coords).exterior.is_ccw and polygons:
+            polygons[-1][1].append(coords)
+        else:
+            polygons.append((coords, []))
 
-    # Step 2: Query zoning API
-    zoning_data = query_zoning_api(latitude, longitude, distance_meters=50)
-    if not zoning_data or not zoning_data.get('features'):
-        print("No zoning data found")
+    if not polygons:
         return None
 
-    # Step 3: Query future land use API
-    future_data = query_future_land_use_api(latitude, longitude, distance_meters=50)
+    shape = MultiPolygon([Polygon(outer, holes) for outer, holes in polygons])
+    if not shape.is_valid:
+        shape = shape.buffer(0)
+    return shape
+
+
+def _feature_shapes(features: List[dict], latitude: float, longitude: float) -> list:
+    """Parcel shapes in meters around a point (None where geometry is missing)"""
+    return [_parcel_shape(feature.get('geometry'), latitude, longitude) for feature in features]
+
+
+def _shape_distances(shapes: list) -> np.ndarray:
+    """Distance in meters from the origin to each shape (NaN where missing)"""
+    origin = Point(0, 0)
+    return np.array([
+        shape.distance(origin) if shape is not None and not shape.is_empty else np.nan
+        for shape in shapes
+    ], dtype=float)
+
+
+def _feature_geometry(data: dict, latitude: float,
+                      longitude: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Distances and centroid offsets for the features of a layer query
+
+    Snapshot results carry these already; live API results are projected here.
+
+    Returns:
+        (distances, offset_x, offset_y): meters from the point to each
+        parcel and from the point to its centroid (NaN where missing)
+    """
+    if 'distances' in data:
+        offset_x, offset_y = data['centroid_offsets']
+        return data['distances'], offset_x, offset_y
+
+    shapes = _feature_shapes(data['features'], latitude, longitude)
+    offset_x, offset_y = _centroid_offsets(shapes)
+    return _shape_distances(shapes), offset_x, offset_y
+
+
+def _rank_features(features: List[dict], latitude: float, longitude: float,
+                   distances: Optional[np.ndarray] = None) -> List[Tuple[Optional[float], dict]]:
+    """
+    Order features by distance from a point
+
+    Args:
+        features: ArcGIS features (with geometry if available)
+        latitude: Point latitude
+        longitude: Point longitude
+        distances: Precomputed distance per feature, NaN where missing
+            (optional; computed from the geometry otherwise)
+
+    Returns:
+        List of (distance in meters, feature), closest first. A parcel that
+        contains the point has distance 0. Features without geometry keep
+        their API order after the located ones, with distance None.
+    """
+    if distances is None:
+        distances = _shape_distances(_feature_shapes(features, latitude, longitude))
+
+    located = []
+    unlocated = []
+
+    for feature, distance in zip(features, distances):
+        if np.isnan(distance):
+            unlocated.append((None, feature))
+        else:
+            located.append((float(distance), feature))
+
+    located.sort(key=lambda item: item[0])
+    return located + unlocated
+
+
+def _clean_attr(attrs: dict, name: str) -> str:
+    """Attribute value as a stripped string ('' for missing/None)"""
+    value = attrs.get(name)
+    return str(value).strip() if value is not None else ''
 
-    # Step 4: Find the closest parcel (usually the first one)
-    primary_parcel = zoning_data['features'][0]['attributes']
 
-    # Extract zoning info
-    current_zoning = primary_parcel.get('CurrentZn', '').strip()
-    combined_zoning = primary_parcel.get('CombinedZn', '').strip()
-    parcel_number = primary_parcel.get('PARCEL_NO', '').strip()
-    pin = primary_parcel.get('PIN', '').strip()
-    acres = primary_parcel.get('Acres', 0.0)
-    split_zoned = primary_parcel.get('SplitZoned', '').strip() != ''
+def _index_by_parcel(features: List[dict]) -> dict:
+    """
+    Index features by parcel number for O(1) joins
+
+    Args:
+        features: ArcGIS features with PARCEL_NO attributes
+
+    Returns:
+        Dict of cleaned parcel number -> attributes (first feature wins,
+        matching the old first-match scan)
+    """
+    index = {}
+    for feature in features:
+        index.setdefault(_clean_attr(feature['attributes'], 'PARCEL_NO'), feature['attributes'])
+    return index
 
-    # Get description
-    current_zoning_description = get_zoning_code_description(current_zoning)
+
+def _build_zoning_info(attrs: dict, future_attrs: Optional[dict], address: str,
+                       latitude: float, longitude: float,
+                       nearby_zones: Optional[List[str]] = None,
+                       nearby_future_use: Optional[List[str]] = None) -> ZoningInfo:
+    """
+    Build a ZoningInfo from zoning and future land use attributes
+
+    Args:
+        attrs: Parcel zoning feature attributes
+        future_attrs: Matching future land use attributes (or None)
+        address: Address label for the parcel
+        latitude: Latitude to record
+        longitude: Longitude to record
+        nearby_zones: Zoning codes of neighboring parcels
+        nearby_future_use: Future land uses of neighboring parcels
+
+    Returns:
+        ZoningInfo object
+    """
+    # Extract zoning info (handle None values)
+    current_zoning = sys.intern(_clean_attr(attrs, 'CurrentZn'))
+    combined_zoning = _clean_attr(attrs, 'CombinedZn')
+    parcel_number = _clean_attr(attrs, 'PARCEL_NO')
+    pin = _clean_attr(attrs, 'PIN')
+    acres = attrs.get('Acres', 0.0) or 0.0
+    split_zoned = _clean_attr(attrs, 'SplitZoned') != ''
 
     # Extract future land use
     future_land_use = ''
     future_land_use_description = ''
     future_changed = False
 
-    if future_data and future_data.get('features'):
-        future_parcel = future_data['features'][0]['attributes']
-        future_land_use = future_parcel.get('Updated_FL', '').strip()
-        future_changed = future_parcel.get('Change', '').strip().lower() == 'yes'
+    if future_attrs:
+        future_land_use = _clean_attr(future_attrs, 'Updated_FL')
+        future_changed = _clean_attr(future_attrs, 'Change').lower() == 'yes'
         future_land_use_description = get_future_land_use_description(future_land_use)
 
-    # Get nearby parcels for context
-    nearby_zones = []
-    nearby_future_use = []
-
-    # Collect nearby zoning codes (excluding the primary parcel)
-    for feature in zoning_data['features'][1:]:
-        zone = feature['attributes'].get('CurrentZn', '').strip()
-        if zone and zone not in nearby_zones:
-            nearby_zones.append(zone)
-
-    # Collect nearby future land use
-    if future_data and future_data.get('features'):
-        for feature in future_data['features'][1:]:
-            use = feature['attributes'].get('Updated_FL', '').strip()
-            if use and use not in nearby_future_use:
-                nearby_future_use.append(use)
-
-    # Create ZoningInfo object
-    zoning_info = ZoningInfo(
+    return ZoningInfo(
         parcel_number=parcel_number,
         pin=pin,
         address=address,
         current_zoning=current_zoning,
-        current_zoning_description=current_zoning_description,
+        current_zoning_description=classify_zoning_code(current_zoning).description,
         combined_zoning=combined_zoning,
         split_zoned=split_zoned,
         future_land_use=future_land_use,
         future_land_use_description=future_land_use_description,
         future_changed=future_changed,
         acres=acres,
-        nearby_zones=nearby_zones[:5],  # Limit to 5 nearest
-        nearby_future_use=nearby_future_use[:5],
+        nearby_zones=nearby_zones or [],
+        nearby_future_use=nearby_future_use or [],
         latitude=latitude,
         longitude=longitude
     )
 
-    return zoning_info
+
+def _primary_parcel_info(address: str, latitude: float, longitude: float,
+                         ranked_zoning: List[Tuple[Optional[float], dict]],
+                         ranked_future: List[Tuple[Optional[float], dict]]) -> ZoningInfo:
+    """
+    Build ZoningInfo for the parcel at the address from ranked query results
+
+    The primary parcel is the one containing the point (or the nearest one).
+    Nearby zones and future uses come from the other parcels within
+    PRIMARY_SEARCH_METERS, closest first.
+    """
+    def _near(distance):
+        return distance is None or distance <= PRIMARY_SEARCH_METERS
+
+    primary_parcel = ranked_zoning[0][1]['attributes']
+    future_parcel = ranked_future[0][1]['attributes'] if ranked_future else None
+
+    # Collect nearby zoning codes (excluding the primary parcel)
+    nearby_zones = []
+    for distance, feature in ranked_zoning[1:]:
+        zone = _clean_attr(feature['attributes'], 'CurrentZn')
+        if _near(distance) and zone and zone not in nearby_zones:
+            nearby_zones.append(zone)
+
+    # Collect nearby future land use
+    nearby_future_use = []
+    for distance, feature in ranked_future[1:]:
+        use = _clean_attr(feature['attributes'], 'Updated_FL')
+        if _near(distance) and use and use not in nearby_future_use:
+            nearby_future_use.append(use)
+
+    return _build_zoning_info(
+        primary_parcel, future_parcel, address, latitude, longitude,
+        nearby_zones=nearby_zones[:5],  # Limit to 5 nearest
+        nearby_future_use=nearby_future_use[:5]
+    )
+
+
+def get_zoning_info(address: str) -> Optional[ZoningInfo]:
+    """
+    Get comprehensive zoning information for an address
+
+    Args:
+        address: Street address in Athens-Clarke County
+
+    Returns:
+        ZoningInfo object or None if address not found
+    """
+    # Step 1: Geocode the address
+    coords = geocode_address(address)
+    if not coords:
+        print(f"Could not geocode address: {address}")
+        return None
+
+    latitude, longitude = coords
+    print(f"Geocoded to: ({latitude}, {longitude})")
+
+    # Step 2: Query zoning API
+    zoning_data = query_zoning_api(latitude, longitude, distance_meters=PRIMARY_SEARCH_METERS)
+    if not zoning_data or not zoning_data.get('features'):
+        print("No zoning data found")
+        return None
+
+    # Step 3: Query future land use API
+    future_data = query_future_land_use_api(latitude, longitude, distance_meters=PRIMARY_SEARCH_METERS)
+    future_features = future_data.get('features', []) if future_data else []
+
+    # Step 4: Pick the parcel containing (or closest to) the point
+    return _primary_parcel_info(
+        address, latitude, longitude,
+        _rank_features(zoning_data['features'], latitude, longitude, zoning_data.get('distances')),
+        _rank_features(future_features, latitude, longitude, future_data.get('distances') if future_data else None)
+    )
 
 
 def get_nearby_zoning(address: str, radius_meters: int = 250) -> Optional[NearbyZoning]:
     """
     Get comprehensive nearby zoning analysis for an address
 
+    Makes one radius query per layer: the parcel at the address is picked
+    from the same results as its neighbors.
+
     Args:
         address: Street address in Athens-Clarke County
         radius_meters: Search radius in meters (default: 250)
@@ -504,15 +818,16 @@ def get_nearby_zoning(address: str, radius_meters: int = 250) -> Optional[Nearby
     Returns:
         NearbyZoning object with detailed analysis or None if address not found
     """
-    # Step 1: Get the current parcel's zoning
-    current_parcel = get_zoning_info(address)
-    if not current_parcel:
-        print(f"Could not get zoning for address: {address}")
+    # Step 1: Geocode once
+    coords = geocode_address(address)
+    if not coords:
+        print(f"Could not geocode address: {address}")
         return None
 
-    # Step 2: Query for nearby parcels with wider radius
-    latitude, longitude = current_parcel.latitude, current_parcel.longitude
+    latitude, longitude = coords
+    print(f"Geocoded to: ({latitude}, {longitude})")
 
+    # Step 2: One radius query per layer
     zoning_data = query_zoning_api(latitude, longitude, distance_meters=radius_meters)
     future_data = query_future_land_use_api(latitude, longitude, distance_meters=radius_meters)
 
@@ -520,106 +835,72 @@ def get_nearby_zoning(address: str, radius_meters: int = 250) -> Optional[Nearby
         print("No nearby zoning data found")
         return None
 
-    # Step 3: Build ZoningInfo objects for all nearby parcels
+    future_features = future_data.get('features', []) if future_data else []
+
+    # Step 3: The current parcel is the one containing (or closest to) the point
+    zoning_distances, offset_x, offset_y = _feature_geometry(zoning_data, latitude, longitude)
+    ranked_zoning = _rank_features(zoning_data['features'], latitude, longitude, zoning_distances)
+    ranked_future = _rank_features(future_features, latitude, longitude,
+                                   future_data.get('distances') if future_data else None)
+    current_parcel = _primary_parcel_info(address, latitude, longitude, ranked_zoning, ranked_future)
+
+    # Parcel centroids as arrays: offsets in meters, distance, and lat/lon
+    centroid_distances = np.hypot(offset_x, offset_y)
+    meters_per_degree_lon = METERS_PER_DEGREE_LAT * math.cos(math.radians(latitude))
+    centroid_lats = np.where(np.isnan(offset_y), latitude, latitude + offset_y / METERS_PER_DEGREE_LAT)
+    centroid_lons = np.where(np.isnan(offset_x), longitude, longitude + offset_x / meters_per_degree_lon)
+
+    # Step 4: Build ZoningInfo objects for all nearby parcels, joining
+    # future land use by parcel number
+    future_by_parcel = _index_by_parcel(future_features)
     nearby_parcels = []
+    nearby_rows = []
 
-    for feature in zoning_data['features']:
+    for row, feature in enumerate(zoning_data['features']):
         attrs = feature['attributes']
 
         # Skip the current parcel (match by PIN or parcel number)
-        pin = attrs.get('PIN', '') or ''
-        pin = pin.strip() if pin else ''
+        pin = _clean_attr(attrs, 'PIN')
         if pin and pin == current_parcel.pin:
             continue
 
-        parcel_number = attrs.get('PARCEL_NO', '') or ''
-        parcel_number = parcel_number.strip() if parcel_number else ''
+        parcel_number = _clean_attr(attrs, 'PARCEL_NO')
         if parcel_number and parcel_number == current_parcel.parcel_number:
             continue
 
-        # Extract zoning info (handle None values)
-        current_zoning = attrs.get('CurrentZn', '') or ''
-        current_zoning = current_zoning.strip() if current_zoning else ''
-
-        combined_zoning = attrs.get('CombinedZn', '') or ''
-        combined_zoning = combined_zoning.strip() if combined_zoning else ''
-
-        acres = attrs.get('Acres', 0.0) or 0.0
-
-        split_zoned_value = attrs.get('SplitZoned', '') or ''
-        split_zoned = str(split_zoned_value).strip() != ''
-
-        # Get description
-        current_zoning_description = get_zoning_code_description(current_zoning)
-
-        # Try to find matching future land use
-        future_land_use = ''
-        future_land_use_description = ''
-        future_changed = False
-
-        if future_data and future_data.get('features'):
-            for future_feature in future_data['features']:
-                future_attrs = future_feature['attributes']
-                if future_attrs.get('PARCEL_NO', '').strip() == parcel_number:
-                    future_land_use = future_attrs.get('Updated_FL', '') or ''
-                    future_land_use = future_land_use.strip() if future_land_use else ''
-                    change_value = future_attrs.get('Change', '') or ''
-                    future_changed = str(change_value).strip().lower() == 'yes'
-                    future_land_use_description = get_future_land_use_description(future_land_use)
-                    break
-
-        # Create ZoningInfo for this nearby parcel
-        nearby_info = ZoningInfo(
-            parcel_number=parcel_number,
-            pin=pin,
-            address=f"Near {address}",
-            current_zoning=current_zoning,
-            current_zoning_description=current_zoning_description,
-            combined_zoning=combined_zoning,
-            split_zoned=split_zoned,
-            future_land_use=future_land_use,
-            future_land_use_description=future_land_use_description,
-            future_changed=future_changed,
-            acres=acres,
-            nearby_zones=[],  # Not needed for nearby parcels
-            nearby_future_use=[],
-            latitude=latitude,
-            longitude=longitude
-        )
-
-        nearby_parcels.append(nearby_info)
+        future_attrs = future_by_parcel.get(parcel_number)
 
-    # Step 4: Analyze the zoning patterns
-    total_nearby = len(nearby_parcels)
-    unique_zones = list(set(p.current_zoning for p in nearby_parcels if p.current_zoning))
-
-    # Calculate diversity score
-    if total_nearby > 0:
-        zone_diversity_score = len(unique_zones) / total_nearby
-    else:
-        zone_diversity_score = 0.0
-
-    # Check for different use types
-    mixed_use_nearby = any(_is_commercial_or_mixed(p.current_zoning) for p in nearby_parcels)
-    residential_only = all(_is_residential(p.current_zoning) for p in nearby_parcels) if nearby_parcels else False
-    commercial_nearby = any(_is_commercial_or_mixed(p.current_zoning) for p in nearby_parcels)
-    industrial_nearby = any(_is_industrial(p.current_zoning) for p in nearby_parcels)
+        # Create ZoningInfo for this nearby parcel, located at its centroid
+        nearby_parcels.append(
+            _build_zoning_info(attrs, future_attrs, f"Near {address}",
+                               float(centroid_lats[row]), float(centroid_lons[row]))
+        )
+        nearby_rows.append(row)
+
+    # Step 5: Analyze the zoning patterns in one pass
+    summary = _summarize_nearby(nearby_parcels)
+    geometry_summary = _analyze_parcel_geometry(
+        [p.current_zoning for p in nearby_parcels],
+        np.array([p.acres for p in nearby_parcels], dtype=float),
+        centroid_distances[nearby_rows]
+    )
 
     # Identify potential concerns
-    potential_concerns = _identify_concerns(current_parcel, nearby_parcels)
+    potential_concerns = _identify_concerns(current_parcel, nearby_parcels, summary)
 
-    # Step 5: Create NearbyZoning object
+    # Step 6: Create NearbyZoning object
     nearby_zoning = NearbyZoning(
         current_parcel=current_parcel,
         nearby_parcels=nearby_parcels,
-        mixed_use_nearby=mixed_use_nearby,
-        residential_only=residential_only,
-        commercial_nearby=commercial_nearby,
-        industrial_nearby=industrial_nearby,
+        mixed_use_nearby=summary['commercial_nearby'],
+        residential_only=summary['residential_only'],
+        commercial_nearby=summary['commercial_nearby'],
+        industrial_nearby=summary['industrial_nearby'],
         potential_concerns=potential_concerns,
-        total_nearby_parcels=total_nearby,
-        unique_zones=unique_zones,
-        zone_diversity_score=zone_diversity_score
+        total_nearby_parcels=len(nearby_parcels),
+        unique_zones=summary['unique_zones'],
+        zone_diversity_score=summary['zone_diversity_score'],
+        **geometry_summary
     )
 
     return nearby_zoning
@@ -712,8 +993,24 @@ def format_nearby_zoning_report(nearby_zoning: NearbyZoning) -> str:
     report.append(f"  Total Nearby Parcels: {nearby_zoning.total_nearby_parcels}")
     report.append(f"  Unique Zoning Types: {len(nearby_zoning.unique_zones)}")
     report.append(f"  Zone Diversity Score: {nearby_zoning.zone_diversity_score:.2f} (0.0=uniform, 1.0=all different)")
+    if nearby_zoning.nearest_commercial_meters is not None:
+        report.append(f"  Nearest Commercial/Mixed Use: {nearby_zoning.nearest_commercial_meters:.0f} m")
+    if nearby_zoning.nearest_industrial_meters is not None:
+        report.append(f"  Nearest Industrial: {nearby_zoning.nearest_industrial_meters:.0f} m")
     report.append("")
 
+    if nearby_zoning.distance_rings:
+        report.append("PARCELS BY DISTANCE:")
+        for ring, count in nearby_zoning.distance_rings.items():
+            report.append(f"  {ring}: {count} parcels")
+        report.append("")
+
+    if nearby_zoning.zone_mix_by_acreage:
+        report.append("ZONE MIX BY ACREAGE:")
+        for zone, share in sorted(nearby_zoning.zone_mix_by_acreage.items(), key=lambda item: -item[1]):
+            report.append(f"  {zone}: {share:.0%}")
+        report.append("")
+
     # Zoning pattern flags
     report.append("ZONING PATTERNS:")
     if nearby_zoning.residential_only:
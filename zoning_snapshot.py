@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Local snapshot of Athens-Clarke County parcel zoning layers
+Downloads the Parcel Zoning Types and Future Land Use layers (with parcel
+outlines) into one file and answers zoning radius queries from an in-memory
+STRtree instead of the enigma.accgov.com FeatureServers
+
+Usage:
+    python zoning_snapshot.py           # Download both layers and replace the snapshot
+    python zoning_snapshot.py --stats   # Show what is in the local snapshot
+"""
+
+import os
+import sys
+import math
+import pickle
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+import requests
+import shapely
+from shapely.strtree import STRtree
+
+from atomic_file import atomic_write
+from http_client import query_all_pages
+from zoning_lookup import (
+    ZONING_API_URL, FUTURE_LAND_USE_API_URL, GEOMETRY_OFFSET_DEGREES,
+    _parcel_shape, _to_local_meters
+)
+
+
+# Location of the synced snapshot (relative to the project root, like data/street_index.json)
+ZONING_SNAPSHOT_FILE = "data/zoning_snapshot.pkl"
+
+# Zoning changes slowly; a snapshot older than this falls back to the live API
+SNAPSHOT_MAX_AGE_DAYS = 90
+
+# Fixed projection origin (central Athens); snapshot shapes are stored in
+# meters relative to this point
+SNAPSHOT_ORIGIN = (33.95, -83.38)
+
+# Records per page when downloading a layer
+SNAPSHOT_PAGE_SIZE = 1000
+
+LAYER_URLS = {
+    'zoning': ZONING_API_URL,
+    'future_land_use': FUTURE_LAND_USE_API_URL,
+}
+
+
+class ZoningLayer:
+    """
+    One parcel layer: features in API order plus an STRtree over their shapes
+
+    Features without usable geometry are kept but can never match a query.
+    """
+
+    def __init__(self, features: List[dict], shapes: np.ndarray):
+        self.features = features
+        self.shapes = shapes
+        self.tree = STRtree(shapes)
+        centroids = shapely.centroid(shapes)
+        self.centroid_x = shapely.get_x(centroids)
+        self.centroid_y = shapely.get_y(centroids)
+
+    @classmethod
+    def from_features(cls, features: List[dict]) -> 'ZoningLayer':
+        """Build a layer from ArcGIS features with WGS84 geometry"""
+        shapes = [_parcel_shape(f.get('geometry'), *SNAPSHOT_ORIGIN) for f in features]
+        return cls(features, np.array(shapes, dtype=object))
+
+    def query(self, latitude: float, longitude: float, distance_meters: float) -> dict:
+        """
+        Features within a distance of a point, with the geometry already matched
+
+        Returns:
+            Dict with the matching 'features' in layer order (like the live
+            API), their 'distances' in meters from the point, and
+            'centroid_offsets' as (x, y) arrays in meters east/north of the point
+        """
+        x, y = _to_local_meters(latitude, longitude, *SNAPSHOT_ORIGIN)
+        point = shapely.Point(x, y)
+        hits = np.sort(self.tree.query(point, predicate='dwithin', distance=distance_meters))
+
+        # Rescale east-west offsets from the origin's meters-per-degree to the point's
+        lon_scale = math.cos(math.radians(latitude)) / math.cos(math.radians(SNAPSHOT_ORIGIN[0]))
+        return {
+            'features': [self.features[i] for i in hits],
+            'distances': shapely.distance(self.shapes[hits], point),
+            'centroid_offsets': ((self.centroid_x[hits] - x) * lon_scale, self.centroid_y[hits] - y),
+        }
+
+
+class ZoningSnapshot:
+    """Both zoning layers, queryable like the ArcGIS radius query"""
+
+    def __init__(self, layers: Dict[str, ZoningLayer], synced_at: datetime):
+        self.layers = layers
+        self.synced_at = synced_at
+
+    def is_fresh(self) -> bool:
+        """Check whether the snapshot is recent enough to trust"""
+        return (datetime.now() - self.synced_at).days <= SNAPSHOT_MAX_AGE_DAYS
+
+    def query(self, layer: str, latitude: float, longitude: float, distance_meters: float) -> dict:
+        """
+        Radius query against one layer
+
+        Args:
+            layer: 'zoning' or 'future_land_use'
+            latitude: Latitude coordinate
+            longitude: Longitude coordinate
+            distance_meters: Search radius in meters
+
+        Returns:
+            Dict shaped like the ArcGIS JSON response ({'features': [...]}),
+            plus parcel distances and centroid offsets (see ZoningLayer.query)
+        """
+        return self.layers[layer].query(latitude, longitude, distance_meters)
+
+    def save(self, path: str = ZONING_SNAPSHOT_FILE):
+        """
+        Write the snapshot to disk atomically
+
+        Shapes are stored as WKB so loading doesn't have to rebuild them.
+        """
+        payload = {
+            'synced_at': self.synced_at.isoformat(),
+            'layers': {
+                name: {'features': layer.features, 'wkb': shapely.to_wkb(layer.shapes)}
+                for name, layer in self.layers.items()
+            }
+        }
+
+        with atomic_write(path, 'wb') as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str = ZONING_SNAPSHOT_FILE) -> Optional['ZoningSnapshot']:
+        """
+        Load a snapshot from disk
+
+        Returns:
+            ZoningSnapshot or None if the file is missing or unreadable
+        """
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, 'rb') as f:
+                payload = pickle.load(f)
+
+            layers = {
+                name: ZoningLayer(data['features'], shapely.from_wkb(data['wkb']))
+                for name, data in payload['layers'].items()
+            }
+            return cls(layers, datetime.fromisoformat(payload['synced_at']))
+        except Exception as e:
+            print(f"⚠️  Could not load zoning snapshot: {e}")
+            return None
+
+
+# Process-wide snapshot, swapped when the file on disk changes
+_snapshot = None
+_snapshot_mtime = None
+_snapshot_lock = threading.Lock()
+
+
+def get_zoning_snapshot(path: str = ZONING_SNAPSHOT_FILE) -> Optional[ZoningSnapshot]:
+    """
+    Get the local zoning snapshot if it exists and is fresh
+
+    A newer file on disk is loaded fully before it replaces the current
+    snapshot, so concurrent readers always see a complete one.
+
+    Returns:
+        ZoningSnapshot, or None if no usable snapshot is available (callers
+        should fall back to the live API)
+    """
+    global _snapshot, _snapshot_mtime
+
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+
+    if mtime != _snapshot_mtime:
+        with _snapshot_lock:
+            if mtime != _snapshot_mtime:
+                _snapshot = ZoningSnapshot.load(path)
+                _snapshot_mtime = mtime
+
+    snapshot = _snapshot
+    if snapshot is None or not snapshot.is_fresh():
+        return None
+    return snapshot
+
+
+def download_layer(url: str) -> List[dict]:
+    """
+    Page through a parcel layer and download every feature with its outline
+
+    Args:
+        url: Layer query URL
+
+    Returns:
+        List of ArcGIS features (attributes plus WGS84 geometry)
+
+    Raises:
+        requests.RequestException: If any page fails to download
+    """
+    params = {
+        'where': '1=1',
+        'outFields': '*',
+        'returnGeometry': 'true',
+        'outSR': '4326',
+        'maxAllowableOffset': GEOMETRY_OFFSET_DEGREES,
+        'geometryPrecision': 6,
+        'f': 'json'
+    }
+    return query_all_pages(url, params, page_size=SNAPSHOT_PAGE_SIZE, timeout=60, progress="features")
+
+
+def sync_zoning_snapshot(path: str = ZONING_SNAPSHOT_FILE) -> ZoningSnapshot:
+    """
+    Download both zoning layers and replace the local snapshot
+
+    Args:
+        path: Snapshot file location
+
+    Returns:
+        The new ZoningSnapshot
+    """
+    layers = {}
+    for name, url in LAYER_URLS.items():
+        print(f"🔄 Downloading {name} layer...")
+        layers[name] = ZoningLayer.from_features(download_layer(url))
+
+    snapshot = ZoningSnapshot(layers, datetime.now())
+    snapshot.save(path)
+
+    counts = ", ".join(f"{len(layer.features):,} {name}" for name, layer in layers.items())
+    print(f"✓ Zoning snapshot saved to {path} ({counts})")
+    return snapshot
+
+
+def main():
+    """Run the sync job"""
+    if '--stats' in sys.argv:
+        snapshot = ZoningSnapshot.load()
+        if snapshot is None:
+            print(f"❌ No zoning snapshot at {ZONING_SNAPSHOT_FILE}")
+            return
+
+        for name, layer in snapshot.layers.items():
+            print(f"{name}: {len(layer.features):,} parcels")
+        print(f"Synced at: {snapshot.synced_at:%Y-%m-%d %H:%M} ({'fresh' if snapshot.is_fresh() else 'stale'})")
+        return
+
+    try:
+        sync_zoning_snapshot()
+    except requests.RequestException as e:
+        print(f"❌ Sync failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()